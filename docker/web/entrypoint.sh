@@ -22,7 +22,8 @@ else
     echo "=== Found ${PLAYER_COUNT} players — skipping sync ==="
 fi
 echo "=== Starting gunicorn ==="
-exec gunicorn config.wsgi:application \
+exec gunicorn config.asgi:application \
+    --worker-class uvicorn_worker.UvicornWorker \
     --bind 0.0.0.0:${PORT:-8000} \
     --workers 2 \
     --timeout 120 \
@@ -0,0 +1,172 @@
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from apps.deals.models import Deal
+from apps.marketplace.models import Offer
+from apps.notifications.models import Notification
+from .models import Club, UserCounters
+
+COUNTER_FIELDS = ["notifications_unread", "offers_unread", "deals_active"]
+CACHE_KEY = "accounts:counters:{}"
+
+def _forget(user_ids) -> None:
+    # Dropped now for this process's readers and again on commit, so a reader
+    # that cached the old row in between does not keep it for the full TTL.
+    keys = [CACHE_KEY.format(user_id) for user_id in user_ids]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys), robust=True)
+
+
+def _count_notifications(user_ids) -> dict:
+    return dict(
+        Notification.objects.filter(recipient_id__in=user_ids, is_read=False)
+        .order_by()
+        .values_list("recipient_id")
+        .annotate(total=Count("pk"))
+    )
+
+
+def _count_offers(user_ids) -> dict:
+    # Pending offers to the user's club whose latest event came from the
+    # other side (see Offer.last_actor_club).
+    return dict(
+        Offer.objects.filter(
+            to_club__user_id__in=user_ids, status__in=[Offer.Status.SENT, Offer.Status.COUNTERED]
+        )
+        .exclude(last_actor_club=F("to_club"))
+        .order_by()
+        .values_list("to_club__user_id")
+        .annotate(total=Count("pk"))
+    )
+
+
+def _count_deals(user_ids) -> dict:
+    counts = defaultdict(int)
+    active = Deal.objects.filter(status=Deal.Status.IN_PROGRESS).order_by()
+    for side in ("buyer_club", "seller_club"):
+        rows = (
+            active.filter(**{f"{side}__user_id__in": user_ids})
+            .values_list(f"{side}__user_id")
+            .annotate(total=Count("pk"))
+        )
+        for user_id, total in rows:
+            counts[user_id] += total
+    return counts
+
+
+COUNTERS = {
+    "notifications_unread": _count_notifications,
+    "offers_unread": _count_offers,
+    "deals_active": _count_deals,
+}
+
+
+@transaction.atomic
+def refresh_counters(user_ids, fields=COUNTER_FIELDS) -> dict:
+    # Recounts ``fields`` for these users. Rows are locked (in user order)
+    # before counting: a concurrent writer has either committed and is
+    # counted, or waits for us and recounts after.
+    user_ids = sorted({user_id for user_id in user_ids if user_id})
+    if not user_ids:
+        return {}
+    UserCounters.objects.bulk_create(
+        [UserCounters(user_id=user_id) for user_id in user_ids], ignore_conflicts=True
+    )
+    rows = list(
+        UserCounters.objects.select_for_update().filter(user_id__in=user_ids).order_by("user_id")
+    )
+    now = timezone.now()
+    for field in fields:
+        counts = COUNTERS[field](user_ids)
+        for row in rows:
+            setattr(row, field, counts.get(row.user_id, 0))
+    for row in rows:
+        row.updated_at = now
+    UserCounters.objects.bulk_update(rows, [*fields, "updated_at"])
+    _forget(user_ids)
+    return {row.user_id: {field: getattr(row, field) for field in COUNTER_FIELDS} for row in rows}
+
+
+def refresh_user_counters(user_ids, fields) -> None:
+    # Services never write counters themselves: the users are recounted once
+    # the current transaction commits, each refresh in its own short
+    # transaction, so counter rows are never locked alongside the service's
+    # locks. Recounting (not applying deltas) keeps a refresh that races a
+    # reconcile or a first read idempotent. Nothing happens on rollback, and
+    # a failed refresh is logged rather than failing the committed request.
+    user_ids = {pk for pk in user_ids if pk}
+    if user_ids:
+        transaction.on_commit(lambda: refresh_counters(user_ids, fields), robust=True)
+
+
+def refresh_club_counters(club_ids, fields) -> None:
+    club_ids = {pk for pk in club_ids if pk}
+    if club_ids:
+        transaction.on_commit(lambda: _refresh_clubs(club_ids, fields), robust=True)
+
+
+def _refresh_clubs(club_ids, fields) -> None:
+    user_ids = Club.objects.filter(pk__in=club_ids).values_list("user_id", flat=True)
+    refresh_counters(list(user_ids), fields)
+
+
+def notifications_changed(user_ids) -> None:
+    refresh_user_counters(user_ids, ["notifications_unread"])
+
+
+def count_new_notifications(notifications) -> None:
+    notifications_changed(notification.recipient_id for notification in notifications)
+
+
+def get_counters(user_id) -> dict:
+    # One cache hit, or one row, per request. A missing row is counted from
+    # scratch, which also backfills users from before the table existed.
+    key = CACHE_KEY.format(user_id)
+    counters = cache.get(key)
+    if counters is None:
+        counters = UserCounters.objects.filter(user_id=user_id).values(*COUNTER_FIELDS).first()
+        if counters is None:
+            counters = refresh_counters([user_id])[user_id]
+        cache.set(key, counters, settings.TRANSFERX_USER_COUNTERS_CACHE_SECONDS)
+    return counters
+
+
+def request_counters(request) -> dict | None:
+    # Shared by the context processors, so a render reads the counters once.
+    user = getattr(request, "user", None)
+    if not user or not user.is_authenticated:
+        return None
+    if not hasattr(request, "_user_counters"):
+        request._user_counters = get_counters(user.pk)
+    return request._user_counters
+
+
+def reconcile_counters(batch_size: int = 500) -> tuple[int, int]:
+    # Recounts every user in batches; returns (users checked, rows fixed).
+    checked = fixed = 0
+    last_id = 0
+    while True:
+        user_ids = list(
+            get_user_model()
+            .objects.filter(pk__gt=last_id)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not user_ids:
+            return checked, fixed
+        before = {
+            row["user_id"]: {field: row[field] for field in COUNTER_FIELDS}
+            for row in UserCounters.objects.filter(user_id__in=user_ids).values(
+                "user_id", *COUNTER_FIELDS
+            )
+        }
+        after = refresh_counters(user_ids)
+        fixed += sum(1 for user_id, counts in after.items() if before.get(user_id) != counts)
+        checked += len(user_ids)
+        last_id = user_ids[-1]
@@ -1,5 +1,10 @@
 from decimal import Decimal
 
+from django.db import connection
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
 from .models import ClubFinance
 
 
@@ -43,3 +48,78 @@ def commit(finance: ClubFinance, transfer_amount: Decimal, wage_amount: Decimal)
             "updated_at",
         ]
     )
+
+
+def reserve_if_available(club_id, transfer_delta: Decimal, wage_delta: Decimal) -> bool:
+    # One conditional UPDATE instead of lock, check and write: it applies only
+    # while the club can still afford both deltas. False if it could not (or
+    # the club has no finance row, i.e. no budget).
+    return bool(
+        ClubFinance.objects.filter(
+            club_id=club_id,
+            transfer_budget_total__gte=F("transfer_reserved")
+            + F("transfer_committed")
+            + transfer_delta,
+            wage_budget_total_weekly__gte=F("wage_reserved_weekly")
+            + F("wage_committed_weekly")
+            + wage_delta,
+        ).update(
+            transfer_reserved=F("transfer_reserved") + transfer_delta,
+            wage_reserved_weekly=F("wage_reserved_weekly") + wage_delta,
+            updated_at=timezone.now(),
+        )
+    )
+
+
+def release_unlocked(club_id, transfer_delta: Decimal, wage_delta: Decimal) -> None:
+    # release() as a single UPDATE, clamped at zero, without reading the row.
+    zero = Value(Decimal("0"))
+    ClubFinance.objects.filter(club_id=club_id).update(
+        transfer_reserved=Greatest(F("transfer_reserved") - transfer_delta, zero),
+        wage_reserved_weekly=Greatest(F("wage_reserved_weekly") - wage_delta, zero),
+        updated_at=timezone.now(),
+    )
+
+
+def lock_finances(club_ids) -> dict:
+    # Always lock in club order: two settlements touching the same clubs then
+    # queue behind each other instead of deadlocking.
+    return {
+        finance.club_id: finance
+        for finance in ClubFinance.objects.select_for_update()
+        .filter(club_id__in=sorted({club_id for club_id in club_ids if club_id}))
+        .order_by("club_id")
+    }
+
+
+def release_many(releases) -> int:
+    # ``releases`` maps club id -> (transfer, wage). Applies every release in
+    # one UPDATE ... FROM (VALUES ...), clamped at zero like release().
+    releases = {club_id: amounts for club_id, amounts in releases.items() if club_id}
+    if not releases:
+        return 0
+    locked = lock_finances(releases)
+    if connection.vendor != "postgresql":
+        for club_id, finance in locked.items():
+            release(finance, *releases[club_id])
+        return len(locked)
+
+    club_ids = sorted(locked)
+    table = connection.ops.quote_name(ClubFinance._meta.db_table)
+    values = ", ".join(["(%s, %s::numeric, %s::numeric)"] * len(club_ids))
+    params = [timezone.now()]
+    for club_id in club_ids:
+        params.extend([club_id, *releases[club_id]])
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {table} AS finance
+            SET transfer_reserved = GREATEST(finance.transfer_reserved - delta.transfer, 0),
+                wage_reserved_weekly = GREATEST(finance.wage_reserved_weekly - delta.wage, 0),
+                updated_at = %s
+            FROM (VALUES {values}) AS delta(club_id, transfer, wage)
+            WHERE finance.club_id = delta.club_id
+            """,
+            params,
+        )
+        return cursor.rowcount
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.counters import reconcile_counters
+
+
+class Command(BaseCommand):
+    help = "Recount every user's unread / active counters and fix any that drifted"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+        checked, fixed = reconcile_counters(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Checked users={checked} fixed={fixed}"))
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:17
+
+import unicodedata
+
+from django.db import migrations, models
+
+
+def _normalize(value):
+    decomposed = unicodedata.normalize("NFKD", value or "")
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def backfill_search_name(apps, schema_editor):
+    Model = apps.get_model("accounts", "Club")
+    batch = []
+    for obj in Model.objects.only("id", "name").iterator(chunk_size=1000):
+        obj.search_name = _normalize(obj.name)
+        batch.append(obj)
+        if len(batch) >= 1000:
+            Model.objects.bulk_update(batch, ["search_name"])
+            batch = []
+    if batch:
+        Model.objects.bulk_update(batch, ["search_name"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_club_squad_target'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='club',
+            name='search_name',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.RunPython(backfill_search_name, migrations.RunPython.noop),
+    ]
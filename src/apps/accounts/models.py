@@ -7,6 +7,7 @@ class Club(models.Model):
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="club"
     )
     name = models.CharField(max_length=200)
+    search_name = models.CharField(max_length=200, blank=True, default="", editable=False)
     country = models.CharField(max_length=100, blank=True, default="")
     city = models.CharField(max_length=100, blank=True, default="")
     league_name = models.CharField(max_length=200, blank=True, default="")
@@ -56,3 +57,21 @@ class ClubFinance(models.Model):
 
     def __str__(self) -> str:
         return f"{self.club.name} finance"
+
+
+class UserCounters(models.Model):
+    # Sidebar badge counts, kept current by apps.accounts.counters in the
+    # transactions that change them; reconcile_user_counters repairs drift.
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="counters",
+    )
+    notifications_unread = models.PositiveIntegerField(default=0)
+    offers_unread = models.PositiveIntegerField(default=0)
+    deals_active = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"Counters for user {self.user_id}"
@@ -1,10 +1,17 @@
+from django.conf import settings
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from .models import Club, ClubFinance
+from .models import Club, ClubFinance, UserCounters
 
 
 @receiver(post_save, sender=Club)
 def create_finance_for_club(sender, instance, created, **kwargs):
     if created:
         ClubFinance.objects.create(club=instance)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def create_counters_for_user(sender, instance, created, **kwargs):
+    if created:
+        UserCounters.objects.create(user=instance)
@@ -1,13 +1,15 @@
 from django.contrib.auth.decorators import login_required
 from datetime import timedelta
 
-from django.db.models import F, Max, OuterRef, Q, Subquery
+from asgiref.sync import sync_to_async
+from django.db.models import F, Q
 from django.shortcuts import render
 from django.utils import timezone
 
+from apps.auctions.live import auction_topic, release_connection, sse_response, user_topic
 from apps.auctions.models import Auction, Bid
 from apps.auctions.services import get_best_bid_amount
-from apps.marketplace.models import Listing, Offer, OfferEvent
+from apps.marketplace.models import Listing, Offer
 from apps.notifications.models import Notification
 from apps.players.models import Player
 from apps.scouting.models import PlayerInterest, ShortlistItem
@@ -34,6 +36,22 @@ def dashboard_auctions_partial(request):
     )
 
 
+def _dashboard_topics(user):
+    # The user's own topic plus every auction the panel currently shows; a
+    # message on the user topic (a new bid, an accepted deal) re-runs this.
+    club = getattr(user, "club", None)
+    rows = _auction_rows(user, club, timezone.now())
+    release_connection()
+    return [user_topic(user.id), *(auction_topic(row["auction"].id) for row in rows)]
+
+
+@login_required
+async def dashboard_stream(request):
+    user = await request.auser()
+    topics = await sync_to_async(_dashboard_topics)(user)
+    return sse_response(request, topics, refresh_topics=lambda: _dashboard_topics(user))
+
+
 def _dashboard_context(user, club, now):
     squad_count = 0
     squad_target = None
@@ -78,17 +96,13 @@ def _dashboard_context(user, club, now):
 
 
 def _offers_requiring_action(club):
-    last_event = OfferEvent.objects.filter(offer_id=OuterRef("pk")).order_by(
-        "-created_at"
-    )
     offers = (
         Offer.objects.select_related("player", "from_club", "to_club")
         .filter(
             Q(from_club=club) | Q(to_club=club),
             status__in=[Offer.Status.SENT, Offer.Status.COUNTERED],
         )
-        .annotate(last_actor_club_id=Subquery(last_event.values("actor_club_id")[:1]))
-        .filter(~Q(last_actor_club_id=club.id))
+        .filter(~Q(last_actor_club=club))
         .order_by("expires_at", "-last_action_at")
     )
     rows = []
@@ -166,7 +180,6 @@ def _auction_rows(user, club, now):
             )
             .exclude(id__in=bid_auction_ids)
             .exclude(seller=user)
-            .annotate(top_bid_amount=Max("bids__amount"))
             .order_by("deadline")[:5]
         )
         for auction in watched:
@@ -176,7 +189,7 @@ def _auction_rows(user, club, now):
                     "player": auction.player,
                     "selling_club": auction.player.current_club,
                     "listed_price": auction.reserve_price,
-                    "top_bid": auction.top_bid_amount,
+                    "top_bid": auction.best_bid_amount,
                     "my_bid": None,
                     "status": "watching",
                     "deadline_iso": auction.deadline.isoformat(),
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Auction, AuctionEvent, Bid
+from .models import Auction, AuctionEvent, AuctionEventSummary, Bid
 
 
 @admin.register(Auction)
@@ -19,5 +19,15 @@ class BidAdmin(admin.ModelAdmin):
 
 @admin.register(AuctionEvent)
 class AuctionEventAdmin(admin.ModelAdmin):
-    list_display = ("auction", "event_type", "actor", "created_at")
+    list_display = ("auction", "event_type", "actor", "amount", "created_at")
     list_filter = ("event_type", "created_at")
+
+    # Append-only: rows are only ever removed by compact_auction_events.
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(AuctionEventSummary)
+class AuctionEventSummaryAdmin(admin.ModelAdmin):
+    list_display = ("auction", "event_type", "event_count", "first_at", "last_at", "max_amount")
+    list_filter = ("event_type",)
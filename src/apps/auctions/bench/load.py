@@ -0,0 +1,229 @@
+import math
+import multiprocessing
+import random
+import threading
+import time
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.db import DatabaseError, connection, connections
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from ..models import Auction
+from ..services import place_bid
+
+DEADLOCK = "40P01"
+SERIALIZATION_FAILURE = "40001"
+
+LOCK_WAIT_SQL = """
+    SELECT count(*),
+           coalesce(max(extract(epoch FROM now() - state_change)), 0)
+    FROM pg_stat_activity
+    WHERE datname = current_database() AND wait_event_type = 'Lock'
+"""
+DB_COUNTERS_SQL = """
+    SELECT deadlocks, xact_rollback FROM pg_stat_database WHERE datname = current_database()
+"""
+
+
+def percentile(samples: list[float], pct: float) -> float | None:
+    # Nearest-rank, on already sorted samples.
+    if not samples:
+        return None
+    return samples[max(0, math.ceil(pct / 100 * len(samples)) - 1)]
+
+
+def _sqlstate(exc) -> str | None:
+    cause = exc.__cause__
+    return getattr(cause, "sqlstate", None) or getattr(cause, "pgcode", None)
+
+
+def _bid_loop(worker: int, auction_ids, bidder_ids, deadline: float, think_ms: float, seed: int):
+    # One bidder session: read the ladder without locks (as the page does),
+    # outbid by a random step, think, repeat. Races that lose on validation
+    # are counted as rejected, which is what a real bidder sees.
+    rng = random.Random(seed * 1000 + worker)
+    bidders = get_user_model().objects.in_bulk(bidder_ids)
+    auctions = {auction_id: Auction(pk=auction_id) for auction_id in auction_ids}
+    result = {
+        "latencies": [],
+        "ok": 0,
+        "rejected": 0,
+        "deadlocks": 0,
+        "serialization": 0,
+        "errors": 0,
+    }
+    try:
+        while time.monotonic() < deadline:
+            auction_id = rng.choice(auction_ids)
+            best, step = Auction.objects.values_list("best_bid_amount", "min_increment").get(
+                pk=auction_id
+            )
+            step = step or Decimal("1.00")
+            amount = (best or Decimal("0")) + step * rng.randint(1, 3)
+            started = time.perf_counter()
+            try:
+                place_bid(auctions[auction_id], bidders[rng.choice(bidder_ids)], amount)
+                result["ok"] += 1
+            except (ValidationError, PermissionDenied):
+                result["rejected"] += 1
+            except DatabaseError as exc:
+                code = _sqlstate(exc)
+                if code == DEADLOCK:
+                    result["deadlocks"] += 1
+                elif code == SERIALIZATION_FAILURE:
+                    result["serialization"] += 1
+                else:
+                    result["errors"] += 1
+            result["latencies"].append((time.perf_counter() - started) * 1000)
+            if think_ms:
+                time.sleep(rng.uniform(0, 2 * think_ms) / 1000)
+    finally:
+        connection.close()
+    return result
+
+
+class LockWaitSampler(threading.Thread):
+    # Polls pg_stat_activity on its own connection. Waiting backends times
+    # the interval approximates total time spent blocked on row locks.
+    def __init__(self, interval: float = 0.05):
+        super().__init__(name="lock-wait-sampler", daemon=True)
+        self.interval = interval
+        self.stopping = threading.Event()
+        self.samples = 0
+        self.wait_seconds = 0.0
+        self.max_waiting = 0
+        self.longest_wait = 0.0
+
+    def run(self):
+        try:
+            with connection.cursor() as cursor:
+                while not self.stopping.is_set():
+                    cursor.execute(LOCK_WAIT_SQL)
+                    waiting, longest = cursor.fetchone()
+                    self.samples += 1
+                    self.wait_seconds += waiting * self.interval
+                    self.max_waiting = max(self.max_waiting, waiting)
+                    self.longest_wait = max(self.longest_wait, float(longest))
+                    self.stopping.wait(self.interval)
+        finally:
+            connection.close()
+
+    def stop(self):
+        self.stopping.set()
+        self.join()
+
+
+def _db_counters() -> tuple[int, int]:
+    with connection.cursor() as cursor:
+        cursor.execute(DB_COUNTERS_SQL)
+        return cursor.fetchone()
+
+
+def run_load(
+    *,
+    auction_ids,
+    bidder_ids,
+    workers: int = 8,
+    duration: float = 10.0,
+    think_ms: float = 0.0,
+    processes: bool = False,
+    seed: int = 7,
+    locking: str | None = None,
+) -> dict:
+    if connection.vendor != "postgresql":
+        raise RuntimeError("The bid load harness needs PostgreSQL")
+    if locking:
+        # Forked workers inherit the override along with the rest of settings.
+        with override_settings(TRANSFERX_BID_LOCKING=locking):
+            return run_load(
+                auction_ids=auction_ids,
+                bidder_ids=bidder_ids,
+                workers=workers,
+                duration=duration,
+                think_ms=think_ms,
+                processes=processes,
+                seed=seed,
+            )
+    deadlocks_before, rollbacks_before = _db_counters()
+    pool = None
+    if processes:
+        # Fork before any other thread opens a connection, and with none open
+        # here, so children never share the parent's sockets.
+        connections.close_all()
+        pool = multiprocessing.get_context("fork").Pool(workers)
+    sampler = LockWaitSampler()
+    sampler.start()
+    started_at = timezone.now()
+    started = time.perf_counter()
+    deadline = time.monotonic() + duration
+    jobs = [
+        (worker, auction_ids, bidder_ids, deadline, think_ms, seed) for worker in range(workers)
+    ]
+
+    if pool:
+        with pool:
+            results = pool.starmap(_bid_loop, jobs)
+    else:
+        results = [None] * workers
+
+        def run(index, job):
+            results[index] = _bid_loop(*job)
+
+        threads = [
+            threading.Thread(target=run, args=(index, job), name=f"bidder-{index}")
+            for index, job in enumerate(jobs)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    elapsed = time.perf_counter() - started
+    sampler.stop()
+    deadlocks_after, rollbacks_after = _db_counters()
+
+    latencies = sorted(latency for result in results for latency in result["latencies"])
+    totals = {
+        key: sum(result[key] for result in results)
+        for key in ("ok", "rejected", "deadlocks", "serialization", "errors")
+    }
+    attempts = len(latencies)
+    return {
+        "meta": {
+            "started_at": started_at.isoformat(),
+            "mode": "processes" if processes else "threads",
+            "workers": workers,
+            "duration_s": round(elapsed, 3),
+            "think_ms": think_ms,
+            "auctions": len(auction_ids),
+            "bidders": len(bidder_ids),
+            "locking": settings.TRANSFERX_BID_LOCKING,
+        },
+        "attempts": attempts,
+        **totals,
+        "throughput_per_s": round(attempts / elapsed, 1) if elapsed else 0.0,
+        "accepted_per_s": round(totals["ok"] / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            name: round(value, 2) if value is not None else None
+            for name, value in (
+                ("p50", percentile(latencies, 50)),
+                ("p95", percentile(latencies, 95)),
+                ("p99", percentile(latencies, 99)),
+                ("max", latencies[-1] if latencies else None),
+            )
+        },
+        "lock_wait": {
+            "sampled_seconds": round(sampler.wait_seconds, 3),
+            "max_waiting_backends": sampler.max_waiting,
+            "longest_wait_s": round(sampler.longest_wait, 3),
+            "samples": sampler.samples,
+        },
+        "server": {
+            "deadlocks": deadlocks_after - deadlocks_before,
+            "rollbacks": rollbacks_after - rollbacks_before,
+        },
+    }
@@ -0,0 +1,97 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from apps.accounts.models import Club, ClubFinance
+from apps.marketplace.search import normalize_search_text
+from apps.players.models import Player
+from ..models import Auction
+
+LOAD_PREFIX = "loadbid"
+BUDGET = Decimal("9999999999.00")
+
+
+def load_data_exists() -> bool:
+    return get_user_model().objects.filter(username__startswith=f"{LOAD_PREFIX}_").exists()
+
+
+def clear_load_data() -> None:
+    # Cascades from the users remove clubs, finances, players, auctions,
+    # bids, events and notifications.
+    with transaction.atomic():
+        Player.objects.filter(name__startswith=f"{LOAD_PREFIX} ").delete()
+        get_user_model().objects.filter(username__startswith=f"{LOAD_PREFIX}_").delete()
+
+
+def seed_contest(
+    *, bidders: int = 50, auctions: int = 1, deadline_minutes: float = 30, min_increment="1.00"
+) -> dict:
+    # One seller, ``bidders`` clubs with effectively unlimited budgets and
+    # ``auctions`` open auctions ending in ``deadline_minutes``. bulk_create
+    # skips the Club signal, so finances are created explicitly.
+    User = get_user_model()
+    with transaction.atomic():
+        User.objects.bulk_create(
+            User(username=f"{LOAD_PREFIX}_{index}", password="!") for index in range(bidders + 1)
+        )
+        users = list(User.objects.filter(username__startswith=f"{LOAD_PREFIX}_").order_by("pk"))
+        Club.objects.bulk_create(
+            Club(user=user, name=f"Load Club {index}", search_name=f"load club {index}")
+            for index, user in enumerate(users)
+        )
+        clubs = list(Club.objects.filter(user__in=users).order_by("pk"))
+        ClubFinance.objects.bulk_create(
+            ClubFinance(club=club, transfer_budget_total=BUDGET, wage_budget_total_weekly=BUDGET)
+            for club in clubs
+        )
+
+        seller, seller_club = users[0], clubs[0]
+        names = [f"{LOAD_PREFIX} Player {index}" for index in range(auctions)]
+        Player.objects.bulk_create(
+            Player(
+                name=name,
+                search_name=normalize_search_text(name),
+                age=24,
+                current_club=seller_club,
+                created_by=seller,
+            )
+            for name in names
+        )
+        deadline = timezone.now() + timedelta(minutes=deadline_minutes)
+        Auction.objects.bulk_create(
+            Auction(
+                player=player,
+                seller=seller,
+                deadline=deadline,
+                min_increment=Decimal(min_increment),
+            )
+            for player in Player.objects.filter(name__in=names).order_by("pk")
+        )
+    return {"bidders": bidders, "auctions": auctions}
+
+
+def load_targets() -> tuple[list[int], list[int]]:
+    # (auction ids, bidder user ids) for a seeded contest.
+    seller_id = (
+        get_user_model()
+        .objects.filter(username__startswith=f"{LOAD_PREFIX}_")
+        .order_by("pk")
+        .values_list("pk", flat=True)
+        .first()
+    )
+    auction_ids = list(
+        Auction.objects.filter(seller_id=seller_id, status=Auction.Status.OPEN)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    bidder_ids = list(
+        get_user_model()
+        .objects.filter(username__startswith=f"{LOAD_PREFIX}_")
+        .exclude(pk=seller_id)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    return auction_ids, bidder_ids
@@ -0,0 +1,122 @@
+import threading
+from contextlib import ContextDecorator
+
+from django.db import transaction
+from django.db.models import Count, Max, Min
+
+from .models import Auction, AuctionEvent, AuctionEventSummary
+
+# Bid churn is what makes long auctions' logs grow; milestones (accepted,
+# closed, extended) are few and always kept.
+COMPACTABLE_EVENTS = [AuctionEvent.EventType.BID_PLACED, AuctionEvent.EventType.BID_REPLACED]
+
+_pending = threading.local()
+
+
+def record_event(auction, event_type, actor=None, amount=None, **payload) -> AuctionEvent:
+    # Money goes in the ``amount`` column; ``payload`` only holds what has no
+    # column. Inside an event_batch the row is written with the batch.
+    event = AuctionEvent(
+        auction=auction, event_type=event_type, actor=actor, amount=amount, payload=payload
+    )
+    batch = getattr(_pending, "events", None)
+    if batch is None:
+        event.save()
+    else:
+        batch.append(event)
+    return event
+
+
+class event_batch(ContextDecorator):
+    # Collects record_event() calls and writes them with one INSERT when the
+    # outermost batch exits cleanly. Apply it inside transaction.atomic so
+    # the insert lands as the service's transaction commits; an exception
+    # discards the batch along with the rollback. State is kept thread-local
+    # because one decorator instance is shared by every call.
+    def __enter__(self):
+        _pending.depth = getattr(_pending, "depth", 0) + 1
+        if _pending.depth == 1:
+            _pending.events = []
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _pending.depth -= 1
+        if _pending.depth:
+            return False
+        events = _pending.events
+        del _pending.events
+        if exc_type is None and events:
+            AuctionEvent.objects.bulk_create(events)
+        return False
+
+
+def compact_events(
+    before, batch_size: int = 200, after_auction_id: int = 0
+) -> tuple[int, int | None]:
+    # Folds bid events older than ``before`` into one AuctionEventSummary row
+    # per auction and type, for up to ``batch_size`` auctions past
+    # ``after_auction_id``. Auctions a bidder holds locked are skipped and
+    # left for a later run. Returns the number of events removed and the
+    # cursor for the next batch (None once no candidates are left).
+    candidates = list(
+        AuctionEvent.objects.filter(
+            auction_id__gt=after_auction_id,
+            created_at__lt=before,
+            event_type__in=COMPACTABLE_EVENTS,
+        )
+        .order_by("auction_id")
+        .values_list("auction_id", flat=True)
+        .distinct()[:batch_size]
+    )
+    if not candidates:
+        return 0, None
+    with transaction.atomic():
+        auction_ids = list(
+            Auction.objects.select_for_update(skip_locked=True)
+            .filter(pk__in=candidates)
+            .values_list("pk", flat=True)
+        )
+        old = AuctionEvent.objects.filter(
+            auction_id__in=auction_ids, created_at__lt=before, event_type__in=COMPACTABLE_EVENTS
+        )
+        totals = (
+            old.order_by()
+            .values("auction_id", "event_type")
+            .annotate(
+                count=Count("id"),
+                first_at=Min("created_at"),
+                last_at=Max("created_at"),
+                high=Max("amount"),
+            )
+        )
+        summaries = {
+            (summary.auction_id, summary.event_type): summary
+            for summary in AuctionEventSummary.objects.filter(auction_id__in=auction_ids)
+        }
+        created, updated = [], []
+        for row in totals:
+            summary = summaries.get((row["auction_id"], row["event_type"]))
+            if summary is None:
+                created.append(
+                    AuctionEventSummary(
+                        auction_id=row["auction_id"],
+                        event_type=row["event_type"],
+                        event_count=row["count"],
+                        first_at=row["first_at"],
+                        last_at=row["last_at"],
+                        max_amount=row["high"],
+                    )
+                )
+                continue
+            summary.event_count += row["count"]
+            summary.first_at = min(summary.first_at, row["first_at"])
+            summary.last_at = max(summary.last_at, row["last_at"])
+            if row["high"] is not None:
+                summary.max_amount = max(summary.max_amount or row["high"], row["high"])
+            updated.append(summary)
+        AuctionEventSummary.objects.bulk_create(created)
+        AuctionEventSummary.objects.bulk_update(
+            updated, ["event_count", "first_at", "last_at", "max_amount"]
+        )
+        deleted, _ = old.delete()
+    return deleted, candidates[-1]
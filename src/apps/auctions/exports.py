@@ -0,0 +1,149 @@
+import csv
+import gzip
+import io
+from datetime import UTC, datetime
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+
+from .models import Bid
+
+CHUNK_SIZE = 2000
+
+AUCTION_BID_COLUMNS = [
+    ("bid_id", "id"),
+    ("created_at", "created_at"),
+    ("buyer_club_name", "buyer__club__name"),
+    ("amount", "amount"),
+    ("wage_offer_weekly", "wage_offer_weekly"),
+    ("status", "status"),
+    ("notes", "notes"),
+]
+
+BID_HISTORY_COLUMNS = [
+    ("auction_id", "auction_id"),
+    ("player_id", "auction__player_id"),
+    ("player_name", "auction__player__name"),
+    *AUCTION_BID_COLUMNS,
+]
+
+
+def season_bounds(season: int) -> tuple[datetime, datetime]:
+    # Seasons run July to June, named by the year they start (2025 = 2025/26),
+    # matching the --season flag of the stats sync commands.
+    return datetime(season, 7, 1, tzinfo=UTC), datetime(season + 1, 7, 1, tzinfo=UTC)
+
+
+def bid_rows(bids, columns, chunk_size: int = CHUNK_SIZE):
+    # Plain tuples from a server-side cursor: no model instances and no
+    # per-row buyer/club lookups, so memory stays flat however many bids.
+    return bids.values_list(*(field for _, field in columns)).iterator(chunk_size=chunk_size)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def csv_blocks(columns, rows, block_rows: int = 500):
+    # Encoded CSV in blocks of ``block_rows`` lines rather than one write per
+    # row, so the response and gzip writer see a few large chunks.
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([name for name, _ in columns])
+    pending = 1
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+        pending += 1
+        if pending >= block_rows:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if pending:
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def _iterate_in_thread(iterator):
+    # ASGI buffers sync iterators whole; pull each block through the request's
+    # database thread instead so the cursor streams.
+    while True:
+        block = await sync_to_async(next)(iterator, None)
+        if block is None:
+            return
+        yield block
+
+
+def streaming_csv_response(request, filename: str, columns, rows) -> StreamingHttpResponse:
+    content = csv_blocks(columns, rows)
+    if isinstance(request, ASGIRequest):
+        content = _iterate_in_thread(content)
+    response = StreamingHttpResponse(content, content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def season_bids(season: int):
+    start, end = season_bounds(season)
+    return Bid.objects.filter(created_at__gte=start, created_at__lt=end).order_by(
+        "auction_id", "created_at", "id"
+    )
+
+
+def write_csv_gz(path, rows, columns=BID_HISTORY_COLUMNS) -> int:
+    count = 0
+
+    def counted():
+        nonlocal count
+        for row in rows:
+            count += 1
+            yield row
+
+    with gzip.open(path, "wb") as handle:
+        for block in csv_blocks(columns, counted()):
+            handle.write(block)
+    return count
+
+
+def write_parquet(path, rows, columns=BID_HISTORY_COLUMNS, batch_rows: int = 10000) -> int:
+    # Optional: needs pyarrow. Writes one row group per batch, so memory is
+    # bounded by ``batch_rows`` rather than the season's size.
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    money = pa.decimal128(12, 2)
+    types = {
+        "auction_id": pa.int64(),
+        "player_id": pa.int64(),
+        "player_name": pa.string(),
+        "bid_id": pa.int64(),
+        "created_at": pa.timestamp("us", tz="UTC"),
+        "buyer_club_name": pa.string(),
+        "amount": money,
+        "wage_offer_weekly": money,
+        "status": pa.string(),
+        "notes": pa.string(),
+    }
+    schema = pa.schema([(name, types[name]) for name, _ in columns])
+    count = 0
+    with pq.ParquetWriter(path, schema, compression="snappy") as writer:
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_rows:
+                writer.write_table(pa.Table.from_pylist(_records(schema, batch), schema=schema))
+                count += len(batch)
+                batch = []
+        if batch or not count:
+            writer.write_table(pa.Table.from_pylist(_records(schema, batch), schema=schema))
+            count += len(batch)
+    return count
+
+
+def _records(schema, rows):
+    names = schema.names
+    return [dict(zip(names, row, strict=True)) for row in rows]
@@ -31,6 +31,7 @@ class AuctionForm(forms.ModelForm):
 
 class BidForm(forms.ModelForm):
     wage_offer_weekly = forms.DecimalField(min_value=0, required=True)
+    proxy = forms.BooleanField(required=False, label="Treat amount as my maximum")
 
     class Meta:
         model = Bid
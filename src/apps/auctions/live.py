@@ -0,0 +1,198 @@
+import asyncio
+import contextlib
+import json
+import logging
+import threading
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, connections, transaction
+from django.http import HttpResponse, StreamingHttpResponse
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "transferx_live"
+QUEUE_SIZE = 100
+
+
+def _use_postgres() -> bool:
+    return settings.TRANSFERX_LIVE_BACKEND == "postgres"
+
+
+def auction_topic(auction_id) -> str:
+    return f"auction:{auction_id}"
+
+
+def user_topic(user_id) -> str:
+    return f"user:{user_id}"
+
+
+def publish(messages) -> None:
+    # ``messages`` is an iterable of (topics, data). With Postgres every
+    # payload goes out in one pg_notify statement inside the caller's
+    # transaction, so watchers hear about it on commit and never on rollback.
+    payloads = [
+        json.dumps({**data, "topics": sorted(topics)}, cls=DjangoJSONEncoder)
+        for topics, data in messages
+    ]
+    if not payloads:
+        return
+    if _use_postgres():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload",
+                [CHANNEL, payloads],
+            )
+        return
+    transaction.on_commit(lambda: [broadcaster.dispatch(payload) for payload in payloads])
+
+
+class Subscription:
+    def __init__(self, broadcaster, topics):
+        self.broadcaster = broadcaster
+        self.topics = set(topics)
+        self._loop = None
+        self._queue = None
+
+    async def __aenter__(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.broadcaster._add(self)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.broadcaster._remove(self)
+
+    def update(self, topics) -> None:
+        self.broadcaster._remove(self)
+        self.topics = set(topics)
+        self.broadcaster._add(self)
+
+    def put(self, message) -> None:
+        # Called from the listener thread or a committing request thread.
+        with contextlib.suppress(RuntimeError):
+            self._loop.call_soon_threadsafe(self._offer, message)
+
+    def _offer(self, message) -> None:
+        # A watcher that stops reading only loses updates; the next one it
+        # reads triggers a full refresh anyway.
+        with contextlib.suppress(asyncio.QueueFull):
+            self._queue.put_nowait(message)
+
+    async def get(self, timeout):
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+
+class Broadcaster:
+    # One per process. Watchers are asyncio queues keyed by topic, so an idle
+    # watcher costs a queue and nothing in the database; the Postgres backend
+    # feeds every watcher in the process from a single LISTEN connection.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+        self._listener = None
+        self._stopping = threading.Event()
+        self.listening = threading.Event()
+
+    def subscribe(self, topics) -> Subscription:
+        return Subscription(self, topics)
+
+    def dispatch(self, payload: str) -> None:
+        message = json.loads(payload)
+        with self._lock:
+            subscribers = set()
+            for topic in message["topics"]:
+                subscribers |= self._subscribers.get(topic, set())
+        for subscriber in subscribers:
+            subscriber.put(message)
+
+    def stop(self) -> None:
+        listener = self._listener
+        if listener is None:
+            return
+        self._stopping.set()
+        listener.join(timeout=5)
+        self._listener = None
+        self.listening.clear()
+
+    def _add(self, subscription) -> None:
+        with self._lock:
+            for topic in subscription.topics:
+                self._subscribers[topic].add(subscription)
+            if _use_postgres() and (self._listener is None or not self._listener.is_alive()):
+                self._stopping.clear()
+                self._listener = threading.Thread(
+                    target=self._listen, name="transferx-live", daemon=True
+                )
+                self._listener.start()
+
+    def _remove(self, subscription) -> None:
+        with self._lock:
+            for topic in subscription.topics:
+                subscribers = self._subscribers.get(topic)
+                if subscribers is None:
+                    continue
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[topic]
+
+    def _listen(self) -> None:
+        import psycopg
+
+        params = connections["default"].get_connection_params()
+        while not self._stopping.is_set():
+            try:
+                with psycopg.connect(**params, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {CHANNEL}")
+                    self.listening.set()
+                    while not self._stopping.is_set():
+                        for notify in conn.notifies(timeout=1.0):
+                            self.dispatch(notify.payload)
+            except Exception:
+                logger.exception("Live update listener failed; reconnecting")
+                self.listening.clear()
+                self._stopping.wait(1.0)
+        self.listening.clear()
+
+
+broadcaster = Broadcaster()
+
+
+def release_connection() -> None:
+    # Streams stay open for hours; don't pin a database connection to each
+    # one once its initial lookups are done.
+    if not connection.in_atomic_block:
+        connection.close()
+
+
+async def _event_stream(topics, refresh_topics=None):
+    heartbeat = settings.TRANSFERX_LIVE_HEARTBEAT_SECONDS
+    async with broadcaster.subscribe(topics) as subscription:
+        yield "retry: 5000\n\n"
+        while True:
+            message = await subscription.get(timeout=heartbeat)
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+            if refresh_topics and any(topic.startswith("user:") for topic in message["topics"]):
+                subscription.update(await sync_to_async(refresh_topics)())
+            yield f"data: {json.dumps(message)}\n\n"
+
+
+def sse_response(request, topics, refresh_topics=None):
+    # Only an ASGI server can hold thousands of idle streams. Under WSGI a
+    # 204 tells EventSource to stop reconnecting and the page keeps polling.
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(status=204)
+    response = StreamingHttpResponse(
+        _event_stream(topics, refresh_topics), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
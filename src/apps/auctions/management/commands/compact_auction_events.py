@@ -0,0 +1,37 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.auctions.events import compact_events
+
+
+class Command(BaseCommand):
+    help = "Fold old bid events into per-auction summary rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=settings.TRANSFERX_EVENT_COMPACT_AFTER_DAYS,
+            help="Compact bid events older than this (default TRANSFERX_EVENT_COMPACT_AFTER_DAYS)",
+        )
+        parser.add_argument("--batch-size", type=int, default=200, help="Auctions per transaction")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+        if options["older_than_days"] < 0:
+            raise CommandError("--older-than-days cannot be negative")
+        before = timezone.now() - timedelta(days=options["older_than_days"])
+        total = 0
+        cursor = 0
+        # Page on auction id rather than stopping at an empty pass: a batch
+        # whose auctions are all locked removes nothing but is not the end.
+        while cursor is not None:
+            removed, cursor = compact_events(
+                before, batch_size=options["batch_size"], after_auction_id=cursor
+            )
+            total += removed
+        self.stdout.write(self.style.SUCCESS(f"Compacted events={total}"))
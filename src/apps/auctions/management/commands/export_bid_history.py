@@ -0,0 +1,42 @@
+import importlib.util
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.auctions.exports import (
+    BID_HISTORY_COLUMNS,
+    CHUNK_SIZE,
+    bid_rows,
+    season_bids,
+    write_csv_gz,
+    write_parquet,
+)
+
+
+class Command(BaseCommand):
+    help = "Export every bid placed in a season (July-June) as gzipped CSV or Parquet"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--season", type=int, required=True, help="Start year, e.g. 2025 for 2025/26"
+        )
+        parser.add_argument("--output", help="Defaults to bids_<season>.csv.gz / .parquet")
+        parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        season = options["season"]
+        fmt = options["format"]
+        if fmt == "parquet" and importlib.util.find_spec("pyarrow") is None:
+            raise CommandError("Parquet export needs pyarrow (pip install pyarrow)")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1")
+
+        output = options["output"] or f"bids_{season}.{'parquet' if fmt == 'parquet' else 'csv.gz'}"
+        rows = bid_rows(season_bids(season), BID_HISTORY_COLUMNS, chunk_size=options["chunk_size"])
+        writer = write_parquet if fmt == "parquet" else write_csv_gz
+        count = writer(output, rows)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {count} bids for {season}/{(season + 1) % 100:02d} to {output}"
+            )
+        )
@@ -0,0 +1,125 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.auctions.bench.load import run_load
+from apps.auctions.bench.seed import clear_load_data, load_data_exists, load_targets, seed_contest
+
+
+class Command(BaseCommand):
+    help = "Seed a contested auction and hammer place_bid from many threads or processes"
+
+    def add_arguments(self, parser):
+        actions = parser.add_subparsers(dest="action", required=True)
+
+        seed = actions.add_parser("seed", help="Create load-test bidders and auctions")
+        seed.add_argument("--bidders", type=int, default=50)
+        seed.add_argument("--auctions", type=int, default=1)
+        seed.add_argument(
+            "--deadline-minutes",
+            type=float,
+            default=30,
+            help="Use a value inside TRANSFERX_SNIPING_WINDOW_MINUTES to exercise extensions",
+        )
+        seed.add_argument("--reset", action="store_true", help="Drop existing load-test rows first")
+
+        run = actions.add_parser("run", help="Fire bids at the seeded auctions and report")
+        run.add_argument("--workers", type=int, default=8)
+        run.add_argument(
+            "--processes", action="store_true", help="Fork processes instead of threads"
+        )
+        run.add_argument("--duration", type=float, default=10.0, help="Seconds")
+        run.add_argument("--think-ms", type=float, default=0.0, help="Mean pause between bids")
+        run.add_argument("--seed", type=int, default=7)
+        run.add_argument(
+            "--locking",
+            choices=["row", "advisory", "compare"],
+            help="Bid locking strategy (default: TRANSFERX_BID_LOCKING); "
+            "'compare' runs both back to back",
+        )
+        run.add_argument("--output", help="Also write the report as JSON")
+
+        actions.add_parser("clear", help="Delete every load-test row")
+
+    def handle(self, *args, **options):
+        getattr(self, f"_{options['action']}")(options)
+
+    def _seed(self, options):
+        if options["bidders"] < 1 or options["auctions"] < 1:
+            raise CommandError("--bidders and --auctions must be at least 1")
+        if load_data_exists():
+            if not options["reset"]:
+                raise CommandError("Load-test data already exists; pass --reset to rebuild it")
+            clear_load_data()
+        counts = seed_contest(
+            bidders=options["bidders"],
+            auctions=options["auctions"],
+            deadline_minutes=options["deadline_minutes"],
+        )
+        summary = ", ".join(f"{key}={value}" for key, value in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"Seeded load test: {summary}"))
+
+    def _run(self, options):
+        if options["workers"] < 1:
+            raise CommandError("--workers must be at least 1")
+        auction_ids, bidder_ids = load_targets()
+        if not auction_ids or not bidder_ids:
+            raise CommandError("No open load-test auctions; run 'loadtest_bids seed' first")
+        strategies = (
+            ["row", "advisory"] if options["locking"] == "compare" else [options["locking"]]
+        )
+        reports = {}
+        for strategy in strategies:
+            try:
+                report = run_load(
+                    auction_ids=auction_ids,
+                    bidder_ids=bidder_ids,
+                    workers=options["workers"],
+                    duration=options["duration"],
+                    think_ms=options["think_ms"],
+                    processes=options["processes"],
+                    seed=options["seed"],
+                    locking=strategy,
+                )
+            except RuntimeError as exc:
+                raise CommandError(str(exc)) from exc
+            reports[report["meta"]["locking"]] = report
+            self._report(report)
+        if options["output"]:
+            payload = reports if len(reports) > 1 else report
+            Path(options["output"]).write_text(json.dumps(payload, indent=2))
+        if len(reports) > 1:
+            row, advisory = reports["row"], reports["advisory"]
+            ratio = (
+                advisory["accepted_per_s"] / row["accepted_per_s"] if row["accepted_per_s"] else 0
+            )
+            self.stdout.write(
+                f"advisory/row accepted throughput={ratio:.2f}x "
+                f"p99 {row['latency_ms']['p99']}ms -> {advisory['latency_ms']['p99']}ms"
+            )
+
+    def _report(self, report):
+        latency = report["latency_ms"]
+        lock_wait = report["lock_wait"]
+        self.stdout.write(
+            f"attempts={report['attempts']} ok={report['ok']} rejected={report['rejected']} "
+            f"deadlocks={report['deadlocks']} serialization={report['serialization']} "
+            f"errors={report['errors']}"
+        )
+        self.stdout.write(
+            f"throughput={report['throughput_per_s']}/s accepted={report['accepted_per_s']}/s "
+            f"p50={latency['p50']}ms p95={latency['p95']}ms p99={latency['p99']}ms"
+        )
+        self.stdout.write(
+            f"lock_wait={lock_wait['sampled_seconds']}s max_waiting={lock_wait['max_waiting_backends']} "
+            f"longest={lock_wait['longest_wait_s']}s server_deadlocks={report['server']['deadlocks']}"
+        )
+        meta = report["meta"]
+        self.stdout.write(
+            self.style.SUCCESS(f"Load run finished ({meta['mode']}, {meta['locking']} locking)")
+        )
+
+    def _clear(self, options):
+        clear_load_data()
+        self.stdout.write(self.style.SUCCESS("Cleared load-test data"))
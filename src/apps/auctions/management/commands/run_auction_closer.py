@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from apps.auctions.services import close_expired_auctions
+
+
+class Command(BaseCommand):
+    help = "Close expired auctions in batches, polling until interrupted (or once with --once)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds between passes")
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--once", action="store_true", help="Drain expired auctions and exit")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+        total = 0
+        try:
+            while True:
+                closed = self._drain(options["batch_size"])
+                if closed:
+                    self.stdout.write(f"closed={closed}")
+                total += closed
+                if options["once"]:
+                    break
+                # Long-lived process: drop connections past CONN_MAX_AGE or broken.
+                close_old_connections()
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f"Closed auctions={total}"))
+
+    def _drain(self, batch_size):
+        closed = 0
+        while True:
+            batch = close_expired_auctions(batch_size=batch_size)
+            closed += batch
+            if batch < batch_size:
+                return closed
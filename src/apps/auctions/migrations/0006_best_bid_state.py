@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, Max, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_bid_state(apps, schema_editor):
+    Auction = apps.get_model("auctions", "Auction")
+    Bid = apps.get_model("auctions", "Bid")
+    best = Bid.objects.filter(auction=OuterRef("pk"), status="ACTIVE").order_by(
+        "-amount", "created_at"
+    )
+    Auction.objects.update(
+        best_bid_amount=Subquery(best.values("amount")[:1]),
+        best_bid_id=Subquery(best.values("pk")[:1]),
+        active_bid_count=Coalesce(
+            Subquery(
+                Bid.objects.filter(auction=OuterRef("pk"), status="ACTIVE")
+                .order_by()
+                .values("auction")
+                .annotate(total=Count("pk"))
+                .values("total")[:1],
+                output_field=IntegerField(),
+            ),
+            Value(0),
+        ),
+        last_bid_at=Subquery(
+            Bid.objects.filter(auction=OuterRef("pk"))
+            .order_by()
+            .values("auction")
+            .annotate(latest=Max("created_at"))
+            .values("latest")[:1]
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0005_auction_index_status_deadline'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auction',
+            name='active_bid_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='auction',
+            name='best_bid',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='auctions.bid'),
+        ),
+        migrations.AddField(
+            model_name='auction',
+            name='best_bid_amount',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='auction',
+            name='last_bid_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_bid_state, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0006_best_bid_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bid',
+            name='max_amount',
+            field=models.DecimalField(blank=True, decimal_places=2, default=None, max_digits=12, null=True),
+        ),
+    ]
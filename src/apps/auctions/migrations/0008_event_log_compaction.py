@@ -0,0 +1,83 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:37
+
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Stringified money that the amount column (or the bid row) now carries.
+DROPPED_KEYS = [
+    "amount",
+    "best_bid",
+    "leading",
+    "delta_transfer",
+    "delta_wage",
+    "committed_transfer",
+    "committed_wage_weekly",
+]
+
+
+def compact_payloads(apps, schema_editor):
+    AuctionEvent = apps.get_model("auctions", "AuctionEvent")
+    batch = []
+    events = AuctionEvent.objects.filter(payload__has_any_keys=DROPPED_KEYS)
+    for event in events.iterator(chunk_size=2000):
+        payload = dict(event.payload)
+        # Replace events only logged the reservation deltas; the amount bid at
+        # the time is not recoverable (the bid row holds the latest one), so
+        # those keep amount NULL.
+        if "amount" in payload:
+            event.amount = Decimal(payload["amount"])
+        kind = payload.pop("type", None)
+        for key in DROPPED_KEYS:
+            payload.pop(key, None)
+        if kind == "proxy":
+            payload["proxy"] = True
+        event.payload = payload
+        batch.append(event)
+        if len(batch) >= 2000:
+            AuctionEvent.objects.bulk_update(batch, ["amount", "payload"])
+            batch = []
+    AuctionEvent.objects.bulk_update(batch, ["amount", "payload"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0007_bid_max_amount'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuctionEventSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(choices=[('BID_PLACED', 'Bid placed'), ('BID_REPLACED', 'Bid replaced'), ('BID_ACCEPTED', 'Bid accepted'), ('AUCTION_CLOSED', 'Auction closed'), ('AUCTION_EXTENDED', 'Auction extended')], max_length=30)),
+                ('event_count', models.PositiveIntegerField(default=0)),
+                ('first_at', models.DateTimeField()),
+                ('last_at', models.DateTimeField()),
+                ('max_amount', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='auctionevent',
+            name='amount',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.RunPython(compact_payloads, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='auctionevent',
+            index=models.Index(fields=['auction', 'created_at', 'id'], name='auction_event_timeline_idx'),
+        ),
+        migrations.AddField(
+            model_name='auctioneventsummary',
+            name='auction',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='event_summaries', to='auctions.auction'),
+        ),
+        migrations.AddConstraint(
+            model_name='auctioneventsummary',
+            constraint=models.UniqueConstraint(fields=('auction', 'event_type'), name='auction_event_summary_unique'),
+        ),
+    ]
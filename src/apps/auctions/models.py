@@ -22,10 +22,30 @@ class Auction(models.Model):
     )
     closed_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Denormalized from active bids; written under the auction row lock by
+    # apps.auctions.services, and by apps.auctions.signals for other writes.
+    best_bid_amount = models.DecimalField(null=True, blank=True, max_digits=12, decimal_places=2)
+    best_bid = models.ForeignKey(
+        "auctions.Bid", null=True, blank=True, on_delete=models.SET_NULL, related_name="+"
+    )
+    active_bid_count = models.PositiveIntegerField(default=0)
+    last_bid_at = models.DateTimeField(null=True, blank=True)
 
     def is_expired(self) -> bool:
         return self.deadline <= timezone.now()
 
+    @property
+    def has_ended(self) -> bool:
+        # Expired auctions stay OPEN until the closer worker reaches them;
+        # display them as ended in the meantime.
+        return self.status != self.Status.OPEN or self.is_expired()
+
+    @property
+    def display_status(self) -> str:
+        if self.status == self.Status.OPEN and self.is_expired():
+            return self.Status.CLOSED.label
+        return self.get_status_display()
+
     def __str__(self) -> str:
         return f"{self.player.name} ({self.get_status_display()})"
 
@@ -45,6 +65,11 @@ class Bid(models.Model):
     wage_offer_weekly = models.DecimalField(
         max_digits=12, decimal_places=2, null=True, blank=True, default=None
     )
+    # Proxy bids: the most the engine may raise ``amount`` to on the buyer's
+    # behalf. Never shown to other clubs.
+    max_amount = models.DecimalField(
+        max_digits=12, decimal_places=2, null=True, blank=True, default=None
+    )
     reserved_transfer_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     reserved_wage_weekly = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     notes = models.TextField(blank=True)
@@ -69,7 +94,35 @@ class AuctionEvent(models.Model):
         settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    amount = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
     payload = models.JSONField(default=dict, blank=True)
 
+    class Meta:
+        indexes = [
+            # Timeline pages: keyset on (created_at, id) within an auction.
+            models.Index(fields=["auction", "created_at", "id"], name="auction_event_timeline_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.event_type} ({self.auction_id})"
+
+
+class AuctionEventSummary(models.Model):
+    # Compacted bid events: one row per auction and event type, written by
+    # compact_auction_events in place of the events it removes.
+    auction = models.ForeignKey(Auction, on_delete=models.CASCADE, related_name="event_summaries")
+    event_type = models.CharField(max_length=30, choices=AuctionEvent.EventType.choices)
+    event_count = models.PositiveIntegerField(default=0)
+    first_at = models.DateTimeField()
+    last_at = models.DateTimeField()
+    max_amount = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["auction", "event_type"], name="auction_event_summary_unique"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.event_count} x {self.event_type} ({self.auction_id})"
@@ -0,0 +1,197 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from django.db.models import Count, Min, Prefetch, Q, prefetch_related_objects
+from django.utils import timezone
+
+from apps.accounts.finance import get_or_create_finance_for_user
+from apps.accounts.models import ClubFinance
+from apps.stats.models import PlayerForm, PlayerStatsSnapshot
+from .models import Auction, AuctionEvent, AuctionEventSummary, Bid
+from .services import get_best_bid_amount, get_minimum_next_bid, is_reserve_met
+
+EVENT_LABELS = {
+    AuctionEvent.EventType.BID_PLACED: "Bid placed",
+    AuctionEvent.EventType.BID_REPLACED: "Bid updated",
+    AuctionEvent.EventType.BID_ACCEPTED: "Bid accepted",
+    AuctionEvent.EventType.AUCTION_EXTENDED: "Deadline extended",
+    AuctionEvent.EventType.AUCTION_CLOSED: "Auction closed",
+}
+TIMELINE_PAGE_SIZE = 20
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass(slots=True)
+class TimelineEntry:
+    label: str
+    created_at: datetime
+    amount: Decimal | None = None
+
+
+@dataclass(slots=True)
+class TimelinePage:
+    entries: list[TimelineEntry]
+    # Pass back as ?before= for the next (older) page; None on the last one.
+    next_cursor: str | None
+    # Compacted history, only on the last page.
+    summaries: list[TimelineEntry]
+
+
+@dataclass(slots=True)
+class AuctionDetail:
+    auction: Auction
+    player_form: PlayerForm | None
+    latest_snapshot: PlayerStatsSnapshot | None
+    bid_ladder: list[Bid]
+    seller_bids: list[Bid]
+    buyer_active_bid: Bid | None
+    bid_count: int
+    bids_per_hour: float
+    viewer_is_buyer: bool
+    is_owner: bool
+    can_bid: bool
+    finance: ClubFinance | None
+
+    @property
+    def best_bid(self) -> Decimal | None:
+        return get_best_bid_amount(self.auction)
+
+    @property
+    def minimum_next(self) -> Decimal | None:
+        return get_minimum_next_bid(self.auction)
+
+    @property
+    def reserve_met(self) -> bool | None:
+        return is_reserve_met(self.auction)
+
+    def as_context(self) -> dict:
+        context = {name: getattr(self, name) for name in self.__slots__}
+        context.update(
+            best_bid=self.best_bid, minimum_next=self.minimum_next, reserve_met=self.reserve_met
+        )
+        return context
+
+
+def _viewer_roles(user) -> tuple[bool, bool]:
+    # One groups query instead of one per is_buyer()/is_seller() call.
+    if not user.is_authenticated:
+        return False, False
+    groups = set(user.groups.values_list("name", flat=True))
+    admin = user.is_superuser or "admin" in groups
+    return admin or "buyer" in groups, admin or "seller" in groups
+
+
+def load_auction_detail(pk: int, user) -> AuctionDetail:
+    # Query count is fixed: groups, the auction (+player, form, bid totals),
+    # one prefetch each for bids and the latest snapshot, and finance for a
+    # buyer who can bid. The timeline loads separately, a page at a time
+    # (load_timeline). Raises Auction.DoesNotExist.
+    viewer_is_buyer, viewer_is_seller = _viewer_roles(user)
+    auction = (
+        Auction.objects.select_related("player", "player__form", "seller")
+        .annotate(total_bids=Count("bids"), first_bid_at=Min("bids__created_at"))
+        .get(pk=pk)
+    )
+    is_owner = viewer_is_seller and auction.seller_id == user.id
+
+    # Only the seller sees every bid; everyone else gets the active ladder.
+    bids = Bid.objects.order_by("-amount", "created_at")
+    if is_owner:
+        bids = bids.select_related("buyer", "buyer__club")
+    else:
+        bids = bids.filter(status=Bid.Status.ACTIVE)
+    # Sliced prefetch: Postgres picks the newest snapshot with ROW_NUMBER()
+    # over the player's rows, and the raw API payload is never loaded.
+    snapshots = PlayerStatsSnapshot.objects.defer("payload").order_by("-as_of")[:1]
+    prefetch_related_objects(
+        [auction],
+        Prefetch("bids", queryset=bids, to_attr="detail_bids"),
+        Prefetch("player__stats_snapshots", queryset=snapshots, to_attr="latest_snapshots"),
+    )
+
+    bid_ladder = [bid for bid in auction.detail_bids if bid.status == Bid.Status.ACTIVE]
+    bids_per_hour = 0.0
+    if auction.total_bids:
+        hours = max((timezone.now() - auction.first_bid_at).total_seconds() / 3600, 1 / 60)
+        bids_per_hour = round(auction.total_bids / hours, 1)
+
+    buyer_active_bid = None
+    if viewer_is_buyer:
+        buyer_active_bid = next((bid for bid in bid_ladder if bid.buyer_id == user.id), None)
+
+    can_bid = viewer_is_buyer and auction.seller_id != user.id and not auction.has_ended
+    finance = None
+    if can_bid and hasattr(user, "club"):
+        finance = get_or_create_finance_for_user(user)
+
+    return AuctionDetail(
+        auction=auction,
+        player_form=getattr(auction.player, "form", None),
+        latest_snapshot=next(iter(auction.player.latest_snapshots), None),
+        bid_ladder=bid_ladder,
+        seller_bids=auction.detail_bids if is_owner else [],
+        buyer_active_bid=buyer_active_bid,
+        bid_count=auction.total_bids,
+        bids_per_hour=bids_per_hour,
+        viewer_is_buyer=viewer_is_buyer,
+        is_owner=is_owner,
+        can_bid=can_bid,
+        finance=finance,
+    )
+
+
+def encode_cursor(event: AuctionEvent) -> str:
+    # Integer microseconds, so the cursor round-trips exactly.
+    return f"{(event.created_at - _EPOCH) // _MICROSECOND}-{event.pk}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    # Raises ValueError for anything encode_cursor() did not produce.
+    micros, _, pk = cursor.partition("-")
+    return _EPOCH + timedelta(microseconds=int(micros)), int(pk)
+
+
+def load_timeline(
+    auction_id: int, cursor: str | None = None, limit: int = TIMELINE_PAGE_SIZE
+) -> TimelinePage:
+    # Newest first. Keyset pagination on the (auction, created_at, id) index
+    # reads ``limit + 1`` rows, so every page costs the same however long the
+    # auction has run; compacted summaries follow the oldest page.
+    events = (
+        AuctionEvent.objects.filter(auction_id=auction_id)
+        .only("event_type", "created_at", "amount")
+        .order_by("-created_at", "-id")
+    )
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        events = events.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk))
+    rows = list(events[: limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    summaries = []
+    if not has_more:
+        summaries = [
+            TimelineEntry(
+                f"{EVENT_LABELS.get(summary.event_type, summary.event_type)} x{summary.event_count}",
+                summary.last_at,
+                summary.max_amount,
+            )
+            for summary in AuctionEventSummary.objects.filter(auction_id=auction_id).order_by(
+                "-last_at"
+            )
+        ]
+    return TimelinePage(
+        entries=[
+            TimelineEntry(
+                EVENT_LABELS.get(event.event_type, event.get_event_type_display()),
+                event.created_at,
+                event.amount,
+            )
+            for event in rows
+        ],
+        next_cursor=encode_cursor(rows[-1]) if has_more else None,
+        summaries=summaries,
+    )
@@ -1,22 +1,41 @@
+from collections import defaultdict
 from datetime import timedelta
 from decimal import Decimal
 
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.db import transaction
-from django.db.models import Max
+from django.db.models import F, Max
 from django.utils import timezone
 
-from apps.accounts.finance import commit, release, reserve
+from apps.accounts.finance import (
+    commit,
+    lock_finances,
+    release,
+    release_many,
+    release_unlocked,
+    reserve,
+    reserve_if_available,
+)
 from apps.accounts.models import ClubFinance
+from .events import event_batch, record_event
+from .live import auction_topic, publish, user_topic
+from .locking import (
+    advisory_locking,
+    bids_for_update,
+    hold_auction_lock,
+    lock_auction_for_bid,
+    try_hold_auction_locks,
+)
 from .models import Auction, AuctionEvent, Bid
 from apps.notifications.models import Notification
-from apps.notifications.utils import create_notification
+from apps.notifications.dispatch import notification_batch, queue_notification
+
+
+BID_STATE_FIELDS = ["best_bid_amount", "best_bid", "active_bid_count", "last_bid_at"]
 
 
 def get_best_bid_amount(auction: Auction) -> Decimal | None:
-    return auction.bids.filter(status=Bid.Status.ACTIVE).aggregate(max_amount=Max("amount"))[
-        "max_amount"
-    ]
+    return auction.best_bid_amount
 
 
 def get_minimum_next_bid(auction: Auction) -> Decimal | None:
@@ -34,7 +53,115 @@ def is_reserve_met(auction: Auction) -> bool | None:
         return False
     return best >= auction.reserve_price
 
+
+def refresh_bid_state(auction_id) -> None:
+    # Recomputes the best-bid columns from the bids table, for bid writes
+    # that bypass the services below (admin, fixtures, shell).
+    active = Bid.objects.filter(auction_id=auction_id, status=Bid.Status.ACTIVE)
+    best = active.order_by("-amount", "created_at").values("pk", "amount").first()
+    Auction.objects.filter(pk=auction_id).update(
+        best_bid_amount=best["amount"] if best else None,
+        best_bid_id=best["pk"] if best else None,
+        active_bid_count=active.count(),
+        last_bid_at=Bid.objects.filter(auction_id=auction_id).aggregate(latest=Max("created_at"))[
+            "latest"
+        ],
+    )
+
+
+def _save_bid(bid: Bid, **kwargs) -> None:
+    # The caller updates the auction's bid state itself; skip the signal.
+    bid._bid_state_synced = True
+    bid.save(**kwargs)
+
+
+def _clear_bid_state(*auctions: Auction) -> None:
+    for auction in auctions:
+        auction.best_bid_amount = None
+        auction.best_bid = None
+        auction.active_bid_count = 0
+
+
+def _record_bid(auction: Auction, bid: Bid, best_other: Bid | None, now, *, added: bool) -> None:
+    # ``best_other`` is the locked top active bid from other buyers, so the
+    # leader is one of the two without re-reading the ladder.
+    leader = bid
+    if best_other and (
+        best_other.amount > bid.amount
+        or (best_other.amount == bid.amount and best_other.created_at <= bid.created_at)
+    ):
+        leader = best_other
+    auction.best_bid_amount = leader.amount
+    auction.best_bid = leader
+    if added:
+        auction.active_bid_count += 1
+    auction.last_bid_at = now
+    auction.save(update_fields=BID_STATE_FIELDS)
+
+
+def _live_message(auction: Auction, event: str, user_ids=()) -> tuple:
+    # Watchers re-fetch their partials on each message; the payload carries
+    # just enough to update a countdown or badge without a round trip.
+    topics = {auction_topic(auction.pk), *(user_topic(user_id) for user_id in user_ids if user_id)}
+    return topics, {
+        "event": event,
+        "auction": auction.pk,
+        "status": auction.status,
+        "deadline": auction.deadline,
+        "best_bid": auction.best_bid_amount,
+        "active_bids": auction.active_bid_count,
+    }
+
+
+def _reservations_by_club(rows) -> dict:
+    # (club_id, transfer, wage) per bid -> summed per club for release_many().
+    totals = defaultdict(lambda: [Decimal("0"), Decimal("0")])
+    for club_id, transfer, wage in rows:
+        if club_id:
+            totals[club_id][0] += transfer
+            totals[club_id][1] += wage
+    return totals
+
+
+def _close_locked_auctions(auctions, now) -> None:
+    # ``auctions`` are OPEN rows the caller holds locks on; every active bid's
+    # reservation is released with one set-based update per batch.
+    auction_ids = [auction.pk for auction in auctions]
+    bids = list(
+        Bid.objects.filter(auction_id__in=auction_ids, status=Bid.Status.ACTIVE).values_list(
+            "pk", "auction_id", "buyer__club", "reserved_transfer_amount", "reserved_wage_weekly"
+        )
+    )
+    closed_counts = defaultdict(int)
+    for _, auction_id, _, _, _ in bids:
+        closed_counts[auction_id] += 1
+    release_many(_reservations_by_club(bid[2:] for bid in bids))
+
+    Bid.objects.filter(pk__in=[bid[0] for bid in bids]).update(status=Bid.Status.REJECTED)
+    Auction.objects.filter(pk__in=auction_ids).update(
+        status=Auction.Status.CLOSED,
+        closed_at=now,
+        best_bid_amount=None,
+        best_bid=None,
+        active_bid_count=0,
+    )
+    with event_batch():
+        for auction in auctions:
+            record_event(
+                auction,
+                AuctionEvent.EventType.AUCTION_CLOSED,
+                released=True,
+                count=closed_counts[auction.pk],
+            )
+    for auction in auctions:
+        auction.status = Auction.Status.CLOSED
+        _clear_bid_state(auction)
+    publish(_live_message(auction, "closed", [auction.seller_id]) for auction in auctions)
+
+
 def close_if_expired(auction: Auction, now=None) -> bool:
+    # Write paths only (place_bid, accept_bid); reads use Auction.has_ended
+    # and leave closing to close_expired_auctions().
     now = now or timezone.now()
     if auction.status != Auction.Status.OPEN:
         return False
@@ -43,36 +170,31 @@ def close_if_expired(auction: Auction, now=None) -> bool:
         return False
 
     with transaction.atomic():
+        hold_auction_lock(auction.pk)
         locked = Auction.objects.select_for_update().get(pk=auction.pk)
         if locked.status != Auction.Status.OPEN or locked.deadline > now:
             return False
+        _close_locked_auctions([locked], now)
+        _clear_bid_state(auction)
+        return True
 
-        active_bids = list(
-            locked.bids.select_related("buyer")
-            .filter(status=Bid.Status.ACTIVE)
-            .order_by("created_at")
-        )
-        for bid in active_bids:
-            finance = (
-                ClubFinance.objects.select_for_update()
-                .filter(club=bid.buyer.club)
-                .first()
-            )
-            if finance:
-                release(finance, bid.reserved_transfer_amount, bid.reserved_wage_weekly)
-            bid.status = Bid.Status.REJECTED
-            bid.save(update_fields=["status"])
-
-        locked.status = Auction.Status.CLOSED
-        locked.closed_at = now
-        locked.save(update_fields=["status", "closed_at"])
-        AuctionEvent.objects.create(
-            auction=locked,
-            event_type=AuctionEvent.EventType.AUCTION_CLOSED,
-            actor=None,
-            payload={"released": True, "count": len(active_bids)},
+
+def close_expired_auctions(now=None, batch_size: int = 100) -> int:
+    # One batch for the closer worker. SKIP LOCKED leaves auctions that a bid
+    # or another closer holds to the next pass instead of queueing behind them.
+    now = now or timezone.now()
+    with transaction.atomic():
+        auctions = list(
+            Auction.objects.select_for_update(skip_locked=True)
+            .filter(status=Auction.Status.OPEN, deadline__lte=now)
+            .order_by("deadline", "pk")[:batch_size]
         )
-        return True
+        # Advisory mode: an auction mid-bid holds its key, not its row.
+        held = try_hold_auction_locks(auction.pk for auction in auctions)
+        auctions = [auction for auction in auctions if auction.pk in held]
+        if auctions:
+            _close_locked_auctions(auctions, now)
+    return len(auctions)
 
 
 def validate_bid_amount(auction: Auction, amount) -> None:
@@ -100,14 +222,167 @@ def validate_budget_for_bid(finance: ClubFinance, add_transfer: Decimal, add_wag
         raise ValidationError("Insufficient wage budget for this bid.")
 
 
+def _publish_bid(auction: Auction, buyer, best_other: Bid | None, extended: bool) -> None:
+    user_ids = [buyer.id, auction.seller_id, best_other.buyer_id if best_other else None]
+    publish([_live_message(auction, "extended" if extended else "bid", user_ids)])
+
+
+def _lock_bid_finances(auction: Auction, buyer) -> dict:
+    # Every finance row a bid can touch is locked up front, in one sorted
+    # lock_finances() call under the auction lock: the buyer's, plus those of
+    # clubs holding an active maximum here, which _resolve_proxies reads and
+    # may reserve against. Locking the buyer first and the proxy owners later
+    # would not be club order, so two bids on different auctions, each by the
+    # other's proxy owner, could deadlock. The auction lock keeps the set of
+    # proxies stable until commit.
+    #
+    # Advisory mode skips the up-front lock when no other club holds a
+    # maximum: the buyer's reservation is then a conditional UPDATE (see
+    # _rebalance_reservation) and no other finance row is touched.
+    proxy_clubs = set(
+        Bid.objects.filter(auction=auction, status=Bid.Status.ACTIVE, max_amount__gt=F("amount"))
+        .exclude(buyer=buyer)
+        .values_list("buyer__club", flat=True)
+    )
+    if advisory_locking() and not proxy_clubs:
+        return {}
+    finances = lock_finances([buyer.club.pk, *proxy_clubs])
+    if buyer.club.pk not in finances:
+        finances[buyer.club.pk] = ClubFinance.objects.create(club=buyer.club)
+    return finances
+
+
+def _rebalance_reservation(
+    finance: ClubFinance | None, club_id, bid: Bid | None, amount, wage
+) -> None:
+    # Moves the club's reservation from what ``bid`` holds to (amount, wage),
+    # checking the budget for any increase. Without a locked ``finance`` the
+    # check and the write are one conditional UPDATE.
+    delta_transfer = amount - (bid.reserved_transfer_amount if bid else Decimal("0"))
+    delta_wage = wage - (bid.reserved_wage_weekly if bid else Decimal("0"))
+    if finance is None:
+        increase = (max(delta_transfer, Decimal("0")), max(delta_wage, Decimal("0")))
+        if any(increase) and not reserve_if_available(club_id, *increase):
+            current = ClubFinance.objects.filter(club_id=club_id).first()
+            validate_budget_for_bid(current or ClubFinance(), *increase)
+            raise ValidationError("Insufficient transfer budget for this bid.")
+        if delta_transfer < 0 or delta_wage < 0:
+            release_unlocked(
+                club_id,
+                abs(min(delta_transfer, Decimal("0"))),
+                abs(min(delta_wage, Decimal("0"))),
+            )
+        return
+    if delta_transfer > 0 or delta_wage > 0:
+        validate_budget_for_bid(
+            finance, max(delta_transfer, Decimal("0")), max(delta_wage, Decimal("0"))
+        )
+        reserve(finance, max(delta_transfer, Decimal("0")), max(delta_wage, Decimal("0")))
+    if delta_transfer < 0 or delta_wage < 0:
+        release(
+            finance,
+            abs(min(delta_transfer, Decimal("0"))),
+            abs(min(delta_wage, Decimal("0"))),
+        )
+
+
+def _proxy_increment(auction: Auction) -> Decimal:
+    return auction.min_increment or Decimal("0.01")
+
+
+def _opening_amount(auction: Auction, max_amount: Decimal) -> Decimal:
+    # Where a new proxy enters: one increment over the best bid, or straight
+    # to the reserve (or its maximum, if lower) on an auction with no bids.
+    best = get_best_bid_amount(auction)
+    if best is not None:
+        return min(max_amount, best + _proxy_increment(auction))
+    return min(max_amount, auction.reserve_price or _proxy_increment(auction))
+
+
+def _resolve_proxies(auction: Auction, finances: dict) -> Bid | None:
+    # Settles every competing maximum in one pass. Replaying the exchange
+    # increment by increment always ends the same way: the bid with the
+    # highest ceiling leads, at one increment over the runner-up's ceiling
+    # (capped at its own), and every other bid is left where it stood. So
+    # only the leader moves, and only its final amount is reserved.
+    #
+    # A ceiling is the maximum clamped to what the club can still afford;
+    # a manual bid's ceiling is its amount. Equal ceilings go to the earlier
+    # bid. Returns the leader if it was raised, else None. ``finances`` holds
+    # the rows _lock_bid_finances() locked; only the bidder's own row can be
+    # missing from it (advisory mode), and it already holds that row.
+    bids = list(
+        bids_for_update(Bid.objects, of=("self",))
+        .select_related("buyer__club")
+        .filter(auction=auction, status=Bid.Status.ACTIVE)
+        .order_by("pk")
+    )
+    proxies = {bid.pk: bid for bid in bids if bid.max_amount and bid.max_amount > bid.amount}
+    if not proxies or len(bids) < 2:
+        return None
+    missing = {bid.buyer.club.pk for bid in proxies.values()} - set(finances)
+    if missing:
+        finances = {**finances, **lock_finances(missing)}
+
+    ceilings = {}
+    for bid in bids:
+        ceiling = bid.amount
+        if bid.pk in proxies:
+            finance = finances.get(bid.buyer.club.pk)
+            headroom = finance.transfer_remaining if finance else Decimal("0")
+            ceiling = max(bid.amount, min(bid.max_amount, bid.amount + headroom))
+        ceilings[bid.pk] = ceiling
+
+    leader, runner_up = sorted(bids, key=lambda bid: (-ceilings[bid.pk], bid.created_at, bid.pk))[:2]
+    price = min(ceilings[leader.pk], ceilings[runner_up.pk] + _proxy_increment(auction))
+    if price <= leader.amount:
+        return None
+
+    reserve(finances[leader.buyer.club.pk], price - leader.reserved_transfer_amount, Decimal("0"))
+    leader.amount = price
+    leader.reserved_transfer_amount = price
+    _save_bid(leader, update_fields=["amount", "reserved_transfer_amount"])
+    return leader
+
+
+def _counter_with_proxy(
+    auction: Auction, bid: Bid, best_other: Bid | None, finances: dict
+) -> tuple:
+    # A manual bid at or under the leading proxy's maximum is answered in the
+    # same transaction rather than by another round trip from its owner.
+    # Returns the (possibly raised) top bid from other buyers and whether it
+    # now beats ``bid``.
+    if not best_other or not best_other.max_amount or best_other.max_amount < bid.amount:
+        return best_other, False
+    raised = _resolve_proxies(auction, finances)
+    if raised is None or raised.buyer_id == bid.buyer_id:
+        return best_other, False
+    record_event(
+        auction,
+        AuctionEvent.EventType.BID_REPLACED,
+        actor=raised.buyer,
+        amount=raised.amount,
+        proxy=True,
+    )
+    return raised, True
+
+
+def _notify_proxy_outbid(auction: Auction, buyer) -> None:
+    queue_notification(
+        recipient=buyer,
+        type=Notification.Type.OUTBID,
+        message=f"A maximum bid immediately outbid you for {auction.player.name}.",
+        link=f"/auctions/{auction.id}/",
+        related_player=auction.player,
+    )
+
+
 @transaction.atomic
+@event_batch()
+@notification_batch()
 def place_bid(auction: Auction, buyer, amount, wage_offer_weekly=None, notes="") -> Bid:
     wage_offer_weekly = wage_offer_weekly or Decimal("0")
-    auction = (
-        Auction.objects.select_for_update()
-        .select_related("seller")
-        .get(pk=auction.pk)
-    )
+    auction = lock_auction_for_bid(auction.pk)
     now = timezone.now()
     close_if_expired(auction, now=now)
     if auction.seller_id == buyer.id:
@@ -116,16 +391,11 @@ def place_bid(auction: Auction, buyer, amount, wage_offer_weekly=None, notes="")
         raise ValidationError("Bid amount must be positive")
     validate_bid_amount(auction, amount)
 
-    finance = (
-        ClubFinance.objects.select_for_update()
-        .filter(club=buyer.club)
-        .first()
-    )
-    if not finance:
-        finance = ClubFinance.objects.create(club=buyer.club)
+    finances = _lock_bid_finances(auction, buyer)
+    finance = finances.get(buyer.club.pk)
 
     best_other = (
-        Bid.objects.select_for_update()
+        bids_for_update(Bid.objects)
         .filter(auction=auction, status=Bid.Status.ACTIVE)
         .exclude(buyer=buyer)
         .order_by("-amount", "created_at")
@@ -133,70 +403,57 @@ def place_bid(auction: Auction, buyer, amount, wage_offer_weekly=None, notes="")
     )
 
     existing = (
-        Bid.objects.select_for_update()
+        bids_for_update(Bid.objects)
         .filter(auction=auction, buyer=buyer, status=Bid.Status.ACTIVE)
         .first()
     )
 
     if existing:
-        delta_transfer = amount - existing.reserved_transfer_amount
-        delta_wage = wage_offer_weekly - existing.reserved_wage_weekly
-        if delta_transfer > 0 or delta_wage > 0:
-            validate_budget_for_bid(
-                finance, max(delta_transfer, Decimal("0")), max(delta_wage, Decimal("0"))
-            )
-            reserve(finance, max(delta_transfer, Decimal("0")), max(delta_wage, Decimal("0")))
-        if delta_transfer < 0 or delta_wage < 0:
-            release(
-                finance,
-                abs(min(delta_transfer, Decimal("0"))),
-                abs(min(delta_wage, Decimal("0"))),
-            )
+        _rebalance_reservation(finance, buyer.club.pk, existing, amount, wage_offer_weekly)
 
         existing.amount = amount
         existing.wage_offer_weekly = wage_offer_weekly
         existing.reserved_transfer_amount = amount
         existing.reserved_wage_weekly = wage_offer_weekly
-        existing.save(
+        # A manual bid replaces any maximum the buyer had registered.
+        existing.max_amount = None
+        _save_bid(
+            existing,
             update_fields=[
                 "amount",
                 "wage_offer_weekly",
                 "reserved_transfer_amount",
                 "reserved_wage_weekly",
-            ]
-        )
-        AuctionEvent.objects.create(
-            auction=auction,
-            event_type=AuctionEvent.EventType.BID_REPLACED,
-            actor=buyer,
-            payload={
-                "type": "replace",
-                "delta_transfer": str(delta_transfer),
-                "delta_wage": str(delta_wage),
-            },
+                "max_amount",
+            ],
         )
-        _maybe_extend_deadline(auction, now)
-        create_notification(
-            recipient=auction.seller,
+        best_other, countered = _counter_with_proxy(auction, existing, best_other, finances)
+        _record_bid(auction, existing, best_other, now, added=False)
+        record_event(auction, AuctionEvent.EventType.BID_REPLACED, actor=buyer, amount=amount)
+        extended = _maybe_extend_deadline(auction, now)
+        _publish_bid(auction, buyer, best_other, extended)
+        queue_notification(
+            recipient=auction.seller_id,
             type=Notification.Type.AUCTION_BID_RECEIVED,
             message=f"{buyer.club.name if hasattr(buyer, 'club') else buyer.username} updated their bid to £{amount:,.0f} for {auction.player.name}.",
             link=f"/auctions/{auction.id}/",
             related_player=auction.player,
         )
         if best_other and amount > best_other.amount:
-            create_notification(
-                recipient=best_other.buyer,
+            queue_notification(
+                recipient=best_other.buyer_id,
                 type=Notification.Type.OUTBID,
                 message=f"You have been outbid for {auction.player.name}.",
                 link=f"/auctions/{auction.id}/",
                 related_player=auction.player,
             )
+        if countered:
+            _notify_proxy_outbid(auction, buyer)
         return existing
 
-    validate_budget_for_bid(finance, amount, wage_offer_weekly)
-    reserve(finance, amount, wage_offer_weekly)
+    _rebalance_reservation(finance, buyer.club.pk, None, amount, wage_offer_weekly)
 
-    bid = Bid.objects.create(
+    bid = Bid(
         auction=auction,
         buyer=buyer,
         amount=amount,
@@ -205,37 +462,134 @@ def place_bid(auction: Auction, buyer, amount, wage_offer_weekly=None, notes="")
         reserved_wage_weekly=wage_offer_weekly,
         notes=notes,
     )
-    AuctionEvent.objects.create(
-        auction=auction,
-        event_type=AuctionEvent.EventType.BID_PLACED,
-        actor=buyer,
-        payload={"amount": str(amount), "type": "new"},
-    )
-    _maybe_extend_deadline(auction, now)
-    create_notification(
-        recipient=auction.seller,
+    _save_bid(bid)
+    best_other, countered = _counter_with_proxy(auction, bid, best_other, finances)
+    _record_bid(auction, bid, best_other, now, added=True)
+    record_event(auction, AuctionEvent.EventType.BID_PLACED, actor=buyer, amount=amount)
+    extended = _maybe_extend_deadline(auction, now)
+    _publish_bid(auction, buyer, best_other, extended)
+    queue_notification(
+        recipient=auction.seller_id,
         type=Notification.Type.AUCTION_BID_RECEIVED,
         message=f"{buyer.club.name if hasattr(buyer, 'club') else buyer.username} placed a bid of £{amount:,.0f} for {auction.player.name}.",
         link=f"/auctions/{auction.id}/",
         related_player=auction.player,
     )
     if best_other and amount > best_other.amount:
-        create_notification(
-            recipient=best_other.buyer,
+        queue_notification(
+            recipient=best_other.buyer_id,
             type=Notification.Type.OUTBID,
             message=f"You have been outbid for {auction.player.name}.",
             link=f"/auctions/{auction.id}/",
             related_player=auction.player,
         )
+    if countered:
+        _notify_proxy_outbid(auction, buyer)
     return bid
 
 
 @transaction.atomic
+@event_batch()
+@notification_batch()
+def place_proxy_bid(auction: Auction, buyer, max_amount, wage_offer_weekly=None, notes="") -> Bid:
+    # Registers (or raises) the buyer's maximum and resolves it against the
+    # other proxies at once: one event, one deadline check, one live message
+    # and one round of notifications however many increments it covered.
+    wage_offer_weekly = wage_offer_weekly or Decimal("0")
+    auction = lock_auction_for_bid(auction.pk)
+    now = timezone.now()
+    close_if_expired(auction, now=now)
+    if auction.seller_id == buyer.id:
+        raise PermissionDenied("Cannot bid on own auction")
+    if max_amount <= 0:
+        raise ValidationError("Bid amount must be positive")
+    validate_bid_amount(auction, max_amount)
+
+    finances = _lock_bid_finances(auction, buyer)
+    finance = finances.get(buyer.club.pk)
+
+    best_other = (
+        bids_for_update(Bid.objects)
+        .filter(auction=auction, status=Bid.Status.ACTIVE)
+        .exclude(buyer=buyer)
+        .order_by("-amount", "created_at")
+        .first()
+    )
+    existing = (
+        bids_for_update(Bid.objects)
+        .filter(auction=auction, buyer=buyer, status=Bid.Status.ACTIVE)
+        .first()
+    )
+    was_leading = existing is not None and auction.best_bid_id == existing.pk
+    if existing and existing.amount > max_amount:
+        raise ValidationError("Maximum cannot be below your current bid.")
+    amount = existing.amount if was_leading else _opening_amount(auction, max_amount)
+    _rebalance_reservation(finance, buyer.club.pk, existing, amount, wage_offer_weekly)
+
+    bid = existing or Bid(auction=auction, buyer=buyer, notes=notes)
+    bid.amount = amount
+    bid.max_amount = max_amount
+    bid.wage_offer_weekly = wage_offer_weekly
+    bid.reserved_transfer_amount = amount
+    bid.reserved_wage_weekly = wage_offer_weekly
+    if existing:
+        _save_bid(
+            bid,
+            update_fields=[
+                "amount",
+                "max_amount",
+                "wage_offer_weekly",
+                "reserved_transfer_amount",
+                "reserved_wage_weekly",
+            ],
+        )
+    else:
+        _save_bid(bid)
+
+    raised = _resolve_proxies(auction, finances)
+    if raised is not None and raised.pk == bid.pk:
+        bid = raised
+    top_other = raised if raised is not None and raised.pk != bid.pk else best_other
+    _record_bid(auction, bid, top_other, now, added=existing is None)
+    leading = auction.best_bid_id == bid.pk
+    # Records where the bid stands, never the maximum itself.
+    record_event(
+        auction,
+        AuctionEvent.EventType.BID_REPLACED if existing else AuctionEvent.EventType.BID_PLACED,
+        actor=buyer,
+        amount=bid.amount,
+        proxy=True,
+    )
+    extended = _maybe_extend_deadline(auction, now)
+    _publish_bid(auction, buyer, best_other, extended)
+    queue_notification(
+        recipient=auction.seller_id,
+        type=Notification.Type.AUCTION_BID_RECEIVED,
+        message=f"{buyer.club.name if hasattr(buyer, 'club') else buyer.username} placed a maximum bid for {auction.player.name}; the best offer is now £{auction.best_bid_amount:,.0f}.",
+        link=f"/auctions/{auction.id}/",
+        related_player=auction.player,
+    )
+    if leading and not was_leading and best_other:
+        queue_notification(
+            recipient=best_other.buyer_id,
+            type=Notification.Type.OUTBID,
+            message=f"You have been outbid for {auction.player.name}.",
+            link=f"/auctions/{auction.id}/",
+            related_player=auction.player,
+        )
+    elif not leading:
+        _notify_proxy_outbid(auction, buyer)
+    return bid
+
+
+@transaction.atomic
+@event_batch()
+@notification_batch()
 def accept_bid(auction: Auction, bid: Bid, actor):
-    from django.contrib.auth import get_user_model
     from apps.deals.models import Deal
 
     now = timezone.now()
+    hold_auction_lock(auction.pk)
     auction = (
         Auction.objects.select_for_update(of=("self",))
         .select_related("seller__club", "player")
@@ -251,58 +605,48 @@ def accept_bid(auction: Auction, bid: Bid, actor):
     if bid.status != Bid.Status.ACTIVE:
         raise ValidationError("Bid is not active")
 
-    winning_finance = (
-        ClubFinance.objects.select_for_update()
-        .filter(club=bid.buyer.club)
-        .first()
+    losing_bids = list(
+        Bid.objects.filter(auction=auction, status=Bid.Status.ACTIVE)
+        .exclude(pk=bid.pk)
+        .values_list("pk", "buyer__club", "reserved_transfer_amount", "reserved_wage_weekly")
     )
+    winning_club_id = bid.buyer.club.id
+    finances = lock_finances([winning_club_id, *(club_id for _, club_id, _, _ in losing_bids)])
+    winning_finance = finances.get(winning_club_id)
     if not winning_finance:
         winning_finance = ClubFinance.objects.create(club=bid.buyer.club)
 
     bid.status = Bid.Status.ACCEPTED
-    bid.save(update_fields=["status"])
+    _save_bid(bid, update_fields=["status"])
 
     auction.status = Auction.Status.ACCEPTED
     auction.accepted_bid = bid
     auction.closed_at = now
-    auction.save(update_fields=["status", "accepted_bid", "closed_at"])
+    _clear_bid_state(auction)
+    auction.save(update_fields=["status", "accepted_bid", "closed_at", *BID_STATE_FIELDS])
 
     commit(winning_finance, bid.reserved_transfer_amount, bid.reserved_wage_weekly)
 
-    other_bids = list(
-        Bid.objects.select_for_update()
-        .select_related("buyer")
-        .filter(auction=auction, status=Bid.Status.ACTIVE)
-        .exclude(pk=bid.pk)
+    release_many(_reservations_by_club(losing[1:] for losing in losing_bids))
+    Bid.objects.filter(pk__in=[pk for pk, _, _, _ in losing_bids]).update(
+        status=Bid.Status.REJECTED
     )
-    for other in other_bids:
-        finance = (
-            ClubFinance.objects.select_for_update()
-            .filter(club=other.buyer.club)
-            .first()
-        )
-        if finance:
-            release(finance, other.reserved_transfer_amount, other.reserved_wage_weekly)
-        other.status = Bid.Status.REJECTED
-        other.save(update_fields=["status"])
 
     below_reserve = False
     if auction.reserve_price is not None and bid.amount < auction.reserve_price:
         below_reserve = True
 
-    AuctionEvent.objects.create(
-        auction=auction,
-        event_type=AuctionEvent.EventType.BID_ACCEPTED,
+    record_event(
+        auction,
+        AuctionEvent.EventType.BID_ACCEPTED,
         actor=actor,
-        payload={
-            "bid_id": bid.id,
-            "amount": str(bid.amount),
-            "below_reserve": below_reserve,
-            "committed_transfer": str(bid.reserved_transfer_amount),
-            "committed_wage_weekly": str(bid.reserved_wage_weekly),
-        },
+        amount=bid.amount,
+        bid_id=bid.id,
+        below_reserve=below_reserve,
     )
 
+    publish([_live_message(auction, "accepted", [bid.buyer_id, auction.seller_id])])
+
     # Create a pending deal room — actual transfer is completed by staff.
     buyer_club = bid.buyer.club
     seller_club = auction.seller.club
@@ -321,46 +665,37 @@ def accept_bid(auction: Auction, bid: Bid, actor):
         f"Auction completed — {auction.player.name}, agreed fee {fee_str}. "
         f"Awaiting off-platform completion. Deal #{deal.id}"
     )
-    # Notify the actual transaction participants (bidder + seller), not just club owners.
-    for recipient in {bid.buyer, auction.seller} - {None}:
-        create_notification(
+    # Notify the actual transaction participants (bidder + seller), not just
+    # club owners; FANOUT_RULES copies it to staff once the deal commits.
+    for recipient in {bid.buyer_id, auction.seller_id} - {None}:
+        queue_notification(
             recipient=recipient,
             type=Notification.Type.AUCTION_BID_ACCEPTED,
             message=msg,
             link=f"/deals/{deal.id}/",
             related_player=auction.player,
         )
-    User = get_user_model()
-    for staff_user in User.objects.filter(is_staff=True):
-        create_notification(
-            recipient=staff_user,
-            type=Notification.Type.AUCTION_BID_ACCEPTED,
-            message=msg,
-            link=f"/deals/{deal.id}/",
-            related_player=auction.player,
-        )
 
     return deal
 
 
-def _maybe_extend_deadline(auction: Auction, now) -> None:
+def _maybe_extend_deadline(auction: Auction, now) -> bool:
     from django.conf import settings
 
     if not settings.TRANSFERX_ENABLE_ANTI_SNIPING:
-        return
+        return False
     window_minutes = settings.TRANSFERX_SNIPING_WINDOW_MINUTES
     extend_minutes = settings.TRANSFERX_SNIPING_EXTEND_MINUTES
     if (auction.deadline - now).total_seconds() / 60 <= window_minutes:
         old_deadline = auction.deadline
         auction.deadline = auction.deadline + timedelta(minutes=extend_minutes)
         auction.save(update_fields=["deadline"])
-        AuctionEvent.objects.create(
-            auction=auction,
-            event_type=AuctionEvent.EventType.AUCTION_EXTENDED,
-            actor=None,
-            payload={
-                "old_deadline": old_deadline.isoformat(),
-                "new_deadline": auction.deadline.isoformat(),
-                "reason": "anti_sniping",
-            },
+        record_event(
+            auction,
+            AuctionEvent.EventType.AUCTION_EXTENDED,
+            old_deadline=old_deadline.isoformat(),
+            new_deadline=auction.deadline.isoformat(),
+            reason="anti_sniping",
         )
+        return True
+    return False
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Auction, Bid
+from .services import refresh_bid_state
+
+
+@receiver(post_save, sender=Bid)
+@receiver(post_delete, sender=Bid)
+def refresh_bid_state_on_bid_change(sender, instance, raw=False, origin=None, **kwargs):
+    # Services maintain the columns under the auction lock and flag their
+    # saves; this catches everything else.
+    if raw or getattr(instance, "_bid_state_synced", False):
+        return
+    if isinstance(origin, Auction) or getattr(origin, "model", None) is Auction:
+        return
+    refresh_bid_state(instance.auction_id)
@@ -11,6 +11,8 @@ urlpatterns = [
     path("<int:pk>/bid/", views.place_bid_view, name="place_bid"),
     path("<int:pk>/accept/<int:bid_id>/", views.accept_bid_view, name="accept_bid"),
     path("<int:pk>/bids.csv", views.bids_csv, name="bids_csv"),
+    path("<int:pk>/stream/", views.auction_stream, name="stream"),
+    path("<int:pk>/timeline/", views.auction_timeline, name="timeline"),
     path("<int:pk>/bids/partial/", views.bid_ladder_partial, name="bids_partial"),
     path(
         "<int:pk>/seller/bids/partial/",
@@ -1,22 +1,20 @@
-import csv
-
+from asgiref.sync import sync_to_async
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied, ValidationError
-from django.db.models import Count, Max, Q
-from django.http import HttpResponse, HttpResponseForbidden
+from django.db.models import Count
+from django.http import Http404, HttpResponse, HttpResponseBadRequest, HttpResponseForbidden
 from django.conf import settings
 from django.shortcuts import get_object_or_404, redirect, render
-from django.utils import timezone
 from django_ratelimit.decorators import ratelimit
 
 from apps.accounts.decorators import buyer_required, seller_required
-from apps.accounts.utils import is_buyer, is_seller
+from apps.accounts.utils import is_seller
+from .exports import AUCTION_BID_COLUMNS, bid_rows, streaming_csv_response
 from .forms import AuctionForm, BidForm
-from .models import Auction, AuctionEvent, Bid
-from apps.stats.models import PlayerStatsSnapshot
-from apps.accounts.finance import get_or_create_finance_for_user
-from apps.stats.models import PlayerForm
+from .live import auction_topic, release_connection, sse_response
+from .models import Auction, Bid
+from .read_models import load_auction_detail, load_timeline
 from .services import (
     accept_bid,
     close_if_expired,
@@ -24,6 +22,7 @@ from .services import (
     get_minimum_next_bid,
     is_reserve_met,
     place_bid,
+    place_proxy_bid,
 )
 
 
@@ -37,19 +36,14 @@ def auction_list(request):
     auctions = (
         Auction.objects.select_related("player")
         .select_related("player__form")
-        .annotate(
-            top_bid=Max("bids__amount", filter=Q(bids__status=Bid.Status.ACTIVE)),
-            bid_count=Count("bids"),
-        )
+        .annotate(bid_count=Count("bids"))
     )
     if sort == "form_desc":
         auctions = auctions.order_by("-player__form__form_score", "deadline")
     else:
         auctions = auctions.order_by("deadline")
     for auction in auctions:
-        close_if_expired(auction)
-        best = auction.top_bid  # pre-annotated — no extra query
-        auction.best_bid_amount = best
+        best = auction.best_bid_amount
         auction.minimum_next_bid = (
             best + auction.min_increment
             if best is not None and auction.min_increment
@@ -69,75 +63,12 @@ def auction_list(request):
 
 @login_required
 def auction_detail(request, pk: int):
-    auction = get_object_or_404(Auction.objects.select_related("player", "seller"), pk=pk)
-    close_if_expired(auction)
-
-    bid_form = BidForm()
-    can_bid = (
-        is_buyer(request.user)
-        and auction.seller_id != request.user.id
-        and auction.status == Auction.Status.OPEN
-    )
-    bid_ladder = auction.bids.filter(status=Bid.Status.ACTIVE).order_by("-amount", "created_at")
-    seller_bids = auction.bids.select_related("buyer", "buyer__club").order_by("-amount")
-    best_bid = get_best_bid_amount(auction)
-    bid_count = auction.bids.count()
-    bids_per_hour = 0.0
-    if bid_count:
-        first_bid_time = (
-            auction.bids.order_by("created_at").values_list("created_at", flat=True).first()
-        )
-        hours = max((timezone.now() - first_bid_time).total_seconds() / 3600, 1 / 60)
-        bids_per_hour = round(bid_count / hours, 1)
-
-    minimum_next = get_minimum_next_bid(auction)
-    reserve_met = is_reserve_met(auction)
-
-    latest_snapshot = (
-        PlayerStatsSnapshot.objects.filter(player=auction.player).order_by("-as_of").first()
-    )
-    form = PlayerForm.objects.filter(player=auction.player).first()
-    finance = None
-    if can_bid and hasattr(request.user, "club"):
-        finance = get_or_create_finance_for_user(request.user)
-
-    timeline_events = []
-    for event in auction.events.order_by("created_at"):
-        if event.event_type == AuctionEvent.EventType.BID_PLACED:
-            label = "Bid placed"
-        elif event.event_type == AuctionEvent.EventType.BID_REPLACED:
-            label = "Bid updated"
-        elif event.event_type == AuctionEvent.EventType.BID_ACCEPTED:
-            label = "Bid accepted"
-        elif event.event_type == AuctionEvent.EventType.AUCTION_EXTENDED:
-            label = "Deadline extended"
-        else:
-            label = "Auction closed"
-        timeline_events.append({"label": label, "created_at": event.created_at})
-
-    context = {
-        "auction": auction,
-        "bid_form": bid_form,
-        "can_bid": can_bid,
-        "is_owner": is_seller(request.user) and auction.seller_id == request.user.id,
-        "bid_ladder": bid_ladder,
-        "seller_bids": seller_bids,
-        "latest_snapshot": latest_snapshot,
-        "player_form": form,
-        "best_bid": best_bid,
-        "minimum_next": minimum_next,
-        "bid_count": bid_count,
-        "bids_per_hour": bids_per_hour,
-        "reserve_met": reserve_met,
-        "finance": finance,
-        "events": timeline_events,
-    }
-    buyer_active_bid = None
-    if is_buyer(request.user):
-        buyer_active_bid = auction.bids.filter(
-            buyer=request.user, status=Bid.Status.ACTIVE
-        ).first()
-    context["buyer_active_bid"] = buyer_active_bid
+    try:
+        detail = load_auction_detail(pk, request.user)
+    except Auction.DoesNotExist:
+        raise Http404
+    context = detail.as_context()
+    context["bid_form"] = BidForm()
     return render(request, "auctions/auction_detail.html", context)
 
 
@@ -163,9 +94,9 @@ def place_bid_view(request, pk: int):
     if getattr(request, "limited", False):
         return HttpResponse("Rate limit exceeded. Please wait and try again.", status=429)
     auction = get_object_or_404(Auction, pk=pk)
-    close_if_expired(auction)
     if request.method != "POST":
         return HttpResponseForbidden("Invalid method")
+    close_if_expired(auction)
 
     form = BidForm(request.POST)
     if not form.is_valid():
@@ -173,14 +104,24 @@ def place_bid_view(request, pk: int):
         return redirect("auctions:detail", pk=pk)
 
     try:
-        place_bid(
-            auction,
-            request.user,
-            amount=form.cleaned_data["amount"],
-            wage_offer_weekly=form.cleaned_data["wage_offer_weekly"],
-            notes=form.cleaned_data.get("notes", ""),
-        )
-        messages.success(request, "Bid placed.")
+        if form.cleaned_data.get("proxy"):
+            bid = place_proxy_bid(
+                auction,
+                request.user,
+                max_amount=form.cleaned_data["amount"],
+                wage_offer_weekly=form.cleaned_data["wage_offer_weekly"],
+                notes=form.cleaned_data.get("notes", ""),
+            )
+            messages.success(request, f"Maximum registered. Your bid stands at £{bid.amount:,.2f}.")
+        else:
+            place_bid(
+                auction,
+                request.user,
+                amount=form.cleaned_data["amount"],
+                wage_offer_weekly=form.cleaned_data["wage_offer_weekly"],
+                notes=form.cleaned_data.get("notes", ""),
+            )
+            messages.success(request, "Bid placed.")
     except PermissionDenied:
         return HttpResponseForbidden("You cannot bid on this auction")
     except ValidationError as exc:
@@ -197,9 +138,9 @@ def accept_bid_view(request, pk: int, bid_id: int):
     if getattr(request, "limited", False):
         return HttpResponse("Rate limit exceeded. Please wait and try again.", status=429)
     auction = get_object_or_404(Auction, pk=pk)
-    close_if_expired(auction)
     if request.method != "POST":
         return HttpResponseForbidden("Invalid method")
+    close_if_expired(auction)
     if auction.seller_id != request.user.id:
         return HttpResponseForbidden("Not your auction")
 
@@ -215,7 +156,6 @@ def accept_bid_view(request, pk: int, bid_id: int):
 @login_required
 def bid_ladder_partial(request, pk: int):
     auction = get_object_or_404(Auction, pk=pk)
-    close_if_expired(auction)
     bids = auction.bids.filter(status=Bid.Status.ACTIVE).order_by("-amount", "created_at")
     best_bid = get_best_bid_amount(auction)
     minimum_next = get_minimum_next_bid(auction)
@@ -233,10 +173,40 @@ def bid_ladder_partial(request, pk: int):
     )
 
 
+@login_required
+def auction_timeline(request, pk: int):
+    if not Auction.objects.filter(pk=pk).exists():
+        raise Http404
+    cursor = request.GET.get("before")
+    try:
+        page = load_timeline(pk, cursor)
+    except ValueError:
+        return HttpResponseBadRequest("Invalid cursor")
+    return render(
+        request,
+        "auctions/_timeline.html",
+        {"auction_id": pk, "page": page, "first_page": not cursor},
+    )
+
+
+def _auction_exists(pk: int) -> bool:
+    exists = Auction.objects.filter(pk=pk).exists()
+    release_connection()
+    return exists
+
+
+@login_required
+async def auction_stream(request, pk: int):
+    # Pushes ladder/deadline changes; the page re-fetches its partials on
+    # each message instead of polling.
+    if not await sync_to_async(_auction_exists)(pk):
+        raise Http404
+    return sse_response(request, [auction_topic(pk)])
+
+
 @login_required
 def seller_bid_table_partial(request, pk: int):
     auction = get_object_or_404(Auction, pk=pk)
-    close_if_expired(auction)
     if not (is_seller(request.user) and auction.seller_id == request.user.id):
         return HttpResponseForbidden("Not allowed")
 
@@ -252,32 +222,10 @@ def bids_csv(request, pk: int):
     if auction.seller_id != request.user.id:
         return HttpResponseForbidden("Not your auction")
 
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = f'attachment; filename="auction_{auction.id}_bids.csv"'
-    writer = csv.writer(response)
-    writer.writerow(
-        [
-            "bid_id",
-            "created_at",
-            "buyer_club_name",
-            "amount",
-            "wage_offer_weekly",
-            "status",
-            "notes",
-        ]
+    bids = auction.bids.order_by("created_at", "id")
+    return streaming_csv_response(
+        request,
+        f"auction_{auction.id}_bids.csv",
+        AUCTION_BID_COLUMNS,
+        bid_rows(bids, AUCTION_BID_COLUMNS),
     )
-
-    bids = auction.bids.select_related("buyer__club").order_by("created_at")
-    for bid in bids:
-        writer.writerow(
-            [
-                bid.id,
-                bid.created_at.isoformat(),
-                bid.buyer.club.name if hasattr(bid.buyer, "club") else "",
-                bid.amount,
-                bid.wage_offer_weekly or "",
-                bid.status,
-                bid.notes,
-            ]
-        )
-    return response
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.accounts.counters import refresh_club_counters
+from .models import Deal
+
+
+@receiver(post_save, sender=Deal)
+@receiver(post_delete, sender=Deal)
+def refresh_deal_counters(sender, instance, **kwargs):
+    # Deal writes are rare, so recount both clubs (after commit) rather than
+    # track which status moved where.
+    refresh_club_counters([instance.buyer_club_id, instance.seller_club_id], ["deals_active"])
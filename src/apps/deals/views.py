@@ -5,6 +5,7 @@ from django.db import models, transaction
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
 
+from apps.accounts.counters import request_counters
 from apps.marketplace.services import get_actor_club
 from apps.notifications.models import Notification
 from apps.notifications.utils import create_notification
@@ -68,13 +69,7 @@ def deal_count_context(request):
     user = getattr(request, "user", None)
     if not user or not user.is_authenticated or not hasattr(user, "club"):
         return {"deal_count": 0}
-    club = user.club
-    count = Deal.objects.filter(
-        status=Deal.Status.IN_PROGRESS,
-    ).filter(
-        models.Q(buyer_club=club) | models.Q(seller_club=club)
-    ).count()
-    return {"deal_count": count}
+    return {"deal_count": request_counters(request)["deals_active"]}
 
 
 @login_required
@@ -0,0 +1,44 @@
+REGRESSION = "regression"
+IMPROVEMENT = "improvement"
+UNCHANGED = "ok"
+ADDED = "new"
+REMOVED = "missing"
+
+
+def compare_runs(baseline: dict, candidate: dict, *, threshold: float = 0.2, min_delta_ms: float = 5.0):
+    # A case regresses when its median slows by more than ``threshold`` (and
+    # by at least ``min_delta_ms``, so noise on fast cases is ignored) or when
+    # it issues more queries than before.
+    rows = []
+    base_cases = baseline.get("cases", {})
+    new_cases = candidate.get("cases", {})
+    for name in sorted(set(base_cases) | set(new_cases)):
+        before = base_cases.get(name)
+        after = new_cases.get(name)
+        if before is None or after is None:
+            rows.append(
+                {"case": name, "status": ADDED if before is None else REMOVED}
+            )
+            continue
+        delta = after["median_ms"] - before["median_ms"]
+        ratio = after["median_ms"] / before["median_ms"] if before["median_ms"] else 0.0
+        status = UNCHANGED
+        if after["queries"] > before["queries"] or (
+            delta >= min_delta_ms and ratio > 1 + threshold
+        ):
+            status = REGRESSION
+        elif -delta >= min_delta_ms and ratio < 1 - threshold and after["queries"] <= before["queries"]:
+            status = IMPROVEMENT
+        rows.append(
+            {
+                "case": name,
+                "status": status,
+                "before_ms": before["median_ms"],
+                "after_ms": after["median_ms"],
+                "delta_ms": round(delta, 3),
+                "ratio": round(ratio, 3),
+                "before_queries": before["queries"],
+                "after_queries": after["queries"],
+            }
+        )
+    return rows
@@ -0,0 +1,214 @@
+import itertools
+import json
+import statistics
+import time
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count
+from django.http import QueryDict
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.accounts.models import Club
+from apps.players.models import Player
+from apps.stats.models import PlayerStats, PlayerStatsSnapshot
+from ..facets import player_market_facets
+from ..models import Listing, ListingInvite, Offer
+from ..pagination import CursorPaginator
+from ..query import (
+    LISTING_SORTS,
+    PLAYER_SORTS,
+    club_search_queryset,
+    club_sort_keys,
+    listing_search_queryset,
+    listing_sort_keys,
+    player_search_queryset,
+    player_sort_keys,
+)
+from ..visibility import private_listing_ids
+
+PAGE_SIZE = 24
+PLAYER_FILTERS = {
+    "all": {},
+    "position": {"position": "MID"},
+    "transfer": {"availability": ["transfer"]},
+    "transfer_or_loan": {"availability": ["transfer", "loan"]},
+    "listed": {"listed_only": "1"},
+    "free_agents": {"free_agent_only": "1"},
+    "age_band": {"min_age": "21", "max_age": "25"},
+    "hot_form": {"min_form": "70"},
+    "name": {"q": "silva"},
+    "nationality_position": {"nationality": "Spain", "position": "FWD"},
+}
+LISTING_FILTERS = {
+    "all": {},
+    "loan": {"type": Listing.ListingType.LOAN},
+    "position": {"position": "DEF"},
+    "price_band": {"min_price": "1000000", "max_price": "20000000"},
+}
+CLUB_FILTERS = {
+    "all": {},
+    "name": {"q": "athletic"},
+    "country": {"country": "Spain"},
+    "verified": {"verified_status": "VERIFIED"},
+}
+
+
+def _query_dict(params: dict) -> QueryDict:
+    query = QueryDict(mutable=True)
+    for key, value in params.items():
+        query.setlist(key, value if isinstance(value, list) else [value])
+    return query
+
+
+def bench_actors() -> dict:
+    # A club that can see invite-only listings and one that cannot; both are
+    # picked deterministically so runs against the same seed are comparable.
+    invited = (
+        Club.objects.annotate(invites=Count("listing_invites"))
+        .filter(invites__gt=0)
+        .order_by("-invites", "pk")
+        .first()
+    )
+    plain = next(
+        (club for club in Club.objects.order_by("pk")[:200] if not private_listing_ids(club)),
+        None,
+    )
+    actors = {"anonymous": None}
+    if plain:
+        actors["club"] = plain
+    if invited:
+        actors["invited_club"] = invited
+    return actors
+
+
+def _player_case(actor, params):
+    facets = player_market_facets(actor, params)
+    paginator = CursorPaginator(
+        player_search_queryset(actor, params),
+        PAGE_SIZE,
+        player_sort_keys(params),
+        count=facets["total"],
+    )
+    return paginator
+
+
+def _listing_case(actor, params):
+    return CursorPaginator(
+        listing_search_queryset(actor, params), PAGE_SIZE, listing_sort_keys(params)
+    )
+
+
+def _club_case(actor, params):
+    return CursorPaginator(club_search_queryset(params), PAGE_SIZE, club_sort_keys(params))
+
+
+def build_cases(actors: dict) -> dict:
+    cases = {}
+    player_sorts = [sort for sort in PLAYER_SORTS if sort != "performance"] + ["relevance"]
+    for (actor_name, actor), sort, (filter_name, params) in itertools.product(
+        actors.items(), player_sorts, PLAYER_FILTERS.items()
+    ):
+        if sort == "relevance" and "q" not in params:
+            continue
+        cases[f"players/{actor_name}/{sort}/{filter_name}"] = (
+            _player_case,
+            actor,
+            {**params, "sort": sort},
+        )
+    for (actor_name, actor), sort, (filter_name, params) in itertools.product(
+        actors.items(), LISTING_SORTS, LISTING_FILTERS.items()
+    ):
+        cases[f"listings/{actor_name}/{sort}/{filter_name}"] = (
+            _listing_case,
+            actor,
+            {**params, "sort": sort},
+        )
+    for filter_name, params in CLUB_FILTERS.items():
+        cases[f"clubs/anonymous/name/{filter_name}"] = (_club_case, None, params)
+    return cases
+
+
+def _run_once(build, actor, params):
+    # First page, its total, and the keyset seek to page two — what a user
+    # paging through results actually costs.
+    paginator = build(actor, params)
+    page = paginator.get_page(None)
+    total = paginator.count
+    if page.has_next() and total:
+        paginator.get_page(page.next_page_number())
+
+
+def _explain(sql: str) -> dict:
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return {
+        "sql": sql,
+        "planning_ms": plan[0].get("Planning Time"),
+        "execution_ms": plan[0].get("Execution Time"),
+        "plan": plan[0]["Plan"],
+    }
+
+
+def run_case(build, actor, params, *, repeat: int = 3, explain: bool = True) -> dict:
+    query = _query_dict(params)
+    times = []
+    for _ in range(repeat):
+        cache.clear()
+        started = time.perf_counter()
+        _run_once(build, actor, query)
+        times.append((time.perf_counter() - started) * 1000)
+
+    cache.clear()
+    with CaptureQueriesContext(connection) as captured:
+        _run_once(build, actor, query)
+    plans = []
+    if explain and connection.vendor == "postgresql":
+        plans = [
+            _explain(entry["sql"])
+            for entry in captured.captured_queries
+            if entry["sql"].lstrip().upper().startswith("SELECT")
+        ]
+    return {
+        "params": params,
+        "times_ms": [round(value, 3) for value in times],
+        "median_ms": round(statistics.median(times), 3),
+        "min_ms": round(min(times), 3),
+        "queries": len(captured),
+        "plans": plans,
+    }
+
+
+def table_sizes() -> dict:
+    return {
+        "players": Player.objects.count(),
+        "player_stats": PlayerStats.objects.count(),
+        "snapshots": PlayerStatsSnapshot.objects.count(),
+        "listings": Listing.objects.count(),
+        "invites": ListingInvite.objects.count(),
+        "offers": Offer.objects.count(),
+    }
+
+
+def run_benchmarks(*, repeat: int = 3, only: str = "", explain: bool = True, log=None) -> dict:
+    log = log or (lambda message: None)
+    cases = build_cases(bench_actors())
+    results = {}
+    for name, (build, actor, params) in cases.items():
+        if only and only not in name:
+            continue
+        results[name] = run_case(build, actor, params, repeat=repeat, explain=explain)
+        log(f"{name}: {results[name]['median_ms']}ms, {results[name]['queries']} queries")
+    return {
+        "meta": {
+            "created_at": timezone.now().isoformat(),
+            "vendor": connection.vendor,
+            "repeat": repeat,
+            "tables": table_sizes(),
+        },
+        "cases": results,
+    }
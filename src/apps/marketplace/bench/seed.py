@@ -0,0 +1,279 @@
+import random
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from apps.accounts.models import Club, ClubFinance
+from apps.players.models import Contract, Player
+from apps.stats.models import PlayerForm, PlayerStats, PlayerStatsSnapshot
+from ..listing_counters import rebuild_listing_counters
+from ..market_index import rebuild_player_market_index
+from ..models import Listing, ListingInvite, Offer
+from ..search import normalize_search_text
+
+# Row counts at --scale 1. Stats and snapshots are per player.
+FULL_SCALE = {
+    "clubs": 2_000,
+    "players": 200_000,
+    "stats_per_player": 5,
+    "snapshots_per_player": 5,
+    "listings": 50_000,
+    "offers": 500_000,
+}
+BENCH_PREFIX = "bench"
+BATCH_SIZE = 5_000
+BASE_TIME = datetime(2025, 7, 1, tzinfo=UTC)
+SEASONS = [2021, 2022, 2023, 2024, 2025]
+LEAGUES = [39, 140, 135, 78, 61]
+COUNTRIES = ["England", "Spain", "Italy", "Germany", "France", "Brazil", "Argentina", "Portugal"]
+FIRST_NAMES = ["Luca", "João", "Mateo", "Noah", "Kylian", "Erling", "Pedri", "Bukayo", "Jamal", "Søren"]
+LAST_NAMES = ["Silva", "Müller", "García", "Rossi", "Dubois", "Hernández", "Kovačić", "Smith", "Öztürk"]
+OFFER_STATUSES = [
+    (Offer.Status.DRAFT, 5),
+    (Offer.Status.SENT, 35),
+    (Offer.Status.COUNTERED, 10),
+    (Offer.Status.ACCEPTED, 5),
+    (Offer.Status.REJECTED, 25),
+    (Offer.Status.WITHDRAWN, 10),
+    (Offer.Status.EXPIRED, 10),
+]
+
+
+def scaled_counts(scale: float) -> dict:
+    counts = {key: value for key, value in FULL_SCALE.items() if not key.endswith("_per_player")}
+    counts = {key: max(1, int(value * scale)) for key, value in counts.items()}
+    counts["clubs"] = max(counts["clubs"], 4)
+    counts["stats_per_player"] = FULL_SCALE["stats_per_player"]
+    counts["snapshots_per_player"] = FULL_SCALE["snapshots_per_player"]
+    return counts
+
+
+def bench_data_exists() -> bool:
+    return get_user_model().objects.filter(username__startswith=f"{BENCH_PREFIX}_").exists()
+
+
+def clear_bench_data() -> None:
+    users = get_user_model().objects.filter(username__startswith=f"{BENCH_PREFIX}_")
+    clubs = Club.objects.filter(user__in=users)
+    with transaction.atomic():
+        Offer.objects.filter(from_club__in=clubs).delete()
+        Listing.objects.filter(listed_by_club__in=clubs).delete()
+        Contract.objects.filter(club__in=clubs).delete()
+        Player.objects.filter(created_by__in=users).delete()
+        users.delete()
+
+
+def _batched(rows, model, **kwargs):
+    batch = []
+    created = 0
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            model.objects.bulk_create(batch, **kwargs)
+            created += len(batch)
+            batch = []
+    if batch:
+        model.objects.bulk_create(batch, **kwargs)
+        created += len(batch)
+    return created
+
+
+def _weighted(rng, choices):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights=weights)[0]
+
+
+def seed_world(*, scale: float = 1.0, seed: int = 7, log=None) -> dict:
+    # Deterministic for a given (scale, seed). bulk_create skips signals, so
+    # derived columns (search_name, market index, offer counters) are filled
+    # explicitly at the end.
+    rng = random.Random(seed)
+    counts = scaled_counts(scale)
+    log = log or (lambda message: None)
+    User = get_user_model()
+
+    User.objects.bulk_create(
+        User(username=f"{BENCH_PREFIX}_club_{index}", password="!")
+        for index in range(counts["clubs"])
+    )
+    users = list(User.objects.filter(username__startswith=f"{BENCH_PREFIX}_").order_by("pk"))
+    names = [
+        f"{COUNTRIES[index % len(COUNTRIES)]} Athletic {index}" for index in range(len(users))
+    ]
+    Club.objects.bulk_create(
+        Club(
+            user=user,
+            name=name,
+            search_name=normalize_search_text(name),
+            country=COUNTRIES[index % len(COUNTRIES)],
+            league_name=f"League {LEAGUES[index % len(LEAGUES)]}",
+            verified_status=rng.choice(["UNVERIFIED", "PENDING", "VERIFIED"]),
+        )
+        for index, (user, name) in enumerate(zip(users, names))
+    )
+    clubs = list(Club.objects.filter(user__in=users).order_by("pk"))
+    ClubFinance.objects.bulk_create(ClubFinance(club=club) for club in clubs)
+    log(f"clubs={len(clubs)}")
+
+    creator = users[0]
+    positions = [choice for choice, _ in Player.Position.choices]
+
+    def players():
+        for index in range(counts["players"]):
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {index}"
+            free_agent = rng.random() < 0.1
+            yield Player(
+                name=name,
+                search_name=normalize_search_text(name),
+                age=rng.randint(16, 38) if rng.random() > 0.02 else None,
+                nationality=rng.choice(COUNTRIES),
+                position=rng.choice(positions),
+                current_club=None if free_agent else rng.choice(clubs),
+                visibility=_weighted(
+                    rng,
+                    [
+                        (Player.Visibility.PUBLIC, 70),
+                        (Player.Visibility.CLUBS_ONLY, 25),
+                        (Player.Visibility.PRIVATE, 5),
+                    ],
+                ),
+                status=Player.Status.FREE_AGENT if free_agent else Player.Status.CONTRACTED,
+                open_to_offers=rng.random() < 0.15,
+                created_by=creator,
+            )
+
+    log(f"players={_batched(players(), Player)}")
+    player_rows = list(
+        Player.objects.filter(created_by=creator)
+        .order_by("pk")
+        .values_list("pk", "current_club_id", "position")
+    )
+
+    def forms():
+        for player_id, _, _ in player_rows:
+            yield PlayerForm(
+                player_id=player_id,
+                as_of=BASE_TIME,
+                season=SEASONS[-1],
+                league_id=rng.choice(LEAGUES),
+                form_score=round(rng.uniform(0, 100), 2),
+                avg_rating=round(rng.uniform(5.5, 8.5), 2),
+            )
+
+    def contracts():
+        for player_id, club_id, _ in player_rows:
+            if club_id:
+                yield Contract(
+                    player_id=player_id,
+                    club_id=club_id,
+                    start_date=(BASE_TIME - timedelta(days=rng.randint(30, 1500))).date(),
+                    end_date=(BASE_TIME + timedelta(days=rng.randint(30, 1800))).date(),
+                    wage_weekly=Decimal(rng.randint(1, 300)) * 1000,
+                )
+
+    def season_stats():
+        for index, (player_id, club_id, position) in enumerate(player_rows):
+            for season in SEASONS[-counts["stats_per_player"]:]:
+                yield PlayerStats(
+                    player_id=player_id,
+                    current_club_id=club_id,
+                    vendor="bench",
+                    league_id=LEAGUES[index % len(LEAGUES)],
+                    season=season,
+                    position=position,
+                    minutes=rng.randint(0, 3400),
+                    goals=rng.randint(0, 30),
+                    assists=rng.randint(0, 20),
+                    avg_rating=round(rng.uniform(5.5, 8.5), 2),
+                    form_score=round(rng.uniform(0, 100), 2),
+                )
+
+    def snapshots():
+        for index, (player_id, _, _) in enumerate(player_rows):
+            for offset in range(counts["snapshots_per_player"]):
+                yield PlayerStatsSnapshot(
+                    player_id=player_id,
+                    vendor="bench",
+                    as_of=BASE_TIME - timedelta(weeks=offset),
+                    season=SEASONS[-1],
+                    league_id=LEAGUES[index % len(LEAGUES)],
+                    minutes=rng.randint(0, 90),
+                    goals=rng.randint(0, 2),
+                    assists=rng.randint(0, 2),
+                    rating=round(rng.uniform(5.5, 8.5), 2),
+                )
+
+    log(f"forms={_batched(forms(), PlayerForm)}")
+    log(f"contracts={_batched(contracts(), Contract)}")
+    log(f"player_stats={_batched(season_stats(), PlayerStats)}")
+    log(f"snapshots={_batched(snapshots(), PlayerStatsSnapshot)}")
+
+    listed = rng.sample(player_rows, min(counts["listings"], len(player_rows)))
+
+    def listings():
+        for player_id, club_id, _ in listed:
+            yield Listing(
+                player_id=player_id,
+                listed_by_club_id=club_id or rng.choice(clubs).pk,
+                listing_type=_weighted(
+                    rng,
+                    [
+                        (Listing.ListingType.TRANSFER, 70),
+                        (Listing.ListingType.LOAN, 20),
+                        (Listing.ListingType.FREE_AGENT, 10),
+                    ],
+                ),
+                visibility=Listing.Visibility.INVITE_ONLY
+                if rng.random() < 0.1
+                else Listing.Visibility.PUBLIC,
+                asking_price=Decimal(rng.randint(1, 500)) * 100_000 if rng.random() > 0.1 else None,
+                status=_weighted(
+                    rng,
+                    [
+                        (Listing.Status.OPEN, 80),
+                        (Listing.Status.CLOSED, 15),
+                        (Listing.Status.WITHDRAWN, 5),
+                    ],
+                ),
+            )
+
+    log(f"listings={_batched(listings(), Listing)}")
+    listing_rows = list(
+        Listing.objects.filter(listed_by_club__in=clubs)
+        .order_by("pk")
+        .values_list("pk", "player_id", "listed_by_club_id", "visibility")
+    )
+
+    def invites():
+        for listing_id, _, seller_id, visibility in listing_rows:
+            if visibility != Listing.Visibility.INVITE_ONLY:
+                continue
+            for club in rng.sample(clubs, min(len(clubs), rng.randint(1, 5))):
+                if club.pk != seller_id:
+                    yield ListingInvite(listing_id=listing_id, club=club)
+
+    log(f"invites={_batched(invites(), ListingInvite, ignore_conflicts=True)}")
+
+    def offers():
+        for _ in range(counts["offers"]):
+            listing_id, player_id, seller_id, _ = rng.choice(listing_rows)
+            buyer = rng.choice(clubs)
+            yield Offer(
+                player_id=player_id,
+                listing_id=listing_id,
+                from_club=buyer,
+                to_club_id=seller_id,
+                fee_amount=Decimal(rng.randint(1, 500)) * 100_000,
+                wage_weekly=Decimal(rng.randint(1, 300)) * 1000,
+                status=_weighted(rng, OFFER_STATUSES),
+                expires_at=BASE_TIME + timedelta(days=rng.randint(-30, 30)),
+            )
+
+    log(f"offers={_batched(offers(), Offer)}")
+
+    rebuild_player_market_index()
+    rebuild_listing_counters()
+    log("derived columns rebuilt")
+    return counts
@@ -0,0 +1,152 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from apps.accounts.models import Club
+from apps.players.models import Player
+from .models import Listing
+from .query import (
+    _get_multi_values,
+    availability_filter,
+    player_base_queryset,
+    player_facet_filters,
+)
+from .result_cache import PLAYERS, generation, visibility_scope
+
+FACET_PARAMS = [
+    "q",
+    "nationality",
+    "club",
+    "position",
+    "free_agent_only",
+    "listed_only",
+    "min_form",
+    "max_form",
+    "min_age",
+    "max_age",
+]
+AVAILABILITY_OPTIONS = [
+    ("transfer", "Transfer"),
+    ("loan", "Loan"),
+    ("free_agent", "Free agent"),
+    ("open_to_offers", "Open to offers"),
+]
+FACET_TITLES = {
+    "position": "Position",
+    "availability": "Availability",
+    "age": "Age",
+    "form": "Form",
+    "listed_only": "Listed",
+    "free_agent_only": "Without club",
+}
+# (value, label, lower bound, upper bound); age bounds are inclusive.
+AGE_BANDS = [
+    ("u21", "Under 21", None, 20),
+    ("21_25", "21-25", 21, 25),
+    ("26_29", "26-29", 26, 29),
+    ("30_plus", "30+", 30, None),
+]
+FORM_BANDS = [
+    ("cold", "Under 40", None, 40),
+    ("steady", "40-59", 40, 60),
+    ("good", "60-79", 60, 80),
+    ("hot", "80+", 80, None),
+]
+
+
+def _age_band(low, high) -> Q:
+    condition = Q(age__isnull=False)
+    if low is not None:
+        condition &= Q(age__gte=low)
+    if high is not None:
+        condition &= Q(age__lte=high)
+    return condition
+
+
+def _form_band(low, high) -> Q:
+    # Upper bound exclusive: form scores are floats.
+    condition = Q(form__form_score__isnull=False)
+    if low is not None:
+        condition &= Q(form__form_score__gte=low)
+    if high is not None:
+        condition &= Q(form__form_score__lt=high)
+    return condition
+
+
+def _facet_options(actor_club: Club | None):
+    return {
+        "position": [
+            (value, label, Q(position=value)) for value, label in Player.Position.choices
+        ],
+        "availability": [
+            (value, label, availability_filter(actor_club, value))
+            for value, label in AVAILABILITY_OPTIONS
+        ],
+        "age": [(value, label, _age_band(low, high)) for value, label, low, high in AGE_BANDS],
+        "form": [
+            (value, label, _form_band(low, high)) for value, label, low, high in FORM_BANDS
+        ],
+        "listed_only": [("1", "Open listing", Q(listings__status=Listing.Status.OPEN))],
+        "free_agent_only": [("1", "No club", Q(current_club__isnull=True))],
+    }
+
+
+def _cache_key(actor_club: Club | None, params) -> str:
+    scope = visibility_scope(actor_club)
+    filters = {key: params.get(key, "") for key in FACET_PARAMS}
+    filters["availability"] = sorted(
+        value.lower() for value in _get_multi_values(params, "availability")
+    )
+    digest = hashlib.sha1(json.dumps(filters, sort_keys=True).encode()).hexdigest()
+    return f"marketplace:facets:{generation(PLAYERS)}:{scope}:{digest}"
+
+
+def _count_facets(actor_club: Club | None, params):
+    # Each option is counted against every active filter except its own
+    # group's, so selecting a position still shows the other positions' counts.
+    active = player_facet_filters(actor_club, params)
+    options = _facet_options(actor_club)
+    aggregates = {}
+
+    def _others(group):
+        condition = Q()
+        for other, other_filter in active.items():
+            if other != group:
+                condition &= other_filter
+        return condition
+
+    aggregates["total"] = Count("pk", distinct=True, filter=_others(None))
+    for group, choices in options.items():
+        others = _others(group)
+        for index, (_, _, condition) in enumerate(choices):
+            aggregates[f"{group}_{index}"] = Count(
+                "pk", distinct=True, filter=others & condition
+            )
+
+    counts = player_base_queryset(actor_club, params).order_by().aggregate(**aggregates)
+    return {
+        "total": counts["total"],
+        "groups": [
+            {
+                "name": group,
+                "title": FACET_TITLES[group],
+                "options": [
+                    {"value": value, "label": label, "count": counts[f"{group}_{index}"]}
+                    for index, (value, label, _) in enumerate(choices)
+                ],
+            }
+            for group, choices in options.items()
+        ],
+    }
+
+
+def player_market_facets(actor_club: Club | None, params):
+    key = _cache_key(actor_club, params)
+    facets = cache.get(key)
+    if facets is None:
+        facets = _count_facets(actor_club, params)
+        cache.set(key, facets, settings.TRANSFERX_FACET_CACHE_SECONDS)
+    return facets
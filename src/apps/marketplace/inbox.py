@@ -0,0 +1,19 @@
+from django.db.models.functions import Left
+
+from .models import OfferMessage
+
+MESSAGE_PREVIEW_LENGTH = 120
+
+
+def latest_messages(offer_ids, preview_length: int = MESSAGE_PREVIEW_LENGTH) -> dict:
+    # Newest message per offer in one DISTINCT ON query. Bodies stay deferred;
+    # ``preview`` carries one character past the limit so truncatechars still
+    # knows to add its ellipsis.
+    messages = (
+        OfferMessage.objects.filter(offer_id__in=offer_ids)
+        .order_by("offer_id", "-created_at", "-id")
+        .distinct("offer_id")
+        .only("id", "offer_id", "created_at")
+        .annotate(preview=Left("body", preview_length + 1))
+    )
+    return {message.offer_id: message for message in messages}
@@ -0,0 +1,91 @@
+from django.db.models import Count, F, IntegerField, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import Listing, Offer, OfferEvent
+from .result_cache import LISTINGS, bump_generation
+
+COUNTER_FIELDS = ["offers_count", "active_offers_count", "last_offer_at"]
+ACTIVE_STATUSES = [Offer.Status.SENT, Offer.Status.COUNTERED]
+
+
+def adjust_listing_counters(listing_id, *, offers: int = 0, active: int = 0, offered_at=None):
+    # Called inside the offer service's transaction; F() keeps concurrent
+    # offers on the same listing from losing updates.
+    if not listing_id:
+        return
+    changes = {}
+    if offers:
+        changes["offers_count"] = F("offers_count") + offers
+    if active:
+        changes["active_offers_count"] = F("active_offers_count") + active
+    if offered_at:
+        changes["last_offer_at"] = offered_at
+    if changes:
+        Listing.objects.filter(pk=listing_id).update(**changes)
+        # .update() skips post_save; "most contested" ordering depends on these.
+        bump_generation(LISTINGS)
+
+
+def _expected_counters():
+    def _count(status_filter):
+        return Coalesce(
+            Subquery(
+                Offer.objects.filter(status_filter, listing=OuterRef("pk"))
+                .order_by()
+                .values("listing")
+                .annotate(total=Count("pk"))
+                .values("total")[:1],
+                output_field=IntegerField(),
+            ),
+            0,
+        )
+
+    last_sent = (
+        OfferEvent.objects.filter(
+            offer__listing=OuterRef("pk"), event_type=OfferEvent.EventType.SENT
+        )
+        .order_by()
+        .values("offer__listing")
+        .annotate(latest=Max("created_at"))
+        .values("latest")[:1]
+    )
+    return Listing.objects.annotate(
+        expected_offers_count=_count(~Q(status=Offer.Status.DRAFT)),
+        expected_active_offers_count=_count(Q(status__in=ACTIVE_STATUSES)),
+        expected_last_offer_at=Subquery(last_sent),
+    )
+
+
+def _mismatched(listing) -> bool:
+    return any(getattr(listing, field) != getattr(listing, f"expected_{field}") for field in COUNTER_FIELDS)
+
+
+def verify_listing_counters(batch_size: int = 1000) -> list[int]:
+    mismatched = []
+    last_id = 0
+    while True:
+        batch = list(_expected_counters().filter(pk__gt=last_id).order_by("pk")[:batch_size])
+        if not batch:
+            break
+        mismatched.extend(listing.pk for listing in batch if _mismatched(listing))
+        last_id = batch[-1].pk
+    return mismatched
+
+
+def rebuild_listing_counters(batch_size: int = 1000) -> int:
+    fixed = 0
+    last_id = 0
+    while True:
+        batch = list(_expected_counters().filter(pk__gt=last_id).order_by("pk")[:batch_size])
+        if not batch:
+            break
+        stale = [listing for listing in batch if _mismatched(listing)]
+        for listing in stale:
+            for field in COUNTER_FIELDS:
+                setattr(listing, field, getattr(listing, f"expected_{field}"))
+        Listing.objects.bulk_update(stale, COUNTER_FIELDS)
+        fixed += len(stale)
+        last_id = batch[-1].pk
+    if fixed:
+        bump_generation(LISTINGS)
+    return fixed
@@ -0,0 +1,85 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.marketplace.bench.compare import REGRESSION, compare_runs
+from apps.marketplace.bench.runner import run_benchmarks
+from apps.marketplace.bench.seed import bench_data_exists, clear_bench_data, seed_world
+
+
+class Command(BaseCommand):
+    help = "Seed a synthetic market, benchmark discovery queries, and compare runs"
+
+    def add_arguments(self, parser):
+        actions = parser.add_subparsers(dest="action", required=True)
+
+        seed = actions.add_parser("seed", help="Create the synthetic bench world")
+        seed.add_argument("--scale", type=float, default=1.0)
+        seed.add_argument("--seed", type=int, default=7)
+        seed.add_argument("--reset", action="store_true", help="Drop existing bench rows first")
+
+        run = actions.add_parser("run", help="Time every sort/filter case and write JSON")
+        run.add_argument("--output", default="bench-discovery.json")
+        run.add_argument("--repeat", type=int, default=3)
+        run.add_argument("--only", default="", help="Only run cases whose name contains this")
+        run.add_argument("--no-explain", action="store_true")
+
+        compare = actions.add_parser("compare", help="Flag regressions between two runs")
+        compare.add_argument("baseline")
+        compare.add_argument("candidate")
+        compare.add_argument("--threshold", type=float, default=0.2)
+        compare.add_argument("--min-delta-ms", type=float, default=5.0)
+
+    def handle(self, *args, **options):
+        getattr(self, f"_{options['action']}")(options)
+
+    def _seed(self, options):
+        if bench_data_exists():
+            if not options["reset"]:
+                raise CommandError("Bench data already exists; pass --reset to rebuild it")
+            clear_bench_data()
+        counts = seed_world(
+            scale=options["scale"], seed=options["seed"], log=self.stdout.write
+        )
+        summary = ", ".join(f"{key}={value}" for key, value in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"Seeded bench world: {summary}"))
+
+    def _run(self, options):
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be at least 1")
+        result = run_benchmarks(
+            repeat=options["repeat"],
+            only=options["only"],
+            explain=not options["no_explain"],
+            log=self.stdout.write,
+        )
+        Path(options["output"]).write_text(json.dumps(result, indent=2, default=str))
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {len(result['cases'])} cases to {options['output']}")
+        )
+
+    def _compare(self, options):
+        try:
+            baseline = json.loads(Path(options["baseline"]).read_text())
+            candidate = json.loads(Path(options["candidate"]).read_text())
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Could not read bench results: {exc}") from exc
+        rows = compare_runs(
+            baseline,
+            candidate,
+            threshold=options["threshold"],
+            min_delta_ms=options["min_delta_ms"],
+        )
+        for row in rows:
+            if "delta_ms" not in row:
+                self.stdout.write(f"{row['status']:<12} {row['case']}")
+                continue
+            self.stdout.write(
+                f"{row['status']:<12} {row['case']}: {row['before_ms']}ms -> {row['after_ms']}ms "
+                f"({row['ratio']}x), queries {row['before_queries']} -> {row['after_queries']}"
+            )
+        regressions = [row["case"] for row in rows if row["status"] == REGRESSION]
+        if regressions:
+            raise CommandError(f"{len(regressions)} regressed cases: {', '.join(regressions[:20])}")
+        self.stdout.write(self.style.SUCCESS(f"No regressions across {len(rows)} cases"))
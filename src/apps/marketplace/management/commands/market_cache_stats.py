@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.marketplace.result_cache import result_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Show hit/miss counters for the marketplace result cache (needs a shared cache backend)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true")
+
+    def handle(self, *args, **options):
+        stats = result_cache_stats(reset=options["reset"])
+        for kind, counters in stats.items():
+            self.stdout.write(
+                f"{kind}: hits={counters['hits']} misses={counters['misses']} "
+                f"hit_rate={counters['hit_rate']:.1%}"
+            )
+        self.stdout.write(self.style.SUCCESS("Counters reset" if options["reset"] else "Done"))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.marketplace.market_index import rebuild_player_market_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the denormalized player market search index"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        refreshed = rebuild_player_market_index(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Indexed players={refreshed}"))
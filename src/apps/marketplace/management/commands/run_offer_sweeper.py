@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from apps.marketplace.services import expire_overdue_offers
+
+
+class Command(BaseCommand):
+    help = "Expire overdue offers in batches, polling until interrupted (or once with --once)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--interval", type=float, default=30.0, help="Seconds between passes")
+        parser.add_argument("--batch-size", type=int, default=200)
+        parser.add_argument("--once", action="store_true", help="Drain overdue offers and exit")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+        total = 0
+        try:
+            while True:
+                expired = self._drain(options["batch_size"])
+                if expired:
+                    self.stdout.write(f"expired={expired}")
+                total += expired
+                if options["once"]:
+                    break
+                # Long-lived process: drop connections past CONN_MAX_AGE or broken.
+                close_old_connections()
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f"Expired offers={total}"))
+
+    def _drain(self, batch_size):
+        expired = 0
+        while True:
+            batch = expire_overdue_offers(batch_size=batch_size)
+            expired += batch
+            if batch < batch_size:
+                return expired
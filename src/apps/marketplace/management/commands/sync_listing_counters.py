@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.marketplace.listing_counters import rebuild_listing_counters, verify_listing_counters
+
+
+class Command(BaseCommand):
+    help = "Rebuild (or with --verify, check) Listing offer counters from the offers table"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--verify", action="store_true")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if options["verify"]:
+            mismatched = verify_listing_counters(batch_size=options["batch_size"])
+            if mismatched:
+                preview = ", ".join(str(listing_id) for listing_id in mismatched[:20])
+                raise CommandError(f"Stale counters on {len(mismatched)} listings: {preview}")
+            self.stdout.write(self.style.SUCCESS("Listing counters OK"))
+            return
+        fixed = rebuild_listing_counters(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt listings={fixed}"))
@@ -0,0 +1,88 @@
+from django.db.models import F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from apps.players.models import Player
+from apps.stats.models import PlayerStats
+from .models import Listing, PlayerMarketIndex
+
+INDEX_FIELDS = [
+    "latest_rating",
+    "latest_goals",
+    "latest_assists",
+    "latest_minutes",
+    "goals_assists",
+    "listing_type",
+    "market_value",
+    "form_score",
+    "updated_at",
+]
+
+
+def _index_rows(player_ids):
+    latest_stats = PlayerStats.objects.filter(player=OuterRef("pk")).order_by(
+        "-season", "-updated_at", "-id"
+    )
+    public_listings = Listing.objects.filter(
+        player=OuterRef("pk"),
+        status=Listing.Status.OPEN,
+        visibility=Listing.Visibility.PUBLIC,
+    )
+    return (
+        Player.objects.filter(pk__in=player_ids)
+        .annotate(
+            latest_rating=Subquery(latest_stats.values("avg_rating")[:1]),
+            latest_goals=Subquery(latest_stats.values("goals")[:1]),
+            latest_assists=Subquery(latest_stats.values("assists")[:1]),
+            latest_minutes=Subquery(latest_stats.values("minutes")[:1]),
+            listing_type=Subquery(
+                public_listings.order_by("-created_at").values("listing_type")[:1]
+            ),
+            market_value=Subquery(
+                public_listings.order_by(
+                    F("asking_price").desc(nulls_last=True), "-created_at"
+                ).values("asking_price")[:1]
+            ),
+            form_score=F("form__form_score"),
+        )
+        .annotate(
+            goals_assists=Coalesce(F("latest_goals"), Value(0))
+            + Coalesce(F("latest_assists"), Value(0))
+        )
+        .values("pk", *INDEX_FIELDS[:-1])
+    )
+
+
+def refresh_player_market_index(player_ids) -> int:
+    player_ids = {player_id for player_id in player_ids if player_id}
+    if not player_ids:
+        return 0
+    rows = [
+        PlayerMarketIndex(
+            player_id=row.pop("pk"),
+            **{**row, "listing_type": row["listing_type"] or ""},
+        )
+        for row in _index_rows(player_ids)
+    ]
+    PlayerMarketIndex.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["player"],
+        update_fields=INDEX_FIELDS,
+    )
+    return len(rows)
+
+
+def rebuild_player_market_index(batch_size: int = 1000) -> int:
+    refreshed = 0
+    last_id = 0
+    while True:
+        batch = list(
+            Player.objects.filter(pk__gt=last_id)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not batch:
+            break
+        refreshed += refresh_player_market_index(batch)
+        last_id = batch[-1]
+    return refreshed
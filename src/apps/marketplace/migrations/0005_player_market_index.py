@@ -0,0 +1,92 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery
+
+
+def backfill_market_index(apps, schema_editor):
+    Player = apps.get_model("players", "Player")
+    PlayerStats = apps.get_model("stats", "PlayerStats")
+    Listing = apps.get_model("marketplace", "Listing")
+    PlayerMarketIndex = apps.get_model("marketplace", "PlayerMarketIndex")
+
+    latest_stats = PlayerStats.objects.filter(player=OuterRef("pk")).order_by(
+        "-season", "-updated_at", "-id"
+    )
+    public_listings = Listing.objects.filter(
+        player=OuterRef("pk"), status="OPEN", visibility="PUBLIC"
+    )
+    rows = Player.objects.annotate(
+        latest_rating=Subquery(latest_stats.values("avg_rating")[:1]),
+        latest_goals=Subquery(latest_stats.values("goals")[:1]),
+        latest_assists=Subquery(latest_stats.values("assists")[:1]),
+        latest_minutes=Subquery(latest_stats.values("minutes")[:1]),
+        listing_type=Subquery(public_listings.order_by("-created_at").values("listing_type")[:1]),
+        market_value=Subquery(
+            public_listings.order_by(F("asking_price").desc(nulls_last=True), "-created_at")
+            .values("asking_price")[:1]
+        ),
+        form_score=F("form__form_score"),
+    ).values(
+        "pk",
+        "latest_rating",
+        "latest_goals",
+        "latest_assists",
+        "latest_minutes",
+        "listing_type",
+        "market_value",
+        "form_score",
+    )
+    batch = []
+    for row in rows.iterator(chunk_size=1000):
+        batch.append(
+            PlayerMarketIndex(
+                player_id=row["pk"],
+                latest_rating=row["latest_rating"],
+                latest_goals=row["latest_goals"],
+                latest_assists=row["latest_assists"],
+                latest_minutes=row["latest_minutes"],
+                goals_assists=(row["latest_goals"] or 0) + (row["latest_assists"] or 0),
+                listing_type=row["listing_type"] or "",
+                market_value=row["market_value"],
+                form_score=row["form_score"],
+            )
+        )
+        if len(batch) >= 1000:
+            PlayerMarketIndex.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        PlayerMarketIndex.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketplace', '0004_rename_marketplace_offer_status_to_club_idx_marketplace_status_0c934a_idx_and_more'),
+        ('players', '0007_player_photo_url'),
+        ('stats', '0007_remove_playervendormap_unique_vendor_player_id_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerMarketIndex',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('latest_rating', models.FloatField(blank=True, null=True)),
+                ('latest_goals', models.IntegerField(blank=True, null=True)),
+                ('latest_assists', models.IntegerField(blank=True, null=True)),
+                ('latest_minutes', models.IntegerField(blank=True, null=True)),
+                ('goals_assists', models.IntegerField(default=0)),
+                ('listing_type', models.CharField(blank=True, choices=[('TRANSFER', 'Transfer'), ('LOAN', 'Loan'), ('FREE_AGENT', 'Free agent')], default='', max_length=20)),
+                ('market_value', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True)),
+                ('form_score', models.FloatField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('player', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='market_index', to='players.player')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['form_score'], name='market_index_form_idx'), models.Index(fields=['market_value'], name='market_index_value_idx'), models.Index(fields=['latest_rating'], name='market_index_rating_idx'), models.Index(fields=['latest_minutes'], name='market_index_minutes_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_market_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+from django.db import migrations
+
+TRIGRAM_INDEXES = [
+    ("player_search_name_trgm", "players_player"),
+    ("club_search_name_trgm", "accounts_clubprofile"),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # pg_trgm is optional: without it (or off Postgres) name search falls back
+    # to a plain LIKE over the normalized search_name column.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for index_name, table in TRIGRAM_INDEXES:
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {index_name} "
+                f"ON {table} USING gin (search_name gin_trgm_ops)"
+            )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for index_name, _table in TRIGRAM_INDEXES:
+            cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("marketplace", "0005_player_market_index"),
+        ("players", "0008_search_name"),
+        ("accounts", "0007_search_name"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:32
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, Max, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Listing = apps.get_model("marketplace", "Listing")
+    Offer = apps.get_model("marketplace", "Offer")
+    OfferEvent = apps.get_model("marketplace", "OfferEvent")
+
+    def offer_count(offers):
+        return Coalesce(
+            Subquery(
+                offers.filter(listing=OuterRef("pk"))
+                .order_by()
+                .values("listing")
+                .annotate(total=Count("pk"))
+                .values("total")[:1],
+                output_field=IntegerField(),
+            ),
+            Value(0),
+        )
+
+    Listing.objects.update(
+        offers_count=offer_count(Offer.objects.exclude(status="DRAFT")),
+        active_offers_count=offer_count(Offer.objects.filter(status__in=["SENT", "COUNTERED"])),
+        last_offer_at=Subquery(
+            OfferEvent.objects.filter(offer__listing=OuterRef("pk"), event_type="SENT")
+            .order_by()
+            .values("offer__listing")
+            .annotate(latest=Max("created_at"))
+            .values("latest")[:1]
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_search_name'),
+        ('marketplace', '0006_search_name_trigram_indexes'),
+        ('players', '0008_search_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='listing',
+            name='active_offers_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='last_offer_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='offers_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='listing',
+            index=models.Index(fields=['status', '-active_offers_count', '-offers_count'], name='listing_status_contested_idx'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_last_event(apps, schema_editor):
+    Offer = apps.get_model("marketplace", "Offer")
+    OfferEvent = apps.get_model("marketplace", "OfferEvent")
+    latest = OfferEvent.objects.filter(offer=OuterRef("pk")).order_by("-created_at", "-id")
+    Offer.objects.update(
+        last_actor_club=Subquery(latest.values("actor_club_id")[:1]),
+        last_event_type=Coalesce(Subquery(latest.values("event_type")[:1]), Value("")),
+        last_event_at=Subquery(latest.values("created_at")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_search_name'),
+        ('marketplace', '0007_listing_offer_counters'),
+        ('players', '0008_search_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='last_actor_club',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='accounts.club'),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='last_event_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='last_event_type',
+            field=models.CharField(blank=True, max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['to_club', 'status', 'last_actor_club'], name='offer_to_turn_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['from_club', 'status', 'last_actor_club'], name='offer_from_turn_idx'),
+        ),
+        migrations.RunPython(backfill_last_event, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def link_messages(apps, schema_editor):
+    OfferEvent = apps.get_model("marketplace", "OfferEvent")
+    OfferMessage = apps.get_model("marketplace", "OfferMessage")
+    events = list(
+        OfferEvent.objects.filter(event_type="MESSAGE", message__isnull=True).only("id", "payload")
+    )
+    wanted = {(event.payload or {}).get("message_id") for event in events}
+    existing = set(
+        OfferMessage.objects.filter(pk__in=[pk for pk in wanted if pk]).values_list("pk", flat=True)
+    )
+    linked = []
+    for event in events:
+        message_id = (event.payload or {}).get("message_id")
+        if message_id in existing:
+            event.message_id = message_id
+            linked.append(event)
+    OfferEvent.objects.bulk_update(linked, ["message"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketplace', '0008_offer_last_event'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offerevent',
+            name='message',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='marketplace.offermessage'),
+        ),
+        migrations.RunPython(link_messages, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 
 class Listing(models.Model):
@@ -37,6 +38,10 @@ class Listing(models.Model):
         max_length=20, choices=Status.choices, default=Status.OPEN, db_index=True
     )
     notes = models.TextField(blank=True, default="")
+    # Maintained by the offer services; rebuild with sync_listing_counters.
+    offers_count = models.PositiveIntegerField(default=0)
+    active_offers_count = models.PositiveIntegerField(default=0)
+    last_offer_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -46,6 +51,10 @@ class Listing(models.Model):
     class Meta:
         indexes = [
             models.Index(fields=["status", "visibility"], name="listing_status_visibility_idx"),
+            models.Index(
+                fields=["status", "-active_offers_count", "-offers_count"],
+                name="listing_status_contested_idx",
+            ),
         ]
 
 
@@ -101,6 +110,13 @@ class Offer(models.Model):
     )
     expires_at = models.DateTimeField(null=True, blank=True, db_index=True)
     last_action_at = models.DateTimeField(auto_now=True)
+    # Copy of the latest OfferEvent, written with it by services.record_offer_event
+    # so "whose turn is it" needs no subquery over the event log.
+    last_actor_club = models.ForeignKey(
+        "accounts.Club", null=True, blank=True, on_delete=models.SET_NULL, related_name="+"
+    )
+    last_event_type = models.CharField(max_length=20, blank=True)
+    last_event_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -108,8 +124,34 @@ class Offer(models.Model):
             models.Index(fields=["status", "to_club"]),
             models.Index(fields=["status", "from_club"]),
             models.Index(fields=["player", "status"]),
+            models.Index(
+                fields=["to_club", "status", "last_actor_club"], name="offer_to_turn_idx"
+            ),
+            models.Index(
+                fields=["from_club", "status", "last_actor_club"], name="offer_from_turn_idx"
+            ),
         ]
 
+    @property
+    def is_overdue(self) -> bool:
+        return (
+            self.status in {self.Status.SENT, self.Status.COUNTERED}
+            and self.expires_at is not None
+            and self.expires_at <= timezone.now()
+        )
+
+    @property
+    def is_pending(self) -> bool:
+        # Overdue offers stay SENT/COUNTERED until the offer sweeper reaches
+        # them; read views treat them as expired in the meantime.
+        return self.status in {self.Status.SENT, self.Status.COUNTERED} and not self.is_overdue
+
+    @property
+    def display_status(self) -> str:
+        if self.is_overdue:
+            return self.Status.EXPIRED.label
+        return self.get_status_display()
+
     def __str__(self) -> str:
         return f"Offer {self.id} for {self.player.name}"
 
@@ -144,8 +186,43 @@ class OfferEvent(models.Model):
     actor_club = models.ForeignKey(
         "accounts.Club", null=True, blank=True, on_delete=models.SET_NULL
     )
+    # Set on MESSAGE events so the thread joins the body instead of mapping
+    # payload["message_id"] through a second query.
+    message = models.ForeignKey(
+        OfferMessage, null=True, blank=True, on_delete=models.SET_NULL, related_name="+"
+    )
     payload = models.JSONField(default=dict, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self) -> str:
         return f"{self.event_type} on offer {self.offer_id}"
+
+
+class PlayerMarketIndex(models.Model):
+    # One row per player, kept current by apps.marketplace.signals. Listing
+    # columns only reflect open public listings.
+    player = models.OneToOneField(
+        "players.Player", on_delete=models.CASCADE, related_name="market_index"
+    )
+    latest_rating = models.FloatField(null=True, blank=True)
+    latest_goals = models.IntegerField(null=True, blank=True)
+    latest_assists = models.IntegerField(null=True, blank=True)
+    latest_minutes = models.IntegerField(null=True, blank=True)
+    goals_assists = models.IntegerField(default=0)
+    listing_type = models.CharField(
+        max_length=20, choices=Listing.ListingType.choices, blank=True, default=""
+    )
+    market_value = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    form_score = models.FloatField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["form_score"], name="market_index_form_idx"),
+            models.Index(fields=["market_value"], name="market_index_value_idx"),
+            models.Index(fields=["latest_rating"], name="market_index_rating_idx"),
+            models.Index(fields=["latest_minutes"], name="market_index_minutes_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"Market index for player {self.player_id}"
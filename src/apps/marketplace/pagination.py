@@ -0,0 +1,238 @@
+import json
+import math
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.core import signing
+from django.db import connections
+from django.db.models import F, Q
+
+CURSOR_SALT = "transferx.cursor"
+# Below this planner estimate an exact COUNT(*) is cheap enough to run.
+EXACT_COUNT_BELOW = 1000
+# Numeric ?page= links are only served by OFFSET; deeper ones get this page.
+MAX_OFFSET_PAGE = 200
+
+
+def estimate_count(queryset) -> int:
+    queryset = queryset.order_by()
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+    if estimate < EXACT_COUNT_BELOW:
+        return queryset.count()
+    return estimate
+
+
+def _after(alias: str, value, descending: bool) -> Q:
+    # Rows strictly after ``value`` with NULLS LAST in either direction.
+    if value is None:
+        return Q(pk__in=[])
+    lookup = "lt" if descending else "gt"
+    return Q(**{f"{alias}__{lookup}": value}) | Q(**{f"{alias}__isnull": True})
+
+
+def _before(alias: str, value, descending: bool) -> Q:
+    if value is None:
+        return Q(**{f"{alias}__isnull": False})
+    lookup = "gt" if descending else "lt"
+    return Q(**{f"{alias}__{lookup}": value})
+
+
+def _equal(alias: str, value) -> Q:
+    if value is None:
+        return Q(**{f"{alias}__isnull": True})
+    return Q(**{alias: value})
+
+
+class CursorPage:
+    def __init__(self, paginator, object_list, number, *, has_next, has_previous):
+        # Estimates can undercount; never claim fewer pages than we can reach.
+        paginator._pages_seen = max(paginator._pages_seen, number + int(has_next))
+        self.paginator = paginator
+        self.object_list = object_list
+        self.number = number
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        return self._has_previous
+
+    def has_other_pages(self) -> bool:
+        return self._has_next or self._has_previous
+
+    # Templates build links from these exactly as they do for Django's Page,
+    # but the values are opaque cursor tokens rather than page numbers.
+    def next_page_number(self) -> str:
+        return self.paginator.encode(self.number + 1, self.object_list[-1], "next")
+
+    def previous_page_number(self) -> str:
+        if self.number <= 2:
+            return "1"
+        return self.paginator.encode(self.number - 1, self.object_list[0], "prev")
+
+
+# Keyset paginator for a fixed ordering. ``ordering`` is a list of
+# ``(lookup, "asc" | "desc")`` pairs; the primary key is always appended as a
+# tiebreaker and NULLs always sort last. Tokens are signed, so tampered or stale
+# tokens fall back to the first page; plain integer pages from old links are
+# still served with an OFFSET, clamped to the last page like Django's
+# Paginator.get_page().
+class CursorPaginator:
+    def __init__(self, queryset, per_page: int, ordering, *, count: str | int = "estimate"):
+        self.per_page = per_page
+        self.ordering = [*ordering, ("pk", "asc")]
+        self.count_mode = count
+        self.aliases = [f"cursor_key_{index}" for index in range(len(self.ordering))]
+        self.queryset = queryset.annotate(
+            **{alias: F(lookup) for alias, (lookup, _) in zip(self.aliases, self.ordering)}
+        )
+        # An int ``count`` is a total the caller already knows.
+        self._count = count if isinstance(count, int) else None
+        self._pages_seen = 1
+
+    @property
+    def count(self) -> int:
+        if self._count is None:
+            if self.count_mode == "exact":
+                self._count = self.queryset.order_by().count()
+            else:
+                self._count = estimate_count(self.queryset)
+        return self._count
+
+    @property
+    def num_pages(self) -> int:
+        return max(self._pages_seen, math.ceil(self.count / self.per_page))
+
+    def _order_by(self, reverse: bool = False):
+        expressions = []
+        for alias, (_, direction) in zip(self.aliases, self.ordering):
+            descending = (direction == "desc") != reverse
+            if reverse:
+                expression = F(alias).desc(nulls_first=True) if descending else F(alias).asc(
+                    nulls_first=True
+                )
+            else:
+                expression = F(alias).desc(nulls_last=True) if descending else F(alias).asc(
+                    nulls_last=True
+                )
+            expressions.append(expression)
+        return expressions
+
+    def _seek(self, values, direction: str) -> Q:
+        step = _after if direction == "next" else _before
+        condition = Q(pk__in=[])
+        prefix = Q()
+        for alias, (_, order), value in zip(self.aliases, self.ordering, values):
+            condition |= prefix & step(alias, value, order == "desc")
+            prefix &= _equal(alias, value)
+        return condition
+
+    def encode(self, number: int, row, direction: str) -> str:
+        values = [getattr(row, alias) for alias in self.aliases]
+        return signing.dumps(
+            {"n": number, "d": direction, "k": values},
+            salt=CURSOR_SALT,
+            serializer=_CursorSerializer,
+            compress=True,
+        )
+
+    def decode(self, token):
+        try:
+            return signing.loads(token, salt=CURSOR_SALT, serializer=_CursorSerializer)
+        except (signing.BadSignature, ValueError, TypeError):
+            return None
+
+    def get_page(self, token) -> CursorPage:
+        token = (token or "").strip()
+        if token.isdigit():
+            return self._offset_page(self._page_number(token))
+        cursor = self.decode(token) if token else None
+        if not cursor:
+            return self._offset_page(1)
+
+        number = max(int(cursor["n"]), 1)
+        direction = cursor["d"]
+        queryset = self.queryset.filter(self._seek(cursor["k"], direction))
+        if direction == "prev":
+            rows = list(queryset.order_by(*self._order_by(reverse=True))[: self.per_page + 1])
+            more = len(rows) > self.per_page
+            rows = rows[: self.per_page][::-1]
+            return CursorPage(self, rows, number, has_next=True, has_previous=more)
+        rows = list(queryset.order_by(*self._order_by())[: self.per_page + 1])
+        more = len(rows) > self.per_page
+        return CursorPage(self, rows[: self.per_page], number, has_next=more, has_previous=True)
+
+    def page_from_ids(self, ids, number: int, *, has_next, has_previous, count=None):
+        # Rebuilds a page whose ids were resolved earlier (see result_cache).
+        if count is not None:
+            self._count = count
+        rows = {row.pk: row for row in self.queryset.filter(pk__in=ids)}
+        return CursorPage(
+            self,
+            [rows[pk] for pk in ids if pk in rows],
+            number,
+            has_next=has_next,
+            has_previous=has_previous,
+        )
+
+    def _last_page(self) -> int:
+        return max(math.ceil(self.count / self.per_page), 1)
+
+    def _page_number(self, token: str) -> int:
+        # Past the end means the last page; the length check keeps int() off
+        # absurdly long tokens.
+        if len(token) > len(str(MAX_OFFSET_PAGE)):
+            number = MAX_OFFSET_PAGE
+        else:
+            number = min(max(int(token), 1), MAX_OFFSET_PAGE)
+        if number > 1:
+            number = min(number, self._last_page())
+        return number
+
+    def _offset_page(self, number: int) -> CursorPage:
+        start = (number - 1) * self.per_page
+        rows = list(self.queryset.order_by(*self._order_by())[start : start + self.per_page + 1])
+        if not rows and number > 1:
+            # The estimate overcounted (or rows went away): clamp again on an
+            # exact count.
+            self._count = self.queryset.order_by().count()
+            return self._offset_page(min(number - 1, self._last_page()))
+        more = len(rows) > self.per_page
+        return CursorPage(
+            self, rows[: self.per_page], number, has_next=more, has_previous=number > 1
+        )
+
+
+def _json_default(value):
+    # Full-precision ISO datetimes: DjangoJSONEncoder truncates microseconds,
+    # which would break equality on created_at keys.
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Unsupported cursor value {value!r}")
+
+
+class _CursorSerializer:
+    def dumps(self, obj):
+        return json.dumps(obj, default=_json_default, separators=(",", ":")).encode("latin-1")
+
+    def loads(self, data):
+        return json.loads(data.decode("latin-1"))
@@ -1,10 +1,62 @@
-from django.db.models import Count, F, OuterRef, Q, Subquery, Value
+from django.db.models import Case, F, OuterRef, Q, Subquery, Value, When
 from django.db.models.functions import Coalesce
 
 from apps.accounts.models import Club
 from apps.players.models import Contract, Player
-from apps.stats.models import PlayerStats
-from .models import Listing, ListingInvite, Offer
+from .models import Listing
+from .search import club_ids_matching, name_search
+from .visibility import listing_visibility_filter, private_listing_ids
+
+
+# Sort keys are ``(lookup, "asc" | "desc")`` pairs with NULLs last, shared by
+# the querysets below and the keyset paginator so both agree on row order.
+PLAYER_SORTS = {
+    "form_desc": [("market_index__form_score", "desc"), ("name", "asc")],
+    "market_desc": [("market_value", "desc"), ("name", "asc")],
+    "age_asc": [("age", "asc"), ("name", "asc")],
+    "age_desc": [("age", "desc"), ("name", "asc")],
+    "name": [("name", "asc")],
+    "minutes_desc": [("latest_minutes", "desc"), ("name", "asc")],
+    "rating_desc": [("latest_rating", "desc"), ("name", "asc")],
+}
+PLAYER_SORTS["performance"] = PLAYER_SORTS["form_desc"]
+LISTING_SORTS = {
+    "newest": [("created_at", "desc")],
+    "price_asc": [("asking_price", "asc"), ("created_at", "desc")],
+    "price_desc": [("asking_price", "desc"), ("created_at", "desc")],
+    "form_desc": [("player__form__form_score", "desc"), ("created_at", "desc")],
+    "most_contested": [
+        ("active_offers_count", "desc"),
+        ("offers_count", "desc"),
+        ("created_at", "desc"),
+    ],
+}
+RELEVANCE_SORT = [("search_rank", "desc"), ("name", "asc")]
+
+
+def ordering_expressions(keys):
+    return [
+        F(lookup).desc(nulls_last=True) if direction == "desc" else F(lookup).asc(nulls_last=True)
+        for lookup, direction in keys
+    ]
+
+
+def player_sort_keys(params):
+    q = params.get("q", "").strip()
+    sort = params.get("sort") or ("relevance" if q else "form_desc")
+    if sort == "relevance" and q:
+        return RELEVANCE_SORT
+    return PLAYER_SORTS.get(sort, PLAYER_SORTS["form_desc"])
+
+
+def listing_sort_keys(params):
+    return LISTING_SORTS.get(params.get("sort", "newest"), LISTING_SORTS["newest"])
+
+
+def club_sort_keys(params):
+    if params.get("q", "").strip():
+        return RELEVANCE_SORT
+    return [("name", "asc")]
 
 
 def _get_multi_values(params, key: str) -> list[str]:
@@ -20,17 +72,66 @@ def _get_multi_values(params, key: str) -> list[str]:
 
 
 def _listing_access_filter(actor_club: Club | None) -> Q:
-    base = Q(listings__status=Listing.Status.OPEN)
-    if actor_club:
-        return base & (
-            Q(listings__visibility=Listing.Visibility.PUBLIC)
-            | Q(listings__listed_by_club=actor_club)
-            | Q(listings__invites__club=actor_club)
-        )
-    return base & Q(listings__visibility=Listing.Visibility.PUBLIC)
+    return Q(listings__status=Listing.Status.OPEN) & listing_visibility_filter(
+        actor_club, prefix="listings__"
+    )
 
 
-def player_search_queryset(actor_club: Club | None, params):
+def _overlay_private_listings(queryset, private_ids):
+    # The market index only carries public listings. The few players with an
+    # invite-only listing this club can see fall back to the live subquery.
+    private_player_ids = Listing.objects.filter(
+        pk__in=private_ids, status=Listing.Status.OPEN
+    ).values("player_id")
+    listing_base = Listing.objects.filter(
+        player=OuterRef("pk"), status=Listing.Status.OPEN
+    ).filter(Q(visibility=Listing.Visibility.PUBLIC) | Q(pk__in=private_ids))
+    return queryset.annotate(
+        listing_type=Case(
+            When(
+                pk__in=private_player_ids,
+                then=Subquery(
+                    listing_base.order_by("-created_at").values("listing_type")[:1]
+                ),
+            ),
+            default=F("market_index__listing_type"),
+        ),
+        market_value=Case(
+            When(
+                pk__in=private_player_ids,
+                then=Subquery(
+                    listing_base.order_by(
+                        F("asking_price").desc(nulls_last=True), "-created_at"
+                    ).values("asking_price")[:1]
+                ),
+            ),
+            default=F("market_index__market_value"),
+        ),
+    )
+
+
+def _float_param(params, key: str):
+    value = params.get(key)
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _int_param(params, key: str):
+    value = params.get(key)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def player_base_queryset(actor_club: Club | None, params):
+    # Visibility and the non-facet filters; facets are counted over this base.
     queryset = Player.objects.select_related("current_club", "form")
     if actor_club:
         queryset = queryset.exclude(visibility=Player.Visibility.PRIVATE)
@@ -39,14 +140,10 @@ def player_search_queryset(actor_club: Club | None, params):
 
     q = params.get("q", "").strip()
     if q:
-        queryset = queryset.filter(
-            Q(name__icontains=q) | Q(current_club__name__icontains=q)
+        queryset = name_search(
+            queryset, q, extra=Q(current_club_id__in=club_ids_matching(q))
         )
 
-    position = params.get("position")
-    if position:
-        queryset = queryset.filter(position=position)
-
     nationality = params.get("nationality")
     if nationality:
         queryset = queryset.filter(nationality__icontains=nationality)
@@ -54,142 +151,112 @@ def player_search_queryset(actor_club: Club | None, params):
     club_id = params.get("club")
     if club_id:
         queryset = queryset.filter(current_club_id=club_id)
+    return queryset
+
+
+def availability_filter(actor_club: Club | None, value: str) -> Q | None:
+    listing_access = _listing_access_filter(actor_club)
+    if value == "transfer":
+        return listing_access & Q(listings__listing_type=Listing.ListingType.TRANSFER)
+    if value == "loan":
+        return listing_access & Q(listings__listing_type=Listing.ListingType.LOAN)
+    if value == "free_agent":
+        return Q(status=Player.Status.FREE_AGENT) | (
+            listing_access & Q(listings__listing_type=Listing.ListingType.FREE_AGENT)
+        )
+    if value == "open_to_offers":
+        return Q(open_to_offers=True)
+    return None
+
+
+def player_facet_filters(actor_club: Club | None, params) -> dict[str, Q]:
+    # Active filters keyed by facet group, shared by the search queryset and
+    # the facet counts so both agree on what each filter means.
+    filters = {}
+    position = params.get("position")
+    if position:
+        filters["position"] = Q(position=position)
 
     if params.get("free_agent_only") in {"1", "true", "True"}:
-        queryset = queryset.filter(current_club__isnull=True)
+        filters["free_agent_only"] = Q(current_club__isnull=True)
 
     if params.get("listed_only") in {"1", "true", "True"}:
-        queryset = queryset.filter(listings__status=Listing.Status.OPEN).distinct()
-
-    min_form = params.get("min_form")
-    if min_form:
-        try:
-            queryset = queryset.filter(form__form_score__gte=float(min_form))
-        except ValueError:
-            pass
+        filters["listed_only"] = Q(listings__status=Listing.Status.OPEN)
+
+    form = Q()
+    min_form = _float_param(params, "min_form")
+    if min_form is not None:
+        form &= Q(form__form_score__gte=min_form)
+    max_form = _float_param(params, "max_form")
+    if max_form is not None:
+        form &= Q(form__form_score__lte=max_form)
+    if form:
+        filters["form"] = form
+
+    age = Q()
+    min_age = _int_param(params, "min_age")
+    if min_age is not None:
+        age &= Q(age__gte=min_age)
+    max_age = _int_param(params, "max_age")
+    if max_age is not None:
+        age &= Q(age__lte=max_age)
+    if age:
+        filters["age"] = age
 
-    max_form = params.get("max_form")
-    if max_form:
-        try:
-            queryset = queryset.filter(form__form_score__lte=float(max_form))
-        except ValueError:
-            pass
+    availability = {value.lower() for value in _get_multi_values(params, "availability")}
+    if availability:
+        match = Q()
+        for value in sorted(availability):
+            condition = availability_filter(actor_club, value)
+            if condition is not None:
+                match |= condition
+        if match:
+            filters["availability"] = match
+    return filters
 
-    min_age = params.get("min_age")
-    if min_age:
-        try:
-            queryset = queryset.filter(age__gte=int(min_age))
-        except ValueError:
-            pass
 
-    max_age = params.get("max_age")
-    if max_age:
-        try:
-            queryset = queryset.filter(age__lte=int(max_age))
-        except ValueError:
-            pass
+def player_search_queryset(actor_club: Club | None, params):
+    queryset = player_base_queryset(actor_club, params)
+    filters = player_facet_filters(actor_club, params)
+    for group in ("position", "free_agent_only", "listed_only", "form", "age"):
+        if group in filters:
+            queryset = queryset.filter(filters[group])
 
-    latest_stats = PlayerStats.objects.filter(player=OuterRef("pk")).order_by(
-        "-season", "-updated_at", "-id"
-    )
     queryset = queryset.annotate(
-        latest_rating=Subquery(latest_stats.values("avg_rating")[:1]),
-        latest_goals=Subquery(latest_stats.values("goals")[:1]),
-        latest_assists=Subquery(latest_stats.values("assists")[:1]),
-        latest_minutes=Subquery(latest_stats.values("minutes")[:1]),
-    ).annotate(
-        goals_assists=Coalesce(F("latest_goals"), Value(0))
-        + Coalesce(F("latest_assists"), Value(0))
+        latest_rating=F("market_index__latest_rating"),
+        latest_goals=F("market_index__latest_goals"),
+        latest_assists=F("market_index__latest_assists"),
+        latest_minutes=F("market_index__latest_minutes"),
+        goals_assists=Coalesce(F("market_index__goals_assists"), Value(0)),
     )
-
-    listing_base = Listing.objects.filter(player=OuterRef("pk"), status=Listing.Status.OPEN)
-    if actor_club:
-        listing_base = listing_base.filter(
-            Q(visibility=Listing.Visibility.PUBLIC)
-            | Q(listed_by_club=actor_club)
-            | Q(invites__club=actor_club)
-        )
+    private_ids = private_listing_ids(actor_club)
+    if private_ids:
+        queryset = _overlay_private_listings(queryset, sorted(private_ids))
     else:
-        listing_base = listing_base.filter(visibility=Listing.Visibility.PUBLIC)
-    queryset = queryset.annotate(
-        listing_type=Subquery(listing_base.order_by("-created_at").values("listing_type")[:1]),
-        market_value=Subquery(
-            listing_base.order_by(
-                F("asking_price").desc(nulls_last=True), "-created_at"
-            ).values("asking_price")[:1]
-        ),
-    )
+        queryset = queryset.annotate(
+            listing_type=F("market_index__listing_type"),
+            market_value=F("market_index__market_value"),
+        )
 
-    availability = {value.lower() for value in _get_multi_values(params, "availability")}
-    if availability:
-        listing_access = _listing_access_filter(actor_club)
-        availability_filter = Q()
-        if "transfer" in availability:
-            availability_filter |= listing_access & Q(
-                listings__listing_type=Listing.ListingType.TRANSFER
-            )
-        if "loan" in availability:
-            availability_filter |= listing_access & Q(
-                listings__listing_type=Listing.ListingType.LOAN
-            )
-        if "free_agent" in availability:
-            availability_filter |= Q(status=Player.Status.FREE_AGENT)
-            availability_filter |= listing_access & Q(
-                listings__listing_type=Listing.ListingType.FREE_AGENT
-            )
-        if "open_to_offers" in availability:
-            availability_filter |= Q(open_to_offers=True)
-        queryset = queryset.filter(availability_filter).distinct()
-
-    sort = params.get("sort", "form_desc")
-    if sort in {"performance", "form_desc"}:
-        queryset = queryset.order_by(F("form__form_score").desc(nulls_last=True), "name")
-    elif sort == "market_desc":
-        queryset = queryset.order_by(F("market_value").desc(nulls_last=True), "name")
-    elif sort == "age_asc":
-        queryset = queryset.order_by("age", "name")
-    elif sort == "age_desc":
-        queryset = queryset.order_by(F("age").desc(nulls_last=True), "name")
-    elif sort == "name":
-        queryset = queryset.order_by("name")
-    elif sort == "minutes_desc":
-        queryset = queryset.order_by(F("latest_minutes").desc(nulls_last=True), "name")
-    elif sort == "rating_desc":
-        queryset = queryset.order_by(F("latest_rating").desc(nulls_last=True), "name")
-    else:
-        queryset = queryset.order_by(F("form__form_score").desc(nulls_last=True), "name")
+    if "availability" in filters:
+        queryset = queryset.filter(filters["availability"])
+    if "listed_only" in filters or "availability" in filters:
+        queryset = queryset.distinct()
 
-    return queryset
+    return queryset.order_by(*ordering_expressions(player_sort_keys(params)))
 
 
 def listing_search_queryset(actor_club: Club | None, params):
-    listings = (
-        Listing.objects.select_related("player", "player__current_club", "player__form", "listed_by_club")
-        .filter(status=Listing.Status.OPEN)
-        .annotate(
-            offers_count=Count(
-                "offers",
-                filter=~Q(offers__status=Offer.Status.DRAFT),
-            )
-        )
-    )
+    listings = Listing.objects.select_related(
+        "player", "player__current_club", "player__form", "listed_by_club"
+    ).filter(status=Listing.Status.OPEN)
     active_contract = Contract.objects.filter(
         player=OuterRef("player_id"), is_active=True
     ).order_by("-end_date", "-id")
     listings = listings.annotate(
         contract_end_date=Subquery(active_contract.values("end_date")[:1])
     )
-    if actor_club:
-        invite_ids = ListingInvite.objects.filter(club=actor_club).values_list(
-            "listing_id", flat=True
-        )
-        listings = listings.filter(
-            Q(visibility=Listing.Visibility.PUBLIC)
-            | Q(listed_by_club=actor_club)
-            | Q(id__in=invite_ids)
-        )
-    else:
-        listings = listings.filter(visibility=Listing.Visibility.PUBLIC)
+    listings = listings.filter(listing_visibility_filter(actor_club))
 
     listing_type = params.get("type")
     if listing_type:
@@ -217,24 +284,14 @@ def listing_search_queryset(actor_club: Club | None, params):
         except ValueError:
             pass
 
-    sort = params.get("sort", "newest")
-    if sort == "price_asc":
-        listings = listings.order_by(F("asking_price").asc(nulls_last=True), "-created_at")
-    elif sort == "price_desc":
-        listings = listings.order_by(F("asking_price").desc(nulls_last=True), "-created_at")
-    elif sort == "form_desc":
-        listings = listings.order_by(F("player__form__form_score").desc(nulls_last=True), "-created_at")
-    else:
-        listings = listings.order_by("-created_at")
-
-    return listings
+    return listings.order_by(*ordering_expressions(listing_sort_keys(params)))
 
 
 def club_search_queryset(params):
     queryset = Club.objects.all()
     q = params.get("q", "").strip()
     if q:
-        queryset = queryset.filter(name__icontains=q)
+        queryset = name_search(queryset, q)
 
     country = params.get("country")
     if country:
@@ -248,7 +305,7 @@ def club_search_queryset(params):
     if verified:
         queryset = queryset.filter(verified_status=verified)
 
-    return queryset.order_by("name")
+    return queryset.order_by(*ordering_expressions(club_sort_keys(params)))
 
 
 def get_open_listing_for_player(player: Player):
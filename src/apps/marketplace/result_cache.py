@@ -0,0 +1,123 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .visibility import private_listing_ids
+
+# Result kinds and the writes that invalidate them. Every cached page embeds
+# the current generation of its kind, so bumping it orphans all old entries.
+PLAYERS = "players"
+LISTINGS = "listings"
+RESULT_KINDS = (PLAYERS, LISTINGS)
+_GENERATION_KEY = "marketplace:results:generation:{}"
+_COUNTER_KEY = "marketplace:results:{}:{}"
+
+
+def generation(kind: str) -> int:
+    key = _GENERATION_KEY.format(kind)
+    value = cache.get(key)
+    if value is None:
+        # Seed from the clock so an evicted counter never revisits old entries.
+        cache.add(key, time.time_ns(), None)
+        value = cache.get(key)
+    return value
+
+
+def _bump(kinds) -> None:
+    for kind in kinds:
+        key = _GENERATION_KEY.format(kind)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), None)
+
+
+def bump_generation(*kinds: str) -> None:
+    # Bump now so this request sees its own write, and again on commit so a
+    # reader that cached pre-commit rows in between is invalidated too.
+    kinds = kinds or RESULT_KINDS
+    _bump(kinds)
+    transaction.on_commit(lambda: _bump(kinds))
+
+
+def _count(kind: str, outcome: str) -> None:
+    key = _COUNTER_KEY.format(kind, outcome)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, None)
+
+
+def result_cache_stats(reset: bool = False) -> dict:
+    stats = {}
+    for kind in RESULT_KINDS:
+        hits = cache.get(_COUNTER_KEY.format(kind, "hits"), 0)
+        misses = cache.get(_COUNTER_KEY.format(kind, "misses"), 0)
+        total = hits + misses
+        stats[kind] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+        }
+    if reset:
+        cache.delete_many(
+            [_COUNTER_KEY.format(kind, outcome) for kind in RESULT_KINDS for outcome in ("hits", "misses")]
+        )
+    return stats
+
+
+def visibility_scope(actor_club) -> str:
+    # Clubs only see different results when they can see an invite-only
+    # listing (their own or via an invite); all other clubs share one scope.
+    if actor_club is None:
+        return "anonymous"
+    if private_listing_ids(actor_club):
+        return f"club:{actor_club.pk}"
+    return "club"
+
+
+def _params_digest(params) -> str:
+    normalized = {}
+    for key in sorted(params.keys()):
+        values = params.getlist(key) if hasattr(params, "getlist") else [params[key]]
+        values = sorted(value.strip() for value in values if value and value.strip())
+        if values:
+            normalized[key] = values
+    return hashlib.sha1(json.dumps(normalized).encode()).hexdigest()
+
+
+def cached_page(paginator, kind: str, actor_club, params):
+    # Stores the page's ids (not rows), so annotations such as offer counts are
+    # always fresh; only membership and order come from the cache.
+    key = "marketplace:results:{}:{}:{}:{}".format(
+        kind, generation(kind), visibility_scope(actor_club), _params_digest(params)
+    )
+    entry = cache.get(key)
+    if entry is not None:
+        _count(kind, "hits")
+        return paginator.page_from_ids(
+            entry["ids"],
+            entry["number"],
+            has_next=entry["has_next"],
+            has_previous=entry["has_previous"],
+            count=entry["count"],
+        )
+
+    _count(kind, "misses")
+    page = paginator.get_page(params.get("page"))
+    cache.set(
+        key,
+        {
+            "ids": [row.pk for row in page.object_list],
+            "number": page.number,
+            "has_next": page.has_next(),
+            "has_previous": page.has_previous(),
+            "count": paginator.count,
+        },
+        settings.TRANSFERX_RESULT_CACHE_SECONDS,
+    )
+    return page
@@ -0,0 +1,66 @@
+import unicodedata
+
+from django.db import connections
+from django.db.models import Case, F, FloatField, Q, Value, When
+
+from apps.accounts.models import Club
+
+_trigram_support: dict[str, bool] = {}
+
+
+def normalize_search_text(value: str | None) -> str:
+    # Lower-cased, accent-stripped, single-spaced: "Müller  Jr" -> "muller jr".
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def trigram_enabled(using: str = "default") -> bool:
+    if using not in _trigram_support:
+        connection = connections[using]
+        enabled = False
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                enabled = cursor.fetchone() is not None
+        _trigram_support[using] = enabled
+    return _trigram_support[using]
+
+
+def search_rank(field: str, term: str):
+    # Prefix > word prefix > substring; pg_trgm similarity breaks ties.
+    rank = Case(
+        When(**{f"{field}__startswith": term}, then=Value(3.0)),
+        When(**{f"{field}__contains": f" {term}"}, then=Value(2.0)),
+        default=Value(1.0),
+        output_field=FloatField(),
+    )
+    if trigram_enabled():
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        rank = rank + TrigramSimilarity(field, term)
+    return rank
+
+
+def name_search(queryset, q: str, *, field: str = "search_name", extra: Q | None = None):
+    # Filters on the normalized search column (GIN trigram indexed on Postgres)
+    # and annotates ``search_rank`` for relevance ordering. ``extra`` widens the
+    # match, e.g. to players whose club name matches.
+    term = normalize_search_text(q)
+    if not term:
+        return queryset
+    match = Q(**{f"{field}__contains": term})
+    if extra is not None:
+        match |= extra
+    return queryset.filter(match).annotate(search_rank=search_rank(field, term))
+
+
+def club_ids_matching(q: str):
+    term = normalize_search_text(q)
+    return Club.objects.filter(search_name__contains=term).values("id")
+
+
+def order_by_relevance(queryset, *tiebreakers):
+    return queryset.order_by(F("search_rank").desc(), *tiebreakers)
@@ -1,12 +1,16 @@
+from collections import Counter
 from datetime import datetime
 from typing import Any
 
 from django.core.exceptions import PermissionDenied, ValidationError
-from django.db import transaction
+from django.db import connection, transaction
 from django.utils import timezone
 
+from apps.accounts.counters import refresh_club_counters
 from apps.accounts.models import Club
+from .listing_counters import adjust_listing_counters
 from .models import Listing, Offer, OfferEvent, OfferMessage
+from apps.notifications.dispatch import notification_batch, queue_notification
 from apps.notifications.models import Notification
 from apps.notifications.utils import create_notification
 from apps.deals.models import Deal
@@ -54,6 +58,30 @@ def close_listing(*, listing: Listing, actor_club, reason: str = "closed") -> No
     listing.save(update_fields=["status", "updated_at"])
 
 
+def record_offer_event(
+    offer: Offer, event_type, *, actor_user=None, actor_club=None, message=None, payload=None
+) -> OfferEvent:
+    # The only way services write an OfferEvent: the offer's last_* columns are
+    # updated in the same transaction, so inbox queries never read the log.
+    event = OfferEvent.objects.create(
+        offer=offer,
+        event_type=event_type,
+        actor_user=actor_user,
+        actor_club=actor_club,
+        message=message,
+        payload=payload or {},
+    )
+    offer.last_actor_club = actor_club
+    offer.last_event_type = event_type
+    offer.last_event_at = event.created_at
+    Offer.objects.filter(pk=offer.pk).update(
+        last_actor_club=actor_club, last_event_type=event_type, last_event_at=event.created_at
+    )
+    # Status and turn are what the receiving club's unread badge counts.
+    refresh_club_counters([offer.to_club_id], ["offers_unread"])
+    return event
+
+
 def get_actor_club(user) -> Club | None:
     if hasattr(user, "club"):
         return user.club
@@ -79,18 +107,103 @@ def close_offer_if_expired(offer: Offer, now: datetime | None = None) -> bool:
         if not locked.expires_at or locked.expires_at > now:
             return False
 
+        # Same columns as EXPIRE_OFFERS_SQL writes for the sweeper.
         locked.status = Offer.Status.EXPIRED
-        locked.save(update_fields=["status", "last_action_at"])
-        OfferEvent.objects.create(
-            offer=locked,
-            event_type=OfferEvent.EventType.EXPIRED,
-            payload={"expired_at": now.isoformat()},
+        locked.last_actor_club = None
+        locked.last_event_type = OfferEvent.EventType.EXPIRED
+        locked.last_event_at = now
+        locked.save(
+            update_fields=[
+                "status",
+                "last_action_at",
+                "last_actor_club",
+                "last_event_type",
+                "last_event_at",
+            ]
         )
+        _offers_expired([(locked.pk, locked.listing_id, locked.to_club_id)], now)
     # Keep the caller's in-memory object consistent.
     offer.status = Offer.Status.EXPIRED
+    offer.last_actor_club = None
+    offer.last_event_type = OfferEvent.EventType.EXPIRED
+    offer.last_event_at = now
     return True
 
 
+def _offers_expired(rows, now) -> None:
+    # Side effects of expiry for (offer id, listing id, to club id) rows whose
+    # status is already EXPIRED, shared by close_offer_if_expired and the
+    # sweeper so an offer's outcome does not depend on which reached it.
+    OfferEvent.objects.bulk_create(
+        OfferEvent(
+            offer_id=offer_id,
+            event_type=OfferEvent.EventType.EXPIRED,
+            payload={"expired_at": now.isoformat()},
+        )
+        for offer_id, _, _ in rows
+    )
+    for listing_id, count in Counter(listing_id for _, listing_id, _ in rows).items():
+        adjust_listing_counters(listing_id, active=-count)
+    refresh_club_counters({to_club_id for _, _, to_club_id in rows}, ["offers_unread"])
+    offers = Offer.objects.select_related("player", "from_club", "to_club").filter(
+        pk__in=[offer_id for offer_id, _, _ in rows]
+    )
+    for offer in offers:
+        for club in (offer.from_club, offer.to_club):
+            if club and club.user_id:
+                queue_notification(
+                    recipient=club.user_id,
+                    type=Notification.Type.OFFER_EXPIRED,
+                    message=f"Offer for {offer.player.name} expired.",
+                    link=f"/marketplace/offers/{offer.id}/",
+                    related_player=offer.player,
+                    related_club=club,
+                )
+
+
+EXPIRE_OFFERS_SQL = """
+    UPDATE {table}
+    SET status = %(expired)s,
+        last_action_at = %(now)s,
+        last_actor_club_id = NULL,
+        last_event_type = %(expired)s,
+        last_event_at = %(now)s
+    WHERE id IN (
+        SELECT id FROM {table}
+        WHERE status IN (%(sent)s, %(countered)s) AND expires_at <= %(now)s
+        ORDER BY expires_at, id
+        LIMIT %(limit)s
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING id, listing_id, to_club_id
+"""
+
+
+def expire_overdue_offers(now=None, batch_size: int = 200) -> int:
+    # One batch for the offer sweeper: a single UPDATE ... RETURNING expires up
+    # to ``batch_size`` overdue offers, skipping any a participant is acting on
+    # (close_offer_if_expired covers those). The shared expiry side effects
+    # then follow in bulk.
+    now = now or timezone.now()
+    with transaction.atomic(), notification_batch():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                EXPIRE_OFFERS_SQL.format(table=connection.ops.quote_name(Offer._meta.db_table)),
+                {
+                    "expired": Offer.Status.EXPIRED,
+                    "sent": Offer.Status.SENT,
+                    "countered": Offer.Status.COUNTERED,
+                    "now": now,
+                    "limit": batch_size,
+                },
+            )
+            rows = cursor.fetchall()
+        if not rows:
+            return 0
+        _offers_expired(rows, now)
+    return len(rows)
+
+
 @transaction.atomic
 def create_draft_offer(
     *,
@@ -124,8 +237,8 @@ def create_draft_offer(
         expires_at=expires_at,
         status=Offer.Status.DRAFT,
     )
-    OfferEvent.objects.create(
-        offer=offer,
+    record_offer_event(
+        offer,
         event_type=OfferEvent.EventType.CREATED,
         actor_club=from_club,
         payload={
@@ -149,8 +262,8 @@ def send_offer(offer: Offer, actor_user, actor_club) -> Offer:
         raise ValidationError("Offer target does not match current club.")
     offer.status = Offer.Status.SENT
     offer.save(update_fields=["status", "last_action_at"])
-    OfferEvent.objects.create(
-        offer=offer,
+    sent_event = record_offer_event(
+        offer,
         event_type=OfferEvent.EventType.SENT,
         actor_user=actor_user,
         actor_club=actor_club,
@@ -165,6 +278,9 @@ def send_offer(offer: Offer, actor_user, actor_club) -> Offer:
             }
         },
     )
+    adjust_listing_counters(
+        offer.listing_id, offers=1, active=1, offered_at=sent_event.created_at
+    )
     if offer.to_club and offer.to_club.user:
         if offer.listing_id:
             create_notification(
@@ -246,8 +362,8 @@ def counter_offer(
         )
     ]
 
-    OfferEvent.objects.create(
-        offer=offer,
+    record_offer_event(
+        offer,
         event_type=OfferEvent.EventType.COUNTERED,
         actor_user=actor_user,
         actor_club=actor_club,
@@ -290,12 +406,13 @@ def accept_offer(offer: Offer, actor_user, actor_club) -> Offer:
 
     offer.status = Offer.Status.ACCEPTED
     offer.save(update_fields=["status", "last_action_at"])
-    OfferEvent.objects.create(
-        offer=offer,
+    record_offer_event(
+        offer,
         event_type=OfferEvent.EventType.ACCEPTED,
         actor_user=actor_user,
         actor_club=actor_club,
     )
+    adjust_listing_counters(offer.listing_id, active=-1)
     Deal.objects.get_or_create(
         offer=offer,
         defaults={
@@ -330,13 +447,14 @@ def reject_offer(offer: Offer, actor_user, actor_club, reason: str = "") -> Offe
         raise PermissionDenied("Only the selling club can reject this offer.")
     offer.status = Offer.Status.REJECTED
     offer.save(update_fields=["status", "last_action_at"])
-    OfferEvent.objects.create(
-        offer=offer,
+    record_offer_event(
+        offer,
         event_type=OfferEvent.EventType.REJECTED,
         actor_user=actor_user,
         actor_club=actor_club,
         payload={"reason": reason},
     )
+    adjust_listing_counters(offer.listing_id, active=-1)
     if offer.from_club and offer.from_club.user:
         create_notification(
             recipient=offer.from_club.user,
@@ -357,14 +475,17 @@ def withdraw_offer(offer: Offer, actor_user, actor_club) -> Offer:
         raise ValidationError("Offer cannot be withdrawn.")
     if offer.from_club_id != actor_club.id:
         raise PermissionDenied("Only the buyer can withdraw this offer.")
+    was_active = offer.status != Offer.Status.DRAFT
     offer.status = Offer.Status.WITHDRAWN
     offer.save(update_fields=["status", "last_action_at"])
-    OfferEvent.objects.create(
-        offer=offer,
+    record_offer_event(
+        offer,
         event_type=OfferEvent.EventType.WITHDRAWN,
         actor_user=actor_user,
         actor_club=actor_club,
     )
+    if was_active:
+        adjust_listing_counters(offer.listing_id, active=-1)
     return offer
 
 
@@ -383,11 +504,12 @@ def add_message(offer: Offer, actor_user, actor_club, body: str) -> OfferMessage
         sender_club=actor_club,
         body=body,
     )
-    OfferEvent.objects.create(
-        offer=offer,
+    record_offer_event(
+        offer,
         event_type=OfferEvent.EventType.MESSAGE,
         actor_user=actor_user,
         actor_club=actor_club,
+        message=message,
         payload={"message_id": message.id},
     )
     return message
@@ -0,0 +1,87 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.accounts.models import Club
+from apps.players.models import Player
+from apps.stats.models import PlayerForm, PlayerStats
+from .market_index import refresh_player_market_index
+from .models import Listing, ListingInvite
+from .result_cache import PLAYERS, bump_generation
+from .search import normalize_search_text
+from .visibility import invalidate_listing_access, invalidate_listing_access_for_listing
+
+
+def _deleting_player(origin) -> bool:
+    return isinstance(origin, Player) or getattr(origin, "model", None) is Player
+
+
+@receiver(pre_save, sender=Player)
+@receiver(pre_save, sender=Club)
+def set_search_name(sender, instance, **kwargs):
+    instance.search_name = normalize_search_text(instance.name)
+
+
+@receiver(post_save, sender=Player)
+@receiver(post_save, sender=Club)
+def save_search_name_with_name(sender, instance, update_fields=None, **kwargs):
+    # save(update_fields=["name"]) would otherwise leave search_name stale.
+    if update_fields and "name" in update_fields and "search_name" not in update_fields:
+        sender.objects.filter(pk=instance.pk).update(search_name=instance.search_name)
+
+
+@receiver(post_save, sender=Player)
+def index_new_player(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        refresh_player_market_index([instance.pk])
+
+
+@receiver(post_save, sender=Listing)
+@receiver(post_save, sender=PlayerStats)
+@receiver(post_save, sender=PlayerForm)
+def reindex_player_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    refresh_player_market_index([instance.player_id])
+
+
+@receiver(post_delete, sender=Listing)
+@receiver(post_delete, sender=PlayerStats)
+@receiver(post_delete, sender=PlayerForm)
+def reindex_player_on_delete(sender, instance, origin=None, **kwargs):
+    # Cascades from a Player delete would re-insert a row for a doomed player.
+    if _deleting_player(origin):
+        return
+    refresh_player_market_index([instance.player_id])
+
+
+@receiver(post_save, sender=Listing)
+@receiver(post_delete, sender=Listing)
+@receiver(post_save, sender=ListingInvite)
+@receiver(post_delete, sender=ListingInvite)
+def invalidate_results_on_listing(sender, **kwargs):
+    bump_generation()
+
+
+@receiver(post_save, sender=Club)
+def invalidate_results_on_club(sender, **kwargs):
+    # Player search also matches club names.
+    bump_generation(PLAYERS)
+
+
+@receiver(post_save, sender=Listing)
+def refresh_access_on_listing_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    invalidate_listing_access_for_listing(instance)
+
+
+@receiver(post_delete, sender=Listing)
+def refresh_access_on_listing_delete(sender, instance, **kwargs):
+    # Invite rows cascade first and invalidate their own clubs.
+    invalidate_listing_access([instance.listed_by_club_id])
+
+
+@receiver(post_save, sender=ListingInvite)
+@receiver(post_delete, sender=ListingInvite)
+def refresh_access_on_invite(sender, instance, **kwargs):
+    invalidate_listing_access([instance.club_id])
@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from .models import Offer, OfferEvent
+
+THREAD_PAGE_SIZE = 20
+TERMS_EVENTS = {
+    OfferEvent.EventType.CREATED,
+    OfferEvent.EventType.SENT,
+    OfferEvent.EventType.COUNTERED,
+}
+
+
+@dataclass
+class ThreadItem:
+    event: OfferEvent
+    direction: str
+    actor_name: str
+    message: str | None
+    terms: dict | None
+    timestamp: datetime
+
+
+@dataclass
+class ThreadPage:
+    # Oldest first, as rendered. ``older_cursor`` is the ?before= value for
+    # the previous page; ``newest_id`` the ?after= value for the next poll.
+    items: list[ThreadItem]
+    older_cursor: int | None
+    newest_id: int
+
+
+def _current_terms(offer: Offer) -> dict:
+    return {
+        "fee_amount": str(offer.fee_amount) if offer.fee_amount is not None else None,
+        "wage_weekly": str(offer.wage_weekly) if offer.wage_weekly is not None else None,
+        "contract_years": offer.contract_years,
+        "contract_end_date": offer.contract_end_date.isoformat()
+        if offer.contract_end_date
+        else None,
+    }
+
+
+def _items(offer: Offer, club, events) -> list[ThreadItem]:
+    fallback_terms = None
+    items = []
+    for event in events:
+        terms = (event.payload or {}).get("terms")
+        if event.event_type in TERMS_EVENTS and not terms:
+            # Older events predate the terms snapshot; show the offer's terms.
+            fallback_terms = fallback_terms or _current_terms(offer)
+            terms = fallback_terms
+        items.append(
+            ThreadItem(
+                event=event,
+                direction="sent" if event.actor_club_id == club.id else "received",
+                actor_name=event.actor_club.name if event.actor_club else "System",
+                message=event.message.body if event.message else None,
+                terms=terms,
+                timestamp=event.created_at,
+            )
+        )
+    return items
+
+
+def _events(offer: Offer):
+    return OfferEvent.objects.filter(offer=offer).select_related("actor_club", "message")
+
+
+def load_thread(
+    offer: Offer, club, before: int | None = None, limit: int = THREAD_PAGE_SIZE
+) -> ThreadPage:
+    # The newest ``limit`` events (older than event ``before`` when given),
+    # with their messages joined in the same query.
+    events = _events(offer)
+    if before is not None:
+        events = events.filter(pk__lt=before)
+    rows = list(events.order_by("-pk")[: limit + 1])
+    older_cursor = rows[limit - 1].pk if len(rows) > limit else None
+    rows = rows[:limit][::-1]
+    return ThreadPage(
+        items=_items(offer, club, rows),
+        older_cursor=older_cursor,
+        newest_id=rows[-1].pk if rows else 0,
+    )
+
+
+def load_thread_since(
+    offer: Offer, club, after: int, limit: int = THREAD_PAGE_SIZE
+) -> ThreadPage:
+    # Events newer than event ``after``, for the client to append; anything
+    # past ``limit`` arrives with the next poll.
+    rows = list(_events(offer).filter(pk__gt=after).order_by("pk")[:limit])
+    return ThreadPage(
+        items=_items(offer, club, rows),
+        older_cursor=None,
+        newest_id=rows[-1].pk if rows else after,
+    )
@@ -10,6 +10,7 @@ urlpatterns = [
     path("offers/new/", views.offer_new, name="offer_new"),
     path("offers/free-agents/", views.free_agent_offers, name="free_agent_offers"),
     path("offers/<int:pk>/", views.offer_detail, name="offer_detail"),
+    path("offers/<int:pk>/events/", views.offer_events, name="offer_events"),
     path("offers/<int:pk>/counter/", views.offer_counter, name="offer_counter"),
     path("offers/<int:pk>/accept/", views.offer_accept, name="offer_accept"),
     path("offers/<int:pk>/reject/", views.offer_reject, name="offer_reject"),
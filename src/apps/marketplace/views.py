@@ -2,19 +2,30 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.core.paginator import Paginator
-from django.db.models import OuterRef, Q, Subquery
+from django.http import HttpResponseBadRequest
 from django.shortcuts import get_object_or_404, redirect, render
-from django.utils import timezone
 
 from apps.accounts.models import Club
 from apps.players.models import Contract, Player
 from apps.stats.models import PlayerForm, PlayerStats, PlayerStatsSnapshot
+from .facets import player_market_facets
 from .forms import OfferForm, OfferMessageForm
-from .models import Listing, Offer, OfferEvent, OfferMessage
-from .query import club_search_queryset, get_open_listing_for_player, listing_search_queryset, player_search_queryset
+from .inbox import latest_messages
+from .models import Listing, Offer
+from .pagination import CursorPaginator
+from .query import (
+    club_search_queryset,
+    club_sort_keys,
+    get_open_listing_for_player,
+    listing_search_queryset,
+    listing_sort_keys,
+    player_search_queryset,
+    player_sort_keys,
+)
+from .result_cache import LISTINGS, PLAYERS, cached_page
+from .search import name_search, order_by_relevance
 from .services import (
     add_message,
-    close_offer_if_expired,
     counter_offer,
     create_draft_offer,
     get_actor_club,
@@ -23,6 +34,8 @@ from .services import (
     reject_offer,
     withdraw_offer,
 )
+from .thread import load_thread, load_thread_since
+from .visibility import can_view_listing, listing_visibility_filter
 
 
 
@@ -31,8 +44,11 @@ def player_market_list(request):
     club = getattr(request.user, "club", None)
     can_scout = bool(club)
     queryset = player_search_queryset(club, request.GET)
-    paginator = Paginator(queryset, 24)
-    page = paginator.get_page(request.GET.get("page"))
+    facets = player_market_facets(club, request.GET)
+    paginator = CursorPaginator(
+        queryset, 24, player_sort_keys(request.GET), count=facets["total"]
+    )
+    page = cached_page(paginator, PLAYERS, club, request.GET)
     base_query = request.GET.copy()
     base_query.pop("page", None)
     shortlists = []
@@ -63,6 +79,7 @@ def player_market_list(request):
         template,
         {
             "page_obj": page,
+            "facets": facets,
             "filters": request.GET,
             "base_query": base_query.urlencode(),
             "shortlists": shortlists,
@@ -86,10 +103,8 @@ def player_market_detail(request, pk: int):
 
         interest = PlayerInterest.objects.filter(club=club, player=player).first()
         shortlists = list(Shortlist.objects.filter(club=club).order_by("name"))
-    if listing and listing.visibility == Listing.Visibility.INVITE_ONLY:
-        invited = listing.invites.filter(club=club).exists() if club else False
-        if not club or (listing.listed_by_club_id != club.id and not invited):
-            listing = None
+    if listing and not can_view_listing(club, listing):
+        listing = None
     latest_snapshot = player.stats_snapshots.order_by("-as_of").first()
     form = PlayerForm.objects.filter(player=player).first()
     return render(
@@ -110,7 +125,7 @@ def player_market_detail(request, pk: int):
 @login_required
 def club_list(request):
     queryset = club_search_queryset(request.GET)
-    paginator = Paginator(queryset, 25)
+    paginator = CursorPaginator(queryset, 25, club_sort_keys(request.GET))
     page = paginator.get_page(request.GET.get("page"))
     base_query = request.GET.copy()
     base_query.pop("page", None)
@@ -132,10 +147,10 @@ def club_detail(request, pk: int):
 
     squad = Player.objects.filter(current_club=club)
     if q:
-        squad = squad.filter(name__icontains=q)
+        squad = name_search(squad, q)
     if position:
         squad = squad.filter(position=position)
-    squad = squad.order_by("name")
+    squad = order_by_relevance(squad, "name") if q else squad.order_by("name")
     squad_paginator = Paginator(squad, 25)
     squad_page = squad_paginator.get_page(request.GET.get("page"))
 
@@ -160,8 +175,8 @@ def club_detail(request, pk: int):
 def listing_hub_list(request):
     club = getattr(request.user, "club", None)
     queryset = listing_search_queryset(club, request.GET)
-    paginator = Paginator(queryset, 24)
-    page = paginator.get_page(request.GET.get("page"))
+    paginator = CursorPaginator(queryset, 24, listing_sort_keys(request.GET))
+    page = cached_page(paginator, LISTINGS, club, request.GET)
     base_query = request.GET.copy()
     base_query.pop("page", None)
     seller_clubs = (
@@ -195,12 +210,8 @@ def listing_detail(request, pk: int):
         pk=pk,
     )
     club = getattr(request.user, "club", None)
-    if listing.visibility == Listing.Visibility.INVITE_ONLY:
-        if not club:
-            raise PermissionDenied("Not allowed.")
-        invited = listing.invites.filter(club=club).exists()
-        if listing.listed_by_club_id != club.id and not invited:
-            raise PermissionDenied("Not allowed.")
+    if not can_view_listing(club, listing):
+        raise PermissionDenied("Not allowed.")
     player_stats = (
         PlayerStats.objects.filter(player=listing.player)
         .order_by("-season", "-updated_at", "-id")
@@ -215,20 +226,12 @@ def listing_detail(request, pk: int):
     recent_form = None
     if listing.player.form and listing.player.form.key_metrics:
         recent_form = listing.player.form.key_metrics.get("recent_results")
-    offers_count = listing.offers.exclude(status=Offer.Status.DRAFT).count()
     related = (
         Listing.objects.select_related("player", "player__current_club", "player__form", "listed_by_club")
         .filter(status=Listing.Status.OPEN, player__position=listing.player.position)
         .exclude(id=listing.id)
     )
-    if club:
-        related = related.filter(
-            Q(visibility=Listing.Visibility.PUBLIC)
-            | Q(listed_by_club=club)
-            | Q(invites__club=club)
-        )
-    else:
-        related = related.filter(visibility=Listing.Visibility.PUBLIC)
+    related = related.filter(listing_visibility_filter(club))
     return render(
         request,
         "marketplace/listing_detail.html",
@@ -237,7 +240,7 @@ def listing_detail(request, pk: int):
             "player": listing.player,
             "player_stats": player_stats,
             "recent_form": recent_form,
-            "offers_count": offers_count,
+            "offers_count": listing.offers_count,
             "contract_end_date": contract_end_date,
             "related_listings": related[:4],
             "is_seller": bool(club and listing.listed_by_club_id == club.id),
@@ -253,23 +256,14 @@ def _require_club(user):
     return club
 
 
-def _expire_inbox_offers(queryset):
-    now = timezone.now()
-    expirable = queryset.filter(
-        status__in=[Offer.Status.SENT, Offer.Status.COUNTERED],
-        expires_at__isnull=False,
-        expires_at__lte=now,
-    )
-    for offer in expirable:
-        close_offer_if_expired(offer, now=now)
-
-
 def _group_offers(offers, club, mode: str):
     needs_response = []
     awaiting_reply = []
     closed = []
+    offers = list(offers)
+    last_messages = latest_messages([offer.pk for offer in offers])
     for offer in offers:
-        pending = offer.status in {Offer.Status.SENT, Offer.Status.COUNTERED}
+        pending = offer.is_pending
         last_actor_id = offer.last_actor_club_id
         is_unread = pending and last_actor_id and last_actor_id != club.id
         if mode == "received":
@@ -283,7 +277,7 @@ def _group_offers(offers, club, mode: str):
             "counterparty": counterparty,
             "latest_fee": offer.fee_amount,
             "latest_wage": offer.wage_weekly,
-            "last_message": offer.messages.order_by("-created_at").first(),
+            "last_message": last_messages.get(offer.pk),
             "last_action_at": offer.last_action_at,
             "expires_at": offer.expires_at,
             "unread": is_unread,
@@ -314,54 +308,15 @@ def _offer_thread_context(
     can_scout,
     request,
 ):
-    events = []
-    message_map = {
-        message.id: message
-        for message in OfferMessage.objects.filter(offer=offer).select_related(
-            "sender_user", "sender_club"
-        )
-    }
-    for event in offer.events.select_related("actor_club").order_by("created_at"):
-        payload = event.payload or {}
-        message = None
-        if event.event_type == OfferEvent.EventType.MESSAGE:
-            message = message_map.get(payload.get("message_id"))
-        terms = payload.get("terms")
-        if event.event_type in {
-            OfferEvent.EventType.CREATED,
-            OfferEvent.EventType.SENT,
-            OfferEvent.EventType.COUNTERED,
-        } and not terms:
-            terms = {
-                "fee_amount": str(offer.fee_amount) if offer.fee_amount is not None else None,
-                "wage_weekly": str(offer.wage_weekly) if offer.wage_weekly is not None else None,
-                "contract_years": offer.contract_years,
-                "contract_end_date": offer.contract_end_date.isoformat()
-                if offer.contract_end_date
-                else None,
-            }
-        events.append(
-            {
-                "event": event,
-                "direction": "sent" if event.actor_club_id == club.id else "received",
-                "actor_name": event.actor_club.name if event.actor_club else "System",
-                "message": message.body if message else None,
-                "terms": terms,
-                "timestamp": event.created_at,
-            }
-        )
-
-    last_event = events[-1]["event"] if events else None
-    pending = offer.status in {Offer.Status.SENT, Offer.Status.COUNTERED}
+    thread = load_thread(offer, club)
+    pending = offer.is_pending
     is_participant = club.id in {offer.from_club_id, offer.to_club_id}
-    your_turn = bool(
-        pending
-        and is_participant
-        and last_event
-        and last_event.actor_club_id != club.id
-    )
+    # The offer's last_* columns say whose turn it is, whatever page of the
+    # thread is loaded.
+    last_actor_id = offer.last_actor_club_id
+    your_turn = bool(pending and is_participant and last_actor_id and last_actor_id != club.id)
     awaiting_label = None
-    if pending and last_event and last_event.actor_club_id == club.id:
+    if pending and last_actor_id == club.id:
         awaiting_label = (
             offer.to_club.name if club.id == offer.from_club_id else offer.from_club.name
         )
@@ -376,13 +331,15 @@ def _offer_thread_context(
         Offer.Status.WITHDRAWN: 4,
         Offer.Status.EXPIRED: 4,
     }
-    current_step = status_step_map.get(offer.status, 0)
+    current_step = status_step_map.get(
+        Offer.Status.EXPIRED if offer.is_overdue else offer.status, 0
+    )
 
     return {
         "offer": offer,
         "club": club,
         "role": role,
-        "events": events,
+        "thread": thread,
         "message_form": message_form,
         "offer_counter_form": counter_form,
         "shortlists": shortlists,
@@ -403,27 +360,19 @@ def offer_received_list(request):
     q = request.GET.get("q", "").strip()
     listing_id = request.GET.get("listing")
 
-    last_event = OfferEvent.objects.filter(offer_id=OuterRef("pk")).order_by("-created_at")
     offers = (
         Offer.objects.select_related("player", "from_club", "to_club")
-        .prefetch_related("messages")
         .filter(to_club=club)
-        .annotate(
-            last_actor_club_id=Subquery(last_event.values("actor_club_id")[:1]),
-            last_event_type=Subquery(last_event.values("event_type")[:1]),
-        )
         .order_by("-last_action_at")
     )
     if status:
         offers = offers.filter(status=status)
     if q:
-        offers = offers.filter(player__name__icontains=q)
+        offers = name_search(offers, q, field="player__search_name")
     if listing_id:
         offers = offers.filter(listing_id=listing_id)
 
-    _expire_inbox_offers(offers)
-
-    paginator = Paginator(offers, 25)
+    paginator = CursorPaginator(offers, 25, [("last_action_at", "desc")])
     page = paginator.get_page(request.GET.get("page"))
     grouped = _group_offers(page.object_list, club, mode="received")
     return render(
@@ -445,27 +394,19 @@ def offer_sent_list(request):
     q = request.GET.get("q", "").strip()
     listing_id = request.GET.get("listing")
 
-    last_event = OfferEvent.objects.filter(offer_id=OuterRef("pk")).order_by("-created_at")
     offers = (
         Offer.objects.select_related("player", "from_club", "to_club")
-        .prefetch_related("messages")
         .filter(from_club=club)
-        .annotate(
-            last_actor_club_id=Subquery(last_event.values("actor_club_id")[:1]),
-            last_event_type=Subquery(last_event.values("event_type")[:1]),
-        )
         .order_by("-last_action_at")
     )
     if status:
         offers = offers.filter(status=status)
     if q:
-        offers = offers.filter(player__name__icontains=q)
+        offers = name_search(offers, q, field="player__search_name")
     if listing_id:
         offers = offers.filter(listing_id=listing_id)
 
-    _expire_inbox_offers(offers)
-
-    paginator = Paginator(offers, 25)
+    paginator = CursorPaginator(offers, 25, [("last_action_at", "desc")])
     page = paginator.get_page(request.GET.get("page"))
     grouped = _group_offers(page.object_list, club, mode="sent")
     return render(
@@ -489,7 +430,6 @@ def offer_detail(request, pk: int):
     if club.id not in {offer.from_club_id, offer.to_club_id} and not request.user.is_staff:
         raise PermissionDenied("Not allowed.")
 
-    close_offer_if_expired(offer)
     messages_form = OfferMessageForm()
     counter_form = OfferForm()
     role = "Staff"
@@ -522,6 +462,33 @@ def offer_detail(request, pk: int):
     return render(request, "marketplace/offer_detail.html", context)
 
 
+@login_required
+def offer_events(request, pk: int):
+    # ?before=<event id> returns the previous page of the thread (and its own
+    # "Load older" button); ?after=<event id> only the events since, which the
+    # poller appends in place of itself.
+    offer = get_object_or_404(Offer.objects.select_related("from_club", "to_club"), pk=pk)
+    club = _require_club(request.user)
+    if club.id not in {offer.from_club_id, offer.to_club_id} and not request.user.is_staff:
+        raise PermissionDenied("Not allowed.")
+    try:
+        before = int(request.GET["before"]) if "before" in request.GET else None
+        after = int(request.GET.get("after", 0))
+    except ValueError:
+        return HttpResponseBadRequest("Invalid cursor")
+    if before is not None:
+        thread = load_thread(offer, club, before=before)
+        poll = False
+    else:
+        thread = load_thread_since(offer, club, after)
+        poll = True
+    return render(
+        request,
+        "marketplace/_offer_thread_events.html",
+        {"offer": offer, "thread": thread, "poll": poll},
+    )
+
+
 @login_required
 def offer_new(request):
     club = _require_club(request.user)
@@ -0,0 +1,75 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Listing, ListingInvite
+
+_ACCESS_KEY = "marketplace:access:{}"
+
+
+def _load_private_listing_ids(club_id) -> tuple[int, ...]:
+    return tuple(
+        sorted(
+            Listing.objects.filter(status=Listing.Status.OPEN)
+            .exclude(visibility=Listing.Visibility.PUBLIC)
+            .filter(Q(listed_by_club_id=club_id) | Q(invites__club_id=club_id))
+            .values_list("pk", flat=True)
+            .distinct()
+        )
+    )
+
+
+def private_listing_ids(club) -> frozenset[int]:
+    # Open non-public listings this club may see (its own plus invites),
+    # cached as a sorted id tuple. The set can briefly include a listing that
+    # was closed via .update(); callers always filter on OPEN as well.
+    if club is None:
+        return frozenset()
+    key = _ACCESS_KEY.format(club.pk)
+    ids = cache.get(key)
+    if ids is None:
+        ids = _load_private_listing_ids(club.pk)
+        cache.set(key, ids, settings.TRANSFERX_LISTING_ACCESS_CACHE_SECONDS)
+    return frozenset(ids)
+
+
+def listing_visibility_filter(club, prefix: str = "") -> Q:
+    # "public OR mine OR invited" as one indexed id list instead of joins.
+    public = Q(**{f"{prefix}visibility": Listing.Visibility.PUBLIC})
+    ids = private_listing_ids(club)
+    if not ids:
+        return public
+    return public | Q(**{f"{prefix}pk__in": sorted(ids)})
+
+
+def can_view_listing(club, listing: Listing) -> bool:
+    if listing.visibility == Listing.Visibility.PUBLIC:
+        return True
+    if club is None:
+        return False
+    if listing.listed_by_club_id == club.id:
+        return True
+    if listing.status == Listing.Status.OPEN:
+        return listing.pk in private_listing_ids(club)
+    # Closed listings are not in the cached set; fall back to the invite row.
+    return ListingInvite.objects.filter(listing=listing, club=club).exists()
+
+
+def _forget(club_ids) -> None:
+    cache.delete_many([_ACCESS_KEY.format(club_id) for club_id in club_ids if club_id])
+
+
+def invalidate_listing_access(club_ids) -> None:
+    # Drop now and again on commit, so a reader that repopulated the set from
+    # pre-commit rows does not keep it for the full TTL.
+    club_ids = list(club_ids)
+    _forget(club_ids)
+    transaction.on_commit(lambda: _forget(club_ids))
+
+
+def invalidate_listing_access_for_listing(listing: Listing) -> None:
+    club_ids = list(
+        ListingInvite.objects.filter(listing=listing).values_list("club_id", flat=True)
+    )
+    invalidate_listing_access([listing.listed_by_club_id, *club_ids])
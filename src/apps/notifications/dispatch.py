@@ -0,0 +1,132 @@
+import threading
+from contextlib import ContextDecorator
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.accounts.counters import count_new_notifications
+from .models import Notification
+
+STAFF_RECIPIENTS_KEY = "notifications:staff_recipient_ids"
+
+_pending = threading.local()
+
+
+def staff_recipient_ids() -> tuple[int, ...]:
+    # Cached; signals.py drops the entry whenever a user is saved or deleted.
+    ids = cache.get(STAFF_RECIPIENTS_KEY)
+    if ids is None:
+        ids = tuple(
+            get_user_model()
+            .objects.filter(is_staff=True, is_active=True)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        cache.set(STAFF_RECIPIENTS_KEY, ids, settings.TRANSFERX_STAFF_RECIPIENTS_CACHE_SECONDS)
+    return ids
+
+
+def forget_staff_recipients() -> None:
+    cache.delete(STAFF_RECIPIENTS_KEY)
+
+
+# Extra audiences per notification type, resolved when the batch is written:
+# whoever a service notifies directly, these get a copy too.
+FANOUT_RULES = {
+    Notification.Type.AUCTION_BID_ACCEPTED: [staff_recipient_ids],
+}
+
+
+def queue_notification(
+    *,
+    recipient,
+    type,
+    message,
+    link="",
+    related_player=None,
+    related_club=None,
+) -> None:
+    # Like create_notification(), but the row is written only once the
+    # surrounding transaction commits. Inside a notification_batch it is
+    # written with the rest of the batch in one bulk_create.
+    if not recipient:
+        return
+    notification = Notification(
+        recipient_id=getattr(recipient, "pk", recipient),
+        type=type,
+        message=message,
+        link=link,
+        related_player=related_player,
+        related_club=related_club,
+    )
+    batch = getattr(_pending, "notifications", None)
+    if batch is None:
+        transaction.on_commit(lambda: write_notifications([notification]))
+    else:
+        batch.append(notification)
+
+
+class notification_batch(ContextDecorator):
+    # Apply inside transaction.atomic: when the outermost batch exits cleanly
+    # its notifications are handed to one on_commit callback, so nothing is
+    # written while the service still holds its row locks, and nothing at all
+    # if the transaction rolls back. State is thread-local because one
+    # decorator instance is shared by every call.
+    def __enter__(self):
+        _pending.depth = getattr(_pending, "depth", 0) + 1
+        if _pending.depth == 1:
+            _pending.notifications = []
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _pending.depth -= 1
+        if _pending.depth:
+            return False
+        notifications = _pending.notifications
+        del _pending.notifications
+        if exc_type is None and notifications:
+            transaction.on_commit(lambda: write_notifications(notifications))
+        return False
+
+
+def _fan_out(notifications) -> list[Notification]:
+    # Adds the per-type audiences and drops repeats of the same notice to the
+    # same user (a seller who is also staff gets one copy, not two).
+    seen = set()
+    rows = []
+
+    def add(notification):
+        key = (
+            notification.recipient_id,
+            notification.type,
+            notification.link,
+            notification.message,
+        )
+        if key not in seen:
+            seen.add(key)
+            rows.append(notification)
+
+    for notification in notifications:
+        add(notification)
+        for audience in FANOUT_RULES.get(notification.type, ()):
+            for user_id in audience():
+                add(
+                    Notification(
+                        recipient_id=user_id,
+                        type=notification.type,
+                        message=notification.message,
+                        link=notification.link,
+                        related_player=notification.related_player,
+                        related_club=notification.related_club,
+                    )
+                )
+    return rows
+
+
+@transaction.atomic
+def write_notifications(notifications) -> int:
+    rows = Notification.objects.bulk_create(_fan_out(notifications))
+    count_new_notifications(rows)
+    return len(rows)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_alter_notification_type'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='type',
+            field=models.CharField(choices=[('OUTBID', 'Outbid'), ('OFFER_RECEIVED', 'Offer received'), ('OFFER_ACCEPTED', 'Offer accepted'), ('OFFER_REJECTED', 'Offer rejected'), ('OFFER_COUNTERED', 'Offer countered'), ('OFFER_EXPIRING', 'Offer expiring'), ('OFFER_EXPIRED', 'Offer expired'), ('LISTING_NEW_OFFER', 'Listing new offer'), ('AUCTION_BID_RECEIVED', 'Auction bid received'), ('AUCTION_ENDING', 'Auction ending'), ('AUCTION_BID_ACCEPTED', 'Auction bid accepted'), ('DEAL_COMPLETED', 'Deal completed'), ('DEAL_COLLAPSED', 'Deal collapsed'), ('PLAYER_AVAILABLE', 'Player available')], db_index=True, max_length=50),
+        ),
+    ]
@@ -10,6 +10,7 @@ class Notification(models.Model):
         OFFER_REJECTED = "OFFER_REJECTED", "Offer rejected"
         OFFER_COUNTERED = "OFFER_COUNTERED", "Offer countered"
         OFFER_EXPIRING = "OFFER_EXPIRING", "Offer expiring"
+        OFFER_EXPIRED = "OFFER_EXPIRED", "Offer expired"
         LISTING_NEW_OFFER = "LISTING_NEW_OFFER", "Listing new offer"
         AUCTION_BID_RECEIVED = "AUCTION_BID_RECEIVED", "Auction bid received"
         AUCTION_ENDING = "AUCTION_ENDING", "Auction ending"
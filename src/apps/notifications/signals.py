@@ -0,0 +1,14 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .dispatch import forget_staff_recipients
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def forget_staff_on_user_change(sender, instance, **kwargs):
+    # Logins only touch last_login; anything else may change is_staff.
+    if kwargs.get("update_fields") == frozenset({"last_login"}):
+        return
+    forget_staff_recipients()
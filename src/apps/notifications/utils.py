@@ -1,3 +1,4 @@
+from apps.accounts.counters import notifications_changed
 from .models import Notification
 
 
@@ -12,7 +13,7 @@ def create_notification(
 ):
     if not recipient:
         return None
-    return Notification.objects.create(
+    notification = Notification.objects.create(
         recipient=recipient,
         type=type,
         message=message,
@@ -20,3 +21,5 @@ def create_notification(
         related_player=related_player,
         related_club=related_club,
     )
+    notifications_changed([notification.recipient_id])
+    return notification
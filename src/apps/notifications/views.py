@@ -5,18 +5,15 @@ from django.http import HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
 
+from apps.accounts.counters import get_counters, notifications_changed, request_counters
 from .models import Notification
 
 
 def notifications_unread_context(request):
-    user = getattr(request, "user", None)
-    if not user or not user.is_authenticated:
+    counters = request_counters(request)
+    if counters is None:
         return {"notifications_unread_count": 0}
-    return {
-        "notifications_unread_count": Notification.objects.filter(
-            recipient=user, is_read=False
-        ).count()
-    }
+    return {"notifications_unread_count": counters["notifications_unread"]}
 
 
 @login_required
@@ -60,21 +57,22 @@ def notification_go(request, pk: int):
     if not notification.is_read:
         notification.is_read = True
         notification.save(update_fields=["is_read"])
+        notifications_changed([request.user.pk])
     return redirect(notification.link or "/notifications/")
 
 
 @login_required
 def mark_all_read(request):
     if request.method == "POST":
-        Notification.objects.filter(recipient=request.user, is_read=False).update(
+        marked = Notification.objects.filter(recipient=request.user, is_read=False).update(
             is_read=True
         )
+        if marked:
+            notifications_changed([request.user.pk])
     return redirect("notifications:list")
 
 
 @login_required
 def notification_count(request):
-    count = Notification.objects.filter(
-        recipient=request.user, is_read=False
-    ).count()
+    count = get_counters(request.user.pk)["notifications_unread"]
     return HttpResponse(str(count), content_type="text/plain")
@@ -19,6 +19,7 @@ class Player(models.Model):
         FREE_AGENT = "FREE_AGENT", "Free agent"
 
     name = models.CharField(max_length=200)
+    search_name = models.CharField(max_length=200, blank=True, default="", editable=False)
     age = models.PositiveIntegerField(null=True, blank=True)
     nationality = models.CharField(max_length=100, blank=True, default="")
     position = models.CharField(max_length=10, choices=Position.choices, blank=True)
@@ -1,6 +1,7 @@
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
+from apps.marketplace.result_cache import bump_generation
 from apps.notifications.models import Notification
 from apps.notifications.utils import create_notification
 from apps.scouting.models import ShortlistItem
@@ -46,3 +47,9 @@ def notify_player_available(sender, instance, created, **kwargs):
             related_player=instance,
             related_club=club,
         )
+
+
+@receiver(post_save, sender=Player)
+@receiver(post_delete, sender=Player)
+def invalidate_market_results(sender, **kwargs):
+    bump_generation()
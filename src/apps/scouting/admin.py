@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import PlayerInterest, Shortlist, ShortlistItem
+from .models import PlayerInterest, SavedSearch, Shortlist, ShortlistItem
 
 
 @admin.register(Shortlist)
@@ -21,3 +21,9 @@ class PlayerInterestAdmin(admin.ModelAdmin):
     list_display = ("club", "player", "level", "stage", "last_touched_at")
     list_filter = ("level", "stage", "club")
     search_fields = ("player__name", "club__name")
+
+
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    list_display = ("name", "club", "updated_at")
+    search_fields = ("name", "club__name")
@@ -0,0 +1,27 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.marketplace.models import PlayerMarketIndex
+from apps.scouting.matching import match_players
+
+
+class Command(BaseCommand):
+    help = "Match recently changed players against saved searches (for writes that skip signals)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--since-minutes", type=int, default=60)
+        parser.add_argument("--all", action="store_true", help="Re-match every indexed player")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        changed = PlayerMarketIndex.objects.all()
+        if not options["all"]:
+            since = timezone.now() - timedelta(minutes=options["since_minutes"])
+            changed = changed.filter(updated_at__gte=since)
+        player_ids = list(changed.values_list("player_id", flat=True))
+        created = match_players(player_ids, batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Checked players={len(player_ids)} new_matches={created}")
+        )
@@ -0,0 +1,297 @@
+import threading
+from collections import defaultdict
+from contextlib import ContextDecorator
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.http import QueryDict
+
+from apps.accounts.counters import count_new_notifications
+from apps.marketplace.models import Listing
+from apps.marketplace.query import player_search_queryset
+from apps.marketplace.search import normalize_search_text
+from apps.marketplace.visibility import private_listing_ids
+from apps.notifications.models import Notification
+from apps.players.models import Player
+from .models import SavedSearch, SavedSearchMatch
+
+# The subset of player market filters a saved search keeps; sort and page are
+# presentation only.
+SEARCH_PARAMS = {
+    "q": str,
+    "position": str,
+    "nationality": str,
+    "club": int,
+    "free_agent_only": bool,
+    "listed_only": bool,
+    "min_form": float,
+    "max_form": float,
+    "min_age": int,
+    "max_age": int,
+}
+AVAILABILITY_VALUES = ("transfer", "loan", "free_agent", "open_to_offers")
+MATCH_BATCH_SIZE = 500
+
+_pending = threading.local()
+
+
+def clean_search_params(params) -> dict:
+    cleaned = {}
+    for key, kind in SEARCH_PARAMS.items():
+        raw = str(params.get(key) or "").strip()
+        if not raw:
+            continue
+        if kind is bool:
+            if raw in {"1", "true", "True"}:
+                cleaned[key] = True
+            continue
+        try:
+            cleaned[key] = kind(raw)
+        except ValueError:
+            continue
+    values = params.getlist("availability") if hasattr(params, "getlist") else []
+    if not values:
+        raw = params.get("availability") or ""
+        values = raw if isinstance(raw, list) else raw.split(",")
+    availability = sorted({value.strip().lower() for value in values} & set(AVAILABILITY_VALUES))
+    if availability:
+        cleaned["availability"] = availability
+    return cleaned
+
+
+def search_query_dict(params: dict) -> QueryDict:
+    query = QueryDict(mutable=True)
+    for key, value in params.items():
+        if isinstance(value, list):
+            query.setlist(key, value)
+        else:
+            query[key] = "1" if value is True else str(value)
+    return query
+
+
+def _in_range(value, low, high) -> bool:
+    if value is None:
+        return False
+    return (low is None or value >= low) and (high is None or value <= high)
+
+
+def _range_check(field, low, high):
+    # Binds its own bounds; a closure over shared names would see the last range.
+    return lambda row: _in_range(row[field], low, high)
+
+
+def compile_search(search: SavedSearch, access_for):
+    # Mirrors player_search_queryset for a club actor, as a predicate over the
+    # row built by _player_facts(). ``access_for(club_id)`` returns the
+    # invite-only listing ids that club can see.
+    params = search.params
+    club_id = search.club_id
+    checks = []
+
+    position = params.get("position")
+    if position:
+        checks.append(lambda row: row["position"] == position)
+    term = normalize_search_text(params.get("q"))
+    if term:
+        checks.append(lambda row: term in row["search_name"] or term in row["club_search_name"])
+    nationality = (params.get("nationality") or "").casefold()
+    if nationality:
+        checks.append(lambda row: nationality in (row["nationality"] or "").casefold())
+    if "club" in params:
+        checks.append(lambda row: row["current_club_id"] == params["club"])
+    if params.get("free_agent_only"):
+        checks.append(lambda row: row["current_club_id"] is None)
+    if params.get("listed_only"):
+        checks.append(lambda row: bool(row["listings"]))
+    if "min_form" in params or "max_form" in params:
+        checks.append(_range_check("form_score", params.get("min_form"), params.get("max_form")))
+    if "min_age" in params or "max_age" in params:
+        checks.append(_range_check("age", params.get("min_age"), params.get("max_age")))
+
+    availability = set(params.get("availability") or ())
+    if availability:
+
+        def visible_types(row):
+            return {
+                listing_type
+                for listing_id, listing_type, visibility in row["listings"]
+                if visibility == Listing.Visibility.PUBLIC or listing_id in access_for(club_id)
+            }
+
+        def available(row):
+            if "open_to_offers" in availability and row["open_to_offers"]:
+                return True
+            if "free_agent" in availability and row["status"] == Player.Status.FREE_AGENT:
+                return True
+            types = visible_types(row)
+            return (
+                ("transfer" in availability and Listing.ListingType.TRANSFER in types)
+                or ("loan" in availability and Listing.ListingType.LOAN in types)
+                or ("free_agent" in availability and Listing.ListingType.FREE_AGENT in types)
+            )
+
+        checks.append(available)
+
+    return lambda row: all(check(row) for check in checks)
+
+
+def _player_facts(player_ids) -> dict:
+    # Private players never appear in the market, so they match nothing.
+    rows = {
+        row["pk"]: {**row, "listings": []}
+        for row in Player.objects.filter(pk__in=player_ids)
+        .exclude(visibility=Player.Visibility.PRIVATE)
+        .values(
+            "pk",
+            "name",
+            "search_name",
+            "position",
+            "nationality",
+            "current_club_id",
+            "status",
+            "open_to_offers",
+            "age",
+            club_search_name=F("current_club__search_name"),
+            form_score=F("form__form_score"),
+        )
+    }
+    for listing_id, player_id, listing_type, visibility in Listing.objects.filter(
+        player_id__in=rows, status=Listing.Status.OPEN
+    ).values_list("pk", "player_id", "listing_type", "visibility"):
+        rows[player_id]["listings"].append((listing_id, listing_type, visibility))
+    for row in rows.values():
+        row["club_search_name"] = row["club_search_name"] or ""
+    return rows
+
+
+def _grouped_searches():
+    # Most saved searches pin a position, so bucketing on it means each
+    # player is only tested against its own position's searches plus the
+    # position-agnostic ones.
+    access = {}
+
+    def access_for(club_id):
+        if club_id not in access:
+            access[club_id] = private_listing_ids(searches_by_club[club_id].club)
+        return access[club_id]
+
+    groups = defaultdict(list)
+    searches_by_club = {}
+    for search in SavedSearch.objects.select_related("club__user"):
+        searches_by_club[search.club_id] = search
+        groups[search.params.get("position", "")].append(
+            (search, compile_search(search, access_for))
+        )
+    return groups
+
+
+def _match_batch(player_ids, groups) -> int:
+    facts = _player_facts(player_ids)
+    matched = {}
+    for player_id, row in facts.items():
+        for search, predicate in groups.get(row["position"], []) + groups.get("", []):
+            if predicate(row):
+                matched[(search.pk, player_id)] = search
+
+    existing = set(
+        SavedSearchMatch.objects.filter(player_id__in=player_ids).values_list(
+            "search_id", "player_id"
+        )
+    )
+    stale = existing - set(matched)
+    if stale:
+        dropped = Q()
+        for search_id, player_id in stale:
+            dropped |= Q(search_id=search_id, player_id=player_id)
+        SavedSearchMatch.objects.filter(dropped).delete()
+
+    new = [key for key in matched if key not in existing]
+    SavedSearchMatch.objects.bulk_create(
+        [SavedSearchMatch(search_id=search_id, player_id=player_id) for search_id, player_id in new],
+        ignore_conflicts=True,
+    )
+    notifications = []
+    for search_id, player_id in new:
+        search = matched[(search_id, player_id)]
+        row = facts[player_id]
+        if not search.club.user_id or row["current_club_id"] == search.club_id:
+            continue
+        notifications.append(
+            Notification(
+                recipient_id=search.club.user_id,
+                type=Notification.Type.PLAYER_AVAILABLE,
+                message=f"{row['name']} matches your saved search \"{search.name}\"."[:255],
+                link=f"/players/market/{player_id}/",
+                related_player_id=player_id,
+                related_club_id=search.club_id,
+            )
+        )
+    count_new_notifications(Notification.objects.bulk_create(notifications))
+    return len(new)
+
+
+def match_players(player_ids, batch_size: int = MATCH_BATCH_SIZE) -> int:
+    # Evaluates changed players against every saved search in memory instead
+    # of re-running each search as a query. Returns the number of new matches.
+    player_ids = sorted({player_id for player_id in player_ids if player_id})
+    if not player_ids:
+        return 0
+    groups = _grouped_searches()
+    if not groups:
+        return 0
+    created = 0
+    for start in range(0, len(player_ids), batch_size):
+        created += _match_batch(player_ids[start : start + batch_size], groups)
+    return created
+
+
+def _flush_pending() -> None:
+    player_ids = getattr(_pending, "player_ids", None)
+    _pending.player_ids = set()
+    if player_ids:
+        match_players(player_ids)
+
+
+def queue_saved_search_match(player_ids) -> None:
+    # Collects player ids for the surrounding transaction; the first commit
+    # callback drains the whole set, later ones find it empty. Inside
+    # deferred_matching() the ids wait for the block to exit instead.
+    pending = getattr(_pending, "player_ids", None)
+    if pending is None:
+        pending = _pending.player_ids = set()
+    pending.update(player_id for player_id in player_ids if player_id)
+    if not getattr(_pending, "deferred", 0):
+        transaction.on_commit(_flush_pending)
+
+
+class deferred_matching(ContextDecorator):
+    # For bulk writers that save row by row in autocommit (each save its own
+    # commit): matching runs once when the outermost block exits, over every
+    # player queued inside it, rather than once per row. Players saved before
+    # an exception are committed, so they are still matched.
+    def __enter__(self):
+        _pending.deferred = getattr(_pending, "deferred", 0) + 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _pending.deferred -= 1
+        if not _pending.deferred and getattr(_pending, "player_ids", None):
+            transaction.on_commit(_flush_pending)
+        return False
+
+
+def seed_search_matches(search: SavedSearch) -> int:
+    # Players already matching when a search is saved are the baseline, not
+    # news; only later arrivals notify.
+    player_ids = (
+        player_search_queryset(search.club, search_query_dict(search.params))
+        .order_by()
+        .values_list("pk", flat=True)
+    )
+    return len(
+        SavedSearchMatch.objects.bulk_create(
+            (SavedSearchMatch(search=search, player_id=player_id) for player_id in player_ids),
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+    )
@@ -78,3 +78,41 @@ class PlayerInterest(models.Model):
 
     def __str__(self) -> str:
         return f"{self.club.name}: {self.player.name}"
+
+
+class SavedSearch(models.Model):
+    # ``params`` uses the player market query vocabulary (see
+    # apps.scouting.matching.SEARCH_PARAMS).
+    club = models.ForeignKey(Club, related_name="saved_searches", on_delete=models.CASCADE)
+    name = models.CharField(max_length=120)
+    params = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["club", "name"], name="uq_savedsearch_club_name")
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.club.name}: {self.name}"
+
+
+class SavedSearchMatch(models.Model):
+    # Players currently matching a saved search; a player alerts once when it
+    # enters the set and again only after dropping out and coming back.
+    search = models.ForeignKey(SavedSearch, related_name="matches", on_delete=models.CASCADE)
+    player = models.ForeignKey(
+        Player, related_name="saved_search_matches", on_delete=models.CASCADE
+    )
+    matched_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["search", "player"], name="uq_savedsearchmatch_search_player"
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.search.name}: {self.player.name}"
@@ -7,7 +7,10 @@ from django.utils import timezone
 
 from apps.marketplace.models import Listing, Offer
 from apps.marketplace.services import get_actor_club as marketplace_get_actor_club
-from .models import PlayerInterest, Shortlist, ShortlistItem
+from .matching import clean_search_params, seed_search_matches
+from .models import PlayerInterest, SavedSearch, Shortlist, ShortlistItem
+
+MAX_SAVED_SEARCHES = 20
 
 
 def get_actor_club(user):
@@ -122,3 +125,23 @@ def watched_now_available(club):
                 }
             )
     return results
+
+
+@transaction.atomic
+def create_saved_search(club, name, params):
+    if not name:
+        raise ValidationError("Saved search name is required.")
+    cleaned = clean_search_params(params)
+    if not cleaned:
+        raise ValidationError("Pick at least one filter before saving a search.")
+    if SavedSearch.objects.filter(club=club).count() >= MAX_SAVED_SEARCHES:
+        raise ValidationError(f"Clubs can keep at most {MAX_SAVED_SEARCHES} saved searches.")
+    if SavedSearch.objects.filter(club=club, name=name).exists():
+        raise ValidationError("A saved search with that name already exists.")
+    search = SavedSearch.objects.create(club=club, name=name, params=cleaned)
+    seed_search_matches(search)
+    return search
+
+
+def delete_saved_search(search):
+    search.delete()
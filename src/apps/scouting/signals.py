@@ -0,0 +1,25 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.marketplace.models import Listing, ListingInvite
+from apps.players.models import Player
+from apps.stats.models import PlayerForm
+from .matching import queue_saved_search_match
+
+
+@receiver(post_save, sender=Listing)
+@receiver(post_save, sender=PlayerForm)
+@receiver(post_save, sender=Player)
+def match_saved_searches_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    queue_saved_search_match([instance.pk if sender is Player else instance.player_id])
+
+
+@receiver(post_save, sender=ListingInvite)
+def match_saved_searches_on_invite(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    queue_saved_search_match(
+        Listing.objects.filter(pk=instance.listing_id).values_list("player_id", flat=True)
+    )
@@ -20,5 +20,8 @@ urlpatterns = [
     ),
     path("interest/set/", views.interest_set, name="interest_set"),
     path("interest/clear/", views.interest_clear, name="interest_clear"),
+    path("searches/", views.saved_search_list, name="saved_search_list"),
+    path("searches/new/", views.saved_search_create, name="saved_search_create"),
+    path("searches/<int:pk>/delete/", views.saved_search_delete, name="saved_search_delete"),
     path("targets/", views.targets_dashboard, name="targets_dashboard"),
 ]
@@ -3,18 +3,23 @@ from datetime import timedelta
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied, ValidationError
+from django.http import QueryDict
 from django.db.models import Count
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
 
 from apps.marketplace.models import Listing
+from apps.marketplace.search import name_search
 from apps.players.models import Player
 from .forms import ShortlistForm
-from .models import PlayerInterest, Shortlist, ShortlistItem
+from .matching import search_query_dict
+from .models import PlayerInterest, SavedSearch, Shortlist, ShortlistItem
 from .services import (
     add_player_to_shortlist,
     clear_player_interest,
+    create_saved_search,
     create_shortlist,
+    delete_saved_search,
     delete_shortlist,
     get_actor_club,
     offers_expiring_soon,
@@ -74,7 +79,7 @@ def shortlist_detail(request, pk: int):
         "player", "player__current_club"
     ).filter(shortlist=shortlist)
     if q:
-        items_qs = items_qs.filter(player__name__icontains=q)
+        items_qs = name_search(items_qs, q, field="player__search_name")
 
     items = list(items_qs.order_by("priority", "-updated_at"))
 
@@ -268,3 +273,43 @@ def targets_dashboard(request):
             "watched_available": watched_available,
         },
     )
+
+
+@login_required
+def saved_search_list(request):
+    club = _require_club(request.user)
+    searches = list(
+        SavedSearch.objects.filter(club=club)
+        .annotate(match_count=Count("matches"))
+        .order_by("name")
+    )
+    for search in searches:
+        search.query = search_query_dict(search.params).urlencode()
+    return render(request, "scouting/saved_search_list.html", {"searches": searches})
+
+
+@login_required
+def saved_search_create(request):
+    club = _require_club(request.user)
+    if request.method == "POST":
+        try:
+            create_saved_search(
+                club,
+                name=request.POST.get("name", "").strip(),
+                params=QueryDict(request.POST.get("query", "")),
+            )
+            messages.success(request, "Search saved. New matches will appear in notifications.")
+            return redirect("scouting:saved_search_list")
+        except ValidationError as exc:
+            messages.error(request, exc.messages[0])
+    return redirect(request.POST.get("next") or "player_market_list")
+
+
+@login_required
+def saved_search_delete(request, pk: int):
+    club = _require_club(request.user)
+    search = get_object_or_404(SavedSearch, pk=pk, club=club)
+    if request.method == "POST":
+        delete_saved_search(search)
+        messages.success(request, "Saved search deleted.")
+    return redirect("scouting:saved_search_list")
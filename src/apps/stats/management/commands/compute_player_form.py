@@ -2,6 +2,7 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from apps.players.models import Player
+from apps.scouting.matching import deferred_matching
 from apps.stats.form import compute_form_from_snapshots, compute_trend
 from apps.stats.models import PlayerForm, PlayerStatsSnapshot
 
@@ -34,48 +35,50 @@ class Command(BaseCommand):
         skipped = 0
         failed = 0
 
-        for player in players:
-            processed += 1
-            snapshots = list(
-                PlayerStatsSnapshot.objects.filter(
+        # Saved search alerts for the whole run are matched in one pass.
+        with deferred_matching():
+            for player in players:
+                processed += 1
+                snapshots = list(
+                    PlayerStatsSnapshot.objects.filter(
+                        player=player,
+                        vendor="api_sports_v3",
+                        season=season,
+                        league_id=league_id,
+                    )
+                    .order_by("-as_of")[: window_games * 2]
+                )
+                if not snapshots:
+                    skipped += 1
+                    continue
+
+                computed = compute_form_from_snapshots(snapshots, window_games)
+                if computed["minutes"] is not None and computed["minutes"] < min_minutes:
+                    skipped += 1
+                    continue
+
+                if dry_run:
+                    updated += 1
+                    continue
+
+                PlayerForm.objects.update_or_create(
                     player=player,
                     vendor="api_sports_v3",
                     season=season,
                     league_id=league_id,
+                    window_games=window_games,
+                    defaults={
+                        "as_of": timezone.now(),
+                        "form_score": computed["form_score"],
+                        "avg_rating": computed["avg_rating"],
+                        "minutes": computed["minutes"],
+                        "goals": computed["goals"],
+                        "assists": computed["assists"],
+                        "trend": compute_trend(snapshots, window_games),
+                        "key_metrics": computed["key_metrics"],
+                    },
                 )
-                .order_by("-as_of")[: window_games * 2]
-            )
-            if not snapshots:
-                skipped += 1
-                continue
-
-            computed = compute_form_from_snapshots(snapshots, window_games)
-            if computed["minutes"] is not None and computed["minutes"] < min_minutes:
-                skipped += 1
-                continue
-
-            if dry_run:
                 updated += 1
-                continue
-
-            PlayerForm.objects.update_or_create(
-                player=player,
-                vendor="api_sports_v3",
-                season=season,
-                league_id=league_id,
-                window_games=window_games,
-                defaults={
-                    "as_of": timezone.now(),
-                    "form_score": computed["form_score"],
-                    "avg_rating": computed["avg_rating"],
-                    "minutes": computed["minutes"],
-                    "goals": computed["goals"],
-                    "assists": computed["assists"],
-                    "trend": compute_trend(snapshots, window_games),
-                    "key_metrics": computed["key_metrics"],
-                },
-            )
-            updated += 1
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.marketplace.result_cache import PLAYERS, bump_generation
+from .models import PlayerForm, PlayerStats
+
+
+@receiver(post_save, sender=PlayerForm)
+@receiver(post_delete, sender=PlayerForm)
+def invalidate_results_on_form(sender, **kwargs):
+    bump_generation()
+
+
+@receiver(post_save, sender=PlayerStats)
+@receiver(post_delete, sender=PlayerStats)
+def invalidate_results_on_stats(sender, **kwargs):
+    # Only the player market sorts on stats (rating, minutes).
+    bump_generation(PLAYERS)
@@ -8,6 +8,8 @@ from django.shortcuts import get_object_or_404, render
 from django.urls import reverse
 
 from apps.accounts.models import Club
+from apps.marketplace.pagination import CursorPaginator
+from apps.marketplace.search import name_search, order_by_relevance
 from apps.players.models import Player
 from apps.stats.models import PlayerStats
 
@@ -30,8 +32,9 @@ def club_list(request):
 
     clubs = Club.objects.filter(vendor_id__isnull=False)
     if q:
-        clubs = clubs.filter(name__icontains=q)
-    clubs = clubs.order_by("name")
+        clubs = order_by_relevance(name_search(clubs, q), "name")
+    else:
+        clubs = clubs.order_by("name")
 
     if league_id and season:
         club_ids = (
@@ -62,7 +65,7 @@ def club_detail(request, pk: int):
     season = request.GET.get("season")
     q = request.GET.get("q", "").strip()
     position = request.GET.get("position", "").strip()
-    sort = request.GET.get("sort", "form_desc")
+    sort = request.GET.get("sort") or ("relevance" if q else "form_desc")
 
     default_league, default_season = _default_league_season()
     league_id = int(league_id) if league_id else default_league
@@ -76,16 +79,18 @@ def club_detail(request, pk: int):
     if season:
         stats_qs = stats_qs.filter(season=season)
     if q:
-        stats_qs = stats_qs.filter(player__name__icontains=q)
+        stats_qs = name_search(stats_qs, q, field="player__search_name")
     if position:
         stats_qs = stats_qs.filter(position__iexact=position)
 
     if sort == "name":
-        stats_qs = stats_qs.order_by("player__name")
+        ordering = [("player__name", "asc")]
+    elif sort == "relevance" and q:
+        ordering = [("search_rank", "desc"), ("player__name", "asc")]
     else:
-        stats_qs = stats_qs.order_by("-form_score", "player__name")
+        ordering = [("form_score", "desc"), ("player__name", "asc")]
 
-    paginator = Paginator(stats_qs, 25)
+    paginator = CursorPaginator(stats_qs, 25, ordering)
     page = paginator.get_page(request.GET.get("page"))
 
     agg = stats_qs.aggregate(avg_age=Avg("player__age"), squad_size=Count("id"))
@@ -111,7 +116,7 @@ def player_list(request):
     season = request.GET.get("season")
     q = request.GET.get("q", "").strip()
     position = request.GET.get("position", "").strip()
-    sort = request.GET.get("sort", "form_desc")
+    sort = request.GET.get("sort") or ("relevance" if q else "form_desc")
     min_form = request.GET.get("min_form")
     club_id = request.GET.get("club")
 
@@ -125,7 +130,7 @@ def player_list(request):
     if season:
         stats_qs = stats_qs.filter(season=season)
     if q:
-        stats_qs = stats_qs.filter(player__name__icontains=q)
+        stats_qs = name_search(stats_qs, q, field="player__search_name")
     if position:
         stats_qs = stats_qs.filter(position__iexact=position)
     if club_id:
@@ -137,11 +142,13 @@ def player_list(request):
             pass
 
     if sort == "name":
-        stats_qs = stats_qs.order_by("player__name")
+        ordering = [("player__name", "asc")]
+    elif sort == "relevance" and q:
+        ordering = [("search_rank", "desc"), ("player__name", "asc")]
     else:
-        stats_qs = stats_qs.order_by("-form_score", "player__name")
+        ordering = [("form_score", "desc"), ("player__name", "asc")]
 
-    paginator = Paginator(stats_qs, 25)
+    paginator = CursorPaginator(stats_qs, 25, ordering)
     page = paginator.get_page(request.GET.get("page"))
 
     clubs = Club.objects.filter(vendor_id__isnull=False).order_by("name")
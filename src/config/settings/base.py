@@ -109,6 +109,25 @@ TRANSFERX_ENABLE_ANTI_SNIPING = get_bool("TRANSFERX_ENABLE_ANTI_SNIPING", False)
 TRANSFERX_SNIPING_WINDOW_MINUTES = int(get_env("TRANSFERX_SNIPING_WINDOW_MINUTES", "2"))
 TRANSFERX_SNIPING_EXTEND_MINUTES = int(get_env("TRANSFERX_SNIPING_EXTEND_MINUTES", "2"))
 TRANSFERX_BID_RATE = get_env("TRANSFERX_BID_RATE", "10/m")
+# "row" serializes bids with SELECT ... FOR UPDATE on the auction; "advisory"
+# uses a per-auction pg_advisory_xact_lock and conditional budget UPDATEs.
+TRANSFERX_BID_LOCKING = get_env("TRANSFERX_BID_LOCKING", "row")
+# "postgres" fans live auction updates out with LISTEN/NOTIFY across
+# processes; "memory" only reaches streams served by the publishing process.
+TRANSFERX_LIVE_BACKEND = get_env("TRANSFERX_LIVE_BACKEND", "postgres")
+TRANSFERX_LIVE_HEARTBEAT_SECONDS = int(get_env("TRANSFERX_LIVE_HEARTBEAT_SECONDS", "20"))
+TRANSFERX_EVENT_COMPACT_AFTER_DAYS = int(get_env("TRANSFERX_EVENT_COMPACT_AFTER_DAYS", "30"))
+TRANSFERX_STAFF_RECIPIENTS_CACHE_SECONDS = int(
+    get_env("TRANSFERX_STAFF_RECIPIENTS_CACHE_SECONDS", "300")
+)
+TRANSFERX_USER_COUNTERS_CACHE_SECONDS = int(
+    get_env("TRANSFERX_USER_COUNTERS_CACHE_SECONDS", "60")
+)
+TRANSFERX_FACET_CACHE_SECONDS = int(get_env("TRANSFERX_FACET_CACHE_SECONDS", "30"))
+TRANSFERX_RESULT_CACHE_SECONDS = int(get_env("TRANSFERX_RESULT_CACHE_SECONDS", "60"))
+TRANSFERX_LISTING_ACCESS_CACHE_SECONDS = int(
+    get_env("TRANSFERX_LISTING_ACCESS_CACHE_SECONDS", "300")
+)
 
 CACHES = {
     "default": {
@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.urls import include, path
 
-from apps.accounts.views import dashboard, dashboard_auctions_partial
+from apps.accounts.views import dashboard, dashboard_auctions_partial, dashboard_stream
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -12,6 +12,7 @@ urlpatterns = [
         dashboard_auctions_partial,
         name="dashboard_auctions_partial",
     ),
+    path("dashboard/stream/", dashboard_stream, name="dashboard_stream"),
     path("", include("apps.marketplace.discovery_urls")),
     path("accounts/", include("apps.accounts.urls")),
     path("players/", include("apps.players.urls")),
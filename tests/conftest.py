@@ -4,6 +4,7 @@ from decimal import Decimal
 import pytest
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.core.cache import cache
 from django.utils import timezone
 
 from apps.accounts.models import Club
@@ -11,6 +12,12 @@ from apps.auctions.models import Auction, Bid
 from apps.players.models import Player
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Facet counts and rate limits live in the cache; keep tests independent.
+    cache.clear()
+
+
 @pytest.fixture
 def groups(db):
     buyer_group, _ = Group.objects.get_or_create(name="buyer")
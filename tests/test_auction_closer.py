@@ -0,0 +1,100 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.accounts.models import ClubFinance
+from apps.auctions.models import Auction, AuctionEvent, Bid
+from apps.auctions.services import close_expired_auctions, place_bid
+from apps.players.models import Player
+
+
+@pytest.fixture
+def funded(buyer_user, buyer_user2):
+    ClubFinance.objects.filter(club__user__in=[buyer_user, buyer_user2]).update(
+        transfer_budget_total=Decimal("10000.00"), wage_budget_total_weekly=Decimal("1000.00")
+    )
+
+
+def _auction(seller_user, name, **kwargs):
+    player = Player.objects.create(
+        name=name, age=24, current_club=seller_user.club, created_by=seller_user
+    )
+    return Auction.objects.create(
+        player=player, seller=seller_user, deadline=timezone.now() + timedelta(hours=1), **kwargs
+    )
+
+
+def _expire(*auctions):
+    Auction.objects.filter(pk__in=[auction.pk for auction in auctions]).update(
+        deadline=timezone.now() - timedelta(minutes=1)
+    )
+
+
+@pytest.mark.django_db
+def test_closer_batches_and_releases_reservations(funded, seller_user, buyer_user, buyer_user2):
+    auctions = [_auction(seller_user, f"Expired {index}") for index in range(3)]
+    live = _auction(seller_user, "Still Live")
+    for auction in [*auctions, live]:
+        place_bid(auction, buyer_user, Decimal("100.00"), Decimal("10.00"))
+        place_bid(auction, buyer_user2, Decimal("120.00"), Decimal("12.00"))
+    _expire(*auctions)
+
+    assert close_expired_auctions(batch_size=2) == 2
+    assert close_expired_auctions(batch_size=2) == 1
+    assert close_expired_auctions(batch_size=2) == 0
+
+    for auction in auctions:
+        auction.refresh_from_db()
+        assert auction.status == Auction.Status.CLOSED
+        assert auction.best_bid_amount is None and auction.active_bid_count == 0
+        assert not auction.bids.filter(status=Bid.Status.ACTIVE).exists()
+        event = AuctionEvent.objects.get(
+            auction=auction, event_type=AuctionEvent.EventType.AUCTION_CLOSED
+        )
+        assert event.payload == {"released": True, "count": 2}
+
+    live.refresh_from_db()
+    assert live.status == Auction.Status.OPEN and live.active_bid_count == 2
+    finance = ClubFinance.objects.get(club=buyer_user.club)
+    assert finance.transfer_reserved == Decimal("100.00")
+    assert finance.wage_reserved_weekly == Decimal("10.00")
+
+
+@pytest.mark.django_db
+def test_closer_statement_count_is_independent_of_bids(funded, seller_user, buyer_user, buyer_user2):
+    auctions = [_auction(seller_user, f"Batch {index}") for index in range(4)]
+    for auction in auctions:
+        place_bid(auction, buyer_user, Decimal("50.00"))
+        place_bid(auction, buyer_user2, Decimal("60.00"))
+    _expire(*auctions)
+    with CaptureQueriesContext(connection) as queries:
+        assert close_expired_auctions() == 4
+    # lock auctions, read bids, lock finances, one release per club, then
+    # one UPDATE each for bids and auctions and one INSERT for events.
+    assert len(queries) <= 10
+
+
+@pytest.mark.django_db
+def test_reads_display_ended_without_writing(client, funded, seller_user, buyer_user):
+    auction = _auction(seller_user, "Display Ended")
+    place_bid(auction, buyer_user, Decimal("80.00"))
+    _expire(auction)
+
+    client.force_login(buyer_user)
+    response = client.get(reverse("auctions:detail", args=[auction.id]))
+    assert response.status_code == 200
+    assert "Closed" in response.content.decode("utf-8")
+    auction.refresh_from_db()
+    assert auction.status == Auction.Status.OPEN
+    assert auction.has_ended
+    assert not AuctionEvent.objects.filter(event_type=AuctionEvent.EventType.AUCTION_CLOSED).exists()
+
+    call_command("run_auction_closer", "--once")
+    auction.refresh_from_db()
+    assert auction.status == Auction.Status.CLOSED
@@ -99,11 +99,14 @@ def test_accept_bid_does_not_create_contract(seller_user, buyer_user):
 
 
 @pytest.mark.django_db
-def test_accept_bid_notifies_buyer_seller_and_staff(seller_user, buyer_user):
+def test_accept_bid_notifies_buyer_seller_and_staff(
+    seller_user, buyer_user, django_capture_on_commit_callbacks
+):
     staff = User.objects.create_user("staff1", password="pw", is_staff=True)
     auction, bid, player = _make_auction_with_winning_bid(seller_user, buyer_user)
 
-    accept_bid(auction, bid, seller_user)
+    with django_capture_on_commit_callbacks(execute=True):
+        accept_bid(auction, bid, seller_user)
 
     notified = set(
         Notification.objects.filter(type=Notification.Type.AUCTION_BID_ACCEPTED)
@@ -115,10 +118,13 @@ def test_accept_bid_notifies_buyer_seller_and_staff(seller_user, buyer_user):
 
 
 @pytest.mark.django_db
-def test_accept_bid_notification_message_format(seller_user, buyer_user):
+def test_accept_bid_notification_message_format(
+    seller_user, buyer_user, django_capture_on_commit_callbacks
+):
     auction, bid, player = _make_auction_with_winning_bid(seller_user, buyer_user)
 
-    deal = accept_bid(auction, bid, seller_user)
+    with django_capture_on_commit_callbacks(execute=True):
+        deal = accept_bid(auction, bid, seller_user)
 
     notif = Notification.objects.filter(
         recipient=buyer_user,
@@ -0,0 +1,95 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.accounts.models import ClubFinance
+from apps.auctions.models import Auction
+from apps.auctions.read_models import load_auction_detail, load_timeline
+from apps.auctions.services import place_bid
+from apps.players.models import Player
+from apps.stats.models import PlayerForm, PlayerStatsSnapshot
+
+
+def _auction(seller_user, name):
+    player = Player.objects.create(
+        name=name, age=25, current_club=seller_user.club, created_by=seller_user
+    )
+    PlayerForm.objects.create(player=player, as_of=timezone.now(), form_score=81)
+    for days in range(3):
+        PlayerStatsSnapshot.objects.create(
+            player=player, as_of=timezone.now() - timedelta(days=days), payload={"big": "x" * 1000}
+        )
+    return Auction.objects.create(
+        player=player, seller=seller_user, deadline=timezone.now() + timedelta(days=1)
+    )
+
+
+def _bid_from(auction, bidders):
+    ClubFinance.objects.filter(club__user__in=bidders).update(
+        transfer_budget_total=Decimal("100000.00"), wage_budget_total_weekly=Decimal("1000.00")
+    )
+    for index, bidder in enumerate(bidders):
+        place_bid(auction, bidder, Decimal(100 + index))
+        place_bid(auction, bidder, Decimal(200 + index))
+
+
+def _query_count(client, user, auction):
+    client.force_login(user)
+    # The sidebar counters are cached after the first render; measure cold.
+    cache.clear()
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse("auctions:detail", args=[auction.id]))
+    assert response.status_code == 200
+    return len(queries), queries
+
+
+@pytest.mark.django_db
+def test_detail_query_count_is_independent_of_volume(
+    client, user_factory, seller_user, buyer_user, buyer_user2
+):
+    quiet = _auction(seller_user, "Quiet Auction")
+    busy = _auction(seller_user, "Busy Auction")
+    _bid_from(quiet, [buyer_user2])
+    _bid_from(busy, [buyer_user2, *(user_factory(f"busy{i}", "buyer", f"Busy {i} FC") for i in range(10))])
+
+    for viewer in (buyer_user, seller_user):
+        quiet_count, _ = _query_count(client, viewer, quiet)
+        busy_count, queries = _query_count(client, viewer, busy)
+        assert quiet_count == busy_count
+        # session, user, groups, auction, bids, snapshot, club, finance and
+        # the sidebar counters row; the timeline loads separately.
+        assert busy_count <= 9
+    snapshot_sql = [query["sql"] for query in queries if "stats_playerstatssnapshot" in query["sql"]]
+    assert len(snapshot_sql) == 1 and "payload" not in snapshot_sql[0]
+
+
+@pytest.mark.django_db
+def test_detail_read_model(seller_user, buyer_user, buyer_user2):
+    auction = _auction(seller_user, "Read Model")
+    _bid_from(auction, [buyer_user, buyer_user2])
+
+    detail = load_auction_detail(auction.pk, buyer_user)
+    assert not hasattr(detail, "__dict__")
+    assert [bid.amount for bid in detail.bid_ladder] == [Decimal("201"), Decimal("200")]
+    assert detail.buyer_active_bid.amount == Decimal("200")
+    assert detail.best_bid == Decimal("201")
+    assert detail.bid_count == 2 and detail.seller_bids == []
+    assert detail.can_bid and detail.finance is not None and not detail.is_owner
+    assert detail.latest_snapshot.as_of == max(
+        PlayerStatsSnapshot.objects.filter(player=auction.player).values_list("as_of", flat=True)
+    )
+    assert [entry.label for entry in load_timeline(auction.pk).entries] == [
+        "Bid updated",
+        "Bid placed",
+    ] * 2
+
+    owner_view = load_auction_detail(auction.pk, seller_user)
+    assert owner_view.is_owner and not owner_view.can_bid
+    assert len(owner_view.seller_bids) == 2
+    assert owner_view.seller_bids[0].buyer.club.name
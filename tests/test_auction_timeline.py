@@ -0,0 +1,147 @@
+import threading
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.accounts.models import ClubFinance
+from apps.auctions.events import compact_events
+from apps.auctions.models import Auction, AuctionEvent, AuctionEventSummary
+from apps.auctions.read_models import load_timeline
+from apps.auctions.services import place_bid
+from apps.players.models import Player
+
+
+def _auction(seller_user, **kwargs):
+    player = Player.objects.create(
+        name="Timeline Player", age=27, current_club=seller_user.club, created_by=seller_user
+    )
+    return Auction.objects.create(
+        player=player, seller=seller_user, deadline=timezone.now() + timedelta(days=1), **kwargs
+    )
+
+
+def _log(auction, count, start, event_type=AuctionEvent.EventType.BID_REPLACED):
+    events = AuctionEvent.objects.bulk_create(
+        AuctionEvent(auction=auction, event_type=event_type, amount=Decimal(100 + index))
+        for index in range(count)
+    )
+    for index, event in enumerate(events):
+        event.created_at = start + timedelta(minutes=index)
+    AuctionEvent.objects.bulk_update(events, ["created_at"])
+    return events
+
+
+@pytest.mark.django_db
+def test_bid_events_are_written_in_one_insert(settings, seller_user, buyer_user):
+    settings.TRANSFERX_ENABLE_ANTI_SNIPING = True
+    settings.TRANSFERX_SNIPING_WINDOW_MINUTES = 10
+    ClubFinance.objects.filter(club=buyer_user.club).update(
+        transfer_budget_total=Decimal("1000.00"), wage_budget_total_weekly=Decimal("100.00")
+    )
+    auction = _auction(seller_user)
+    Auction.objects.filter(pk=auction.pk).update(deadline=timezone.now() + timedelta(minutes=5))
+
+    with CaptureQueriesContext(connection) as queries:
+        place_bid(auction, buyer_user, Decimal("150"))
+    inserts = [
+        query["sql"]
+        for query in queries
+        if query["sql"].lstrip().startswith('INSERT INTO "auctions_auctionevent"')
+    ]
+    assert len(inserts) == 1
+    events = list(AuctionEvent.objects.filter(auction=auction).order_by("id"))
+    assert [event.event_type for event in events] == ["BID_PLACED", "AUCTION_EXTENDED"]
+    assert events[0].amount == Decimal("150") and events[0].payload == {}
+
+
+@pytest.mark.django_db
+def test_timeline_pages_with_a_cursor(client, seller_user, buyer_user):
+    auction = _auction(seller_user)
+    _log(auction, 25, timezone.now() - timedelta(hours=1))
+
+    first = load_timeline(auction.pk)
+    assert len(first.entries) == 20 and first.next_cursor
+    assert first.entries[0].amount == Decimal("124")
+    second = load_timeline(auction.pk, first.next_cursor)
+    assert [entry.amount for entry in second.entries] == [
+        Decimal(100 + i) for i in range(4, -1, -1)
+    ]
+    assert second.next_cursor is None
+
+    client.force_login(buyer_user)
+    url = reverse("auctions:timeline", args=[auction.id])
+    with CaptureQueriesContext(connection) as first_queries:
+        response = client.get(url)
+    assert response.status_code == 200
+    assert b"Load older events" in response.content
+    assert f"?before={first.next_cursor}".encode() in response.content
+    with CaptureQueriesContext(connection) as last_queries:
+        response = client.get(url, {"before": first.next_cursor})
+    assert b"Load older events" not in response.content
+    # session, user, auction exists, one page of events (+ summaries on the
+    # last page instead of a next cursor), club and the sidebar counters row
+    # (cached after the first render).
+    assert len(first_queries) == 6 and len(last_queries) == 6
+    assert client.get(url, {"before": "nope"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_compaction_folds_old_bid_events_into_summaries(seller_user):
+    auction = _auction(seller_user)
+    old_start = timezone.now() - timedelta(days=60)
+    _log(auction, 10, old_start)
+    _log(auction, 2, old_start, event_type=AuctionEvent.EventType.AUCTION_EXTENDED)
+    recent = _log(auction, 3, timezone.now() - timedelta(hours=1))
+
+    assert compact_events(timezone.now() - timedelta(days=30)) == (10, auction.pk)
+    summary = AuctionEventSummary.objects.get(auction=auction)
+    assert summary.event_type == "BID_REPLACED" and summary.event_count == 10
+    assert summary.max_amount == Decimal("109")
+    assert AuctionEvent.objects.filter(auction=auction).count() == 5
+
+    # A later pass merges into the existing row.
+    AuctionEvent.objects.filter(pk__in=[event.pk for event in recent]).update(created_at=old_start)
+    call_command("compact_auction_events", "--older-than-days", "30")
+    summary.refresh_from_db()
+    assert summary.event_count == 13
+    assert AuctionEvent.objects.filter(auction=auction).count() == 2
+
+    page = load_timeline(auction.pk)
+    assert [entry.label for entry in page.entries] == ["Deadline extended"] * 2
+    assert [entry.label for entry in page.summaries] == ["Bid updated x13"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_compaction_pages_past_locked_auctions(seller_user):
+    busy, idle = _auction(seller_user), _auction(seller_user)
+    old_start = timezone.now() - timedelta(days=60)
+    _log(busy, 3, old_start)
+    _log(idle, 4, old_start)
+    held, done = threading.Event(), threading.Event()
+
+    def bidder():
+        try:
+            with transaction.atomic():
+                Auction.objects.select_for_update().get(pk=busy.pk)
+                held.set()
+                done.wait(5)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=bidder)
+    thread.start()
+    assert held.wait(5)
+    try:
+        # The first batch is only the locked auction and removes nothing.
+        call_command("compact_auction_events", "--older-than-days", "30", "--batch-size", "1")
+    finally:
+        done.set()
+        thread.join()
+    assert AuctionEvent.objects.filter(auction=idle).count() == 0
+    assert AuctionEvent.objects.filter(auction=busy).count() == 3
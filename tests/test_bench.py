@@ -0,0 +1,47 @@
+import json
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.marketplace.bench.compare import compare_runs
+from apps.marketplace.bench.seed import seed_world
+from apps.marketplace.models import Listing
+from apps.players.models import Player
+
+
+def _run(median_ms, queries):
+    return {"cases": {"players/anonymous/name/all": {"median_ms": median_ms, "queries": queries}}}
+
+
+def test_compare_flags_slower_and_chattier_cases():
+    assert compare_runs(_run(100, 3), _run(110, 3))[0]["status"] == "ok"
+    assert compare_runs(_run(100, 3), _run(150, 3))[0]["status"] == "regression"
+    assert compare_runs(_run(1, 3), _run(3, 3))[0]["status"] == "ok"
+    assert compare_runs(_run(100, 3), _run(100, 4))[0]["status"] == "regression"
+    assert compare_runs(_run(100, 3), _run(50, 3))[0]["status"] == "improvement"
+    assert compare_runs(_run(100, 3), {"cases": {}})[0]["status"] == "missing"
+
+
+@pytest.mark.django_db
+def test_seed_and_run_small_world(tmp_path):
+    counts = seed_world(scale=0.0005, seed=3)
+    assert Player.objects.count() == counts["players"]
+    assert Listing.objects.count() == counts["listings"]
+
+    output = tmp_path / "run.json"
+    call_command(
+        "bench_discovery", "run", "--output", str(output), "--repeat", "1", "--only", "/all"
+    )
+    result = json.loads(output.read_text())
+    assert result["meta"]["tables"]["players"] == counts["players"]
+    assert "players/anonymous/name/all" in result["cases"]
+    assert "listings/anonymous/newest/all" in result["cases"]
+    case = result["cases"]["players/anonymous/name/all"]
+    assert case["queries"] > 0 and len(case["times_ms"]) == 1
+    if result["meta"]["vendor"] == "postgresql":
+        assert case["plans"][0]["plan"]["Node Type"]
+
+    call_command("bench_discovery", "compare", str(output), str(output))
+    with pytest.raises(CommandError):
+        call_command("bench_discovery", "seed", "--scale", "0.0005")
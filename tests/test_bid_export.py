@@ -0,0 +1,114 @@
+import csv
+import gzip
+import io
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.accounts.models import ClubFinance
+from apps.auctions.models import Auction, Bid
+from apps.auctions.services import place_bid
+from apps.players.models import Player
+
+
+@pytest.fixture
+def bid_history(seller_user, buyer_user, buyer_user2):
+    ClubFinance.objects.filter(club__user__in=[buyer_user, buyer_user2]).update(
+        transfer_budget_total=Decimal("100000.00"), wage_budget_total_weekly=Decimal("1000.00")
+    )
+    auctions = []
+    for name in ("Export One", "Export Two"):
+        player = Player.objects.create(
+            name=name, age=24, current_club=seller_user.club, created_by=seller_user
+        )
+        auction = Auction.objects.create(
+            player=player, seller=seller_user, deadline=timezone.now() + timedelta(days=1)
+        )
+        place_bid(
+            auction, buyer_user, Decimal("100.00"), Decimal("10.00"), notes="first, with comma"
+        )
+        place_bid(auction, buyer_user2, Decimal("150.00"))
+        auctions.append(auction)
+    # Two bids in the 2025/26 season, one in 2024/25, one in 2026/27.
+    bids = list(Bid.objects.order_by("id"))
+    for bid, when in zip(
+        bids,
+        [
+            datetime(2025, 8, 1, tzinfo=UTC),
+            datetime(2026, 6, 30, 23, tzinfo=UTC),
+            datetime(2025, 6, 30, tzinfo=UTC),
+            datetime(2026, 7, 1, tzinfo=UTC),
+        ],
+        strict=True,
+    ):
+        Bid.objects.filter(pk=bid.pk).update(created_at=when)
+    return auctions, bids
+
+
+@pytest.mark.django_db
+def test_bids_csv_streams_rows(client, seller_user, bid_history):
+    auctions, bids = bid_history
+    client.force_login(seller_user)
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(f"/auctions/{auctions[0].id}/bids.csv")
+        body = b"".join(response.streaming_content).decode("utf-8")
+    assert response.streaming
+    assert (
+        response["Content-Disposition"]
+        == f'attachment; filename="auction_{auctions[0].id}_bids.csv"'
+    )
+    rows = list(csv.reader(io.StringIO(body)))
+    assert rows[0] == [
+        "bid_id",
+        "created_at",
+        "buyer_club_name",
+        "amount",
+        "wage_offer_weekly",
+        "status",
+        "notes",
+    ]
+    assert rows[1] == [
+        str(bids[0].pk),
+        "2025-08-01T00:00:00+00:00",
+        "Buyer FC",
+        "100.00",
+        "10.00",
+        "ACTIVE",
+        "first, with comma",
+    ]
+    assert rows[2][2:5] == ["Northside FC", "150.00", "0.00"]
+    assert len([query for query in queries if "auctions_bid" in query["sql"]]) == 1
+
+
+@pytest.mark.django_db
+def test_export_bid_history_csv_gz(tmp_path, bid_history):
+    auctions, bids = bid_history
+    output = tmp_path / "bids.csv.gz"
+    call_command(
+        "export_bid_history", "--season", "2025", "--output", str(output), "--chunk-size", "1"
+    )
+
+    with gzip.open(output, "rt", newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [int(row["bid_id"]) for row in rows] == [bids[0].pk, bids[1].pk]
+    assert rows[0]["player_name"] == "Export One"
+    assert rows[0]["auction_id"] == str(auctions[0].pk)
+
+
+@pytest.mark.django_db
+def test_export_bid_history_parquet(tmp_path, bid_history):
+    pq = pytest.importorskip("pyarrow.parquet")
+    _, bids = bid_history
+    output = tmp_path / "bids.parquet"
+    call_command(
+        "export_bid_history", "--season", "2024", "--format", "parquet", "--output", str(output)
+    )
+
+    table = pq.read_table(output)
+    assert table.column("bid_id").to_pylist() == [bids[2].pk]
+    assert table.column("amount").to_pylist() == [Decimal("100.00")]
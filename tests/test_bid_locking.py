@@ -0,0 +1,143 @@
+import threading
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.accounts.models import ClubFinance
+from apps.auctions import services
+from apps.auctions.locking import hold_auction_lock
+from apps.auctions.models import Auction, Bid
+from apps.auctions.services import close_expired_auctions, place_bid, place_proxy_bid
+from apps.players.models import Player
+
+
+def _auction(seller_user, deadline):
+    player = Player.objects.create(
+        name="Locking Player", age=25, current_club=seller_user.club, created_by=seller_user
+    )
+    return Auction.objects.create(player=player, seller=seller_user, deadline=deadline)
+
+
+def _fund(*users, transfer="500.00"):
+    ClubFinance.objects.filter(club__user__in=users).update(
+        transfer_budget_total=Decimal(transfer), wage_budget_total_weekly=Decimal("100.00")
+    )
+
+
+def _reserved(user):
+    return ClubFinance.objects.get(club=user.club).transfer_reserved
+
+
+@pytest.mark.django_db
+def test_advisory_mode_serializes_on_the_key_not_the_rows(
+    settings, seller_user, buyer_user, buyer_user2
+):
+    settings.TRANSFERX_BID_LOCKING = "advisory"
+    _fund(buyer_user, buyer_user2)
+    auction = _auction(seller_user, timezone.now() + timedelta(days=1))
+    place_bid(auction, buyer_user2, Decimal("100"))
+    place_bid(auction, buyer_user, Decimal("150"))
+
+    with CaptureQueriesContext(connection) as queries:
+        place_bid(auction, buyer_user, Decimal("300"))
+    sql = [query["sql"] for query in queries]
+    assert any("pg_advisory_xact_lock" in statement for statement in sql)
+    assert not any("FOR UPDATE" in statement for statement in sql)
+    assert _reserved(buyer_user) == Decimal("300")
+
+    # The conditional UPDATE refuses what the budget cannot cover and leaves
+    # the reservation alone; lowering a bid releases the difference.
+    with pytest.raises(ValidationError, match="Insufficient transfer budget"):
+        place_bid(auction, buyer_user2, Decimal("600"))
+    assert _reserved(buyer_user2) == Decimal("100")
+    place_bid(auction, buyer_user2, Decimal("400"))
+    assert _reserved(buyer_user2) == Decimal("400")
+    auction.refresh_from_db()
+    assert auction.best_bid == Bid.objects.get(buyer=buyer_user2, status=Bid.Status.ACTIVE)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_closer_skips_an_auction_a_bidder_holds(settings, seller_user):
+    settings.TRANSFERX_BID_LOCKING = "advisory"
+    auction = _auction(seller_user, timezone.now() - timedelta(minutes=1))
+    held, done = threading.Event(), threading.Event()
+
+    def bidder():
+        try:
+            with transaction.atomic():
+                hold_auction_lock(auction.pk)
+                held.set()
+                done.wait(5)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=bidder)
+    thread.start()
+    assert held.wait(5)
+    try:
+        assert close_expired_auctions() == 0
+    finally:
+        done.set()
+        thread.join()
+    assert close_expired_auctions() == 1
+    auction.refresh_from_db()
+    assert auction.status == Auction.Status.CLOSED
+
+
+@pytest.mark.parametrize("locking", ["row", "advisory"])
+@pytest.mark.django_db(transaction=True)
+def test_cross_auction_proxies_do_not_deadlock(
+    settings, monkeypatch, user_factory, seller_user, buyer_user, buyer_user2, locking
+):
+    # Each buyer bids where the other holds a maximum, so each bid needs both
+    # clubs' finance rows. Both bids are held at the same point after their
+    # first finance lock; if either took its own row before the other's the
+    # two would wait on each other. Separate sellers, so nothing else
+    # serializes the two bids.
+    settings.TRANSFERX_BID_LOCKING = locking
+    _fund(buyer_user, buyer_user2, transfer="5000.00")
+    first = _auction(seller_user, timezone.now() + timedelta(days=1))
+    second = _auction(
+        user_factory("seller2", "seller", "Second Seller"), timezone.now() + timedelta(days=1)
+    )
+    place_proxy_bid(first, buyer_user2, Decimal("1000"))
+    place_proxy_bid(second, buyer_user, Decimal("1000"))
+
+    barrier = threading.Barrier(2, timeout=2)
+    rebalance = services._rebalance_reservation
+
+    def held_rebalance(*args, **kwargs):
+        rebalance(*args, **kwargs)
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+
+    monkeypatch.setattr(services, "_rebalance_reservation", held_rebalance)
+    errors = []
+
+    def bid(auction, buyer):
+        try:
+            place_bid(auction, buyer, Decimal("200"))
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            connection.close()
+
+    threads = [
+        threading.Thread(target=bid, args=(first, buyer_user)),
+        threading.Thread(target=bid, args=(second, buyer_user2)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    for auction, proxy_owner in ((first, buyer_user2), (second, buyer_user)):
+        auction.refresh_from_db()
+        assert auction.best_bid.buyer == proxy_owner
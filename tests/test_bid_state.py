@@ -0,0 +1,91 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.accounts.models import ClubFinance
+from apps.auctions.models import Auction, Bid
+from apps.auctions.services import accept_bid, close_if_expired, place_bid
+from apps.players.models import Player
+
+
+@pytest.fixture
+def open_auction(seller_user, buyer_user, buyer_user2):
+    for user in (buyer_user, buyer_user2):
+        ClubFinance.objects.filter(club=user.club).update(
+            transfer_budget_total="10000.00", wage_budget_total_weekly="1000.00"
+        )
+    player = Player.objects.create(
+        name="Ladder Lad", age=21, current_club=seller_user.club, created_by=seller_user
+    )
+    return Auction.objects.create(
+        player=player, seller=seller_user, deadline=timezone.now() + timedelta(days=1)
+    )
+
+
+def _state(auction):
+    auction.refresh_from_db()
+    return auction.best_bid_amount, auction.best_bid_id, auction.active_bid_count
+
+
+@pytest.mark.django_db
+def test_place_bid_maintains_best_bid(open_auction, buyer_user, buyer_user2):
+    first = place_bid(open_auction, buyer_user, Decimal("100.00"))
+    assert _state(open_auction) == (Decimal("100.00"), first.pk, 1)
+    assert open_auction.last_bid_at is not None
+
+    second = place_bid(open_auction, buyer_user2, Decimal("150.00"))
+    assert _state(open_auction) == (Decimal("150.00"), second.pk, 2)
+
+    # Lowering the leading bid hands the lead back without a new bid.
+    place_bid(open_auction, buyer_user2, Decimal("90.00"))
+    assert _state(open_auction) == (Decimal("100.00"), first.pk, 2)
+
+    # Equal amounts: the earlier bid keeps the lead.
+    place_bid(open_auction, buyer_user2, Decimal("100.00"))
+    assert _state(open_auction) == (Decimal("100.00"), first.pk, 2)
+
+
+@pytest.mark.django_db
+def test_accept_and_close_clear_best_bid(open_auction, seller_user, buyer_user, buyer_user2):
+    bid = place_bid(open_auction, buyer_user, Decimal("100.00"))
+    place_bid(open_auction, buyer_user2, Decimal("120.00"))
+    accept_bid(open_auction, bid, seller_user)
+    assert _state(open_auction) == (None, None, 0)
+
+    other = Auction.objects.create(
+        player=open_auction.player,
+        seller=seller_user,
+        deadline=timezone.now() + timedelta(days=1),
+    )
+    place_bid(other, buyer_user2, Decimal("50.00"))
+    other.refresh_from_db()
+    Auction.objects.filter(pk=other.pk).update(deadline=timezone.now() - timedelta(minutes=1))
+    other.deadline = timezone.now() - timedelta(minutes=1)
+    assert close_if_expired(other)
+    assert other.best_bid_amount is None
+    assert _state(other) == (None, None, 0)
+
+
+@pytest.mark.django_db
+def test_direct_bid_writes_refresh_state(open_auction, buyer_user):
+    bid = Bid.objects.create(auction=open_auction, buyer=buyer_user, amount=Decimal("70.00"))
+    assert _state(open_auction) == (Decimal("70.00"), bid.pk, 1)
+    bid.delete()
+    assert _state(open_auction) == (None, None, 0)
+
+
+@pytest.mark.django_db
+def test_bid_ladder_poll_does_not_aggregate(client, open_auction, buyer_user, buyer_user2):
+    place_bid(open_auction, buyer_user, Decimal("100.00"))
+    place_bid(open_auction, buyer_user2, Decimal("110.00"))
+    client.force_login(buyer_user)
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse("auctions:bids_partial", args=[open_auction.id]))
+    assert response.status_code == 200
+    assert "110.00" in response.content.decode("utf-8")
+    assert not [query for query in queries if "MAX(" in query["sql"].upper()]
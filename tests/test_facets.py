@@ -0,0 +1,76 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.accounts.models import Club
+from apps.marketplace.facets import player_market_facets
+from apps.marketplace.models import Listing
+from apps.marketplace.query import player_search_queryset
+from apps.marketplace.result_cache import visibility_scope
+from apps.players.models import Player
+
+
+@pytest.fixture
+def facet_club(db):
+    user = get_user_model().objects.create_user(username="facets", password="pass")
+    return Club.objects.create(user=user, name="Facet FC")
+
+
+def _player(club, name, position, age, **kwargs):
+    return Player.objects.create(
+        name=name,
+        position=position,
+        age=age,
+        created_by=club.user,
+        current_club=club,
+        visibility=Player.Visibility.PUBLIC,
+        **kwargs,
+    )
+
+
+def _counts(facets, group):
+    for entry in facets["groups"]:
+        if entry["name"] == group:
+            return {option["value"]: option["count"] for option in entry["options"]}
+    raise KeyError(group)
+
+
+@pytest.mark.django_db
+def test_facet_counts_exclude_own_group(facet_club):
+    keeper = _player(facet_club, "Keeper", "GK", 19)
+    _player(facet_club, "Defender", "DEF", 24)
+    _player(facet_club, "Forward", "FWD", 31)
+    Listing.objects.create(
+        player=keeper,
+        listed_by_club=facet_club,
+        listing_type=Listing.ListingType.TRANSFER,
+        visibility=Listing.Visibility.PUBLIC,
+    )
+
+    params = {"position": "GK"}
+    facets = player_market_facets(None, params)
+    assert facets["total"] == player_search_queryset(None, params).count() == 1
+    # The position facet ignores the selected position; the others respect it.
+    assert _counts(facets, "position") == {"GK": 1, "DEF": 1, "MID": 0, "FWD": 1}
+    assert _counts(facets, "age") == {"u21": 1, "21_25": 0, "26_29": 0, "30_plus": 0}
+    assert _counts(facets, "availability")["transfer"] == 1
+    assert _counts(facets, "listed_only") == {"1": 1}
+
+
+@pytest.mark.django_db
+def test_facet_counts_are_one_query_and_cached(facet_club):
+    _player(facet_club, "Midfielder", "MID", 27, open_to_offers=True)
+    _player(facet_club, "Closed", "MID", 27)
+    params = {"availability": "open_to_offers", "min_age": "20"}
+    visibility_scope(facet_club)
+
+    with CaptureQueriesContext(connection) as queries:
+        facets = player_market_facets(facet_club, params)
+    assert len(queries) == 1
+    assert _counts(facets, "age")["26_29"] == 1
+    assert facets["total"] == 1
+
+    with CaptureQueriesContext(connection) as queries:
+        assert player_market_facets(facet_club, params) == facets
+    assert len(queries) == 0
@@ -2,12 +2,15 @@ from datetime import timedelta
 from decimal import Decimal
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
+from apps.accounts.finance import release_many
 from apps.accounts.models import ClubFinance
 from apps.auctions.models import Auction, Bid
-from apps.auctions.services import close_if_expired, place_bid
+from apps.auctions.services import accept_bid, close_if_expired, place_bid
 from apps.players.models import Player
 
 
@@ -185,3 +188,58 @@ def test_close_releases_all_reservations(seller_user, buyer_user, buyer_user2):
     assert finance1.wage_reserved_weekly == Decimal("0")
     assert finance2.transfer_reserved == Decimal("0")
     assert finance2.wage_reserved_weekly == Decimal("0")
+
+
+@pytest.mark.django_db
+def test_release_many_clamps_per_club(buyer_user, buyer_user2):
+    ClubFinance.objects.filter(club=buyer_user.club).update(
+        transfer_reserved=Decimal("100.00"), wage_reserved_weekly=Decimal("10.00")
+    )
+    ClubFinance.objects.filter(club=buyer_user2.club).update(
+        transfer_reserved=Decimal("50.00"), wage_reserved_weekly=Decimal("5.00")
+    )
+    updated = release_many(
+        {
+            buyer_user.club.id: (Decimal("30.00"), Decimal("4.00")),
+            buyer_user2.club.id: (Decimal("80.00"), Decimal("9.00")),
+        }
+    )
+
+    assert updated == 2
+    finance1 = ClubFinance.objects.get(club=buyer_user.club)
+    finance2 = ClubFinance.objects.get(club=buyer_user2.club)
+    assert (finance1.transfer_reserved, finance1.wage_reserved_weekly) == (
+        Decimal("70.00"),
+        Decimal("6.00"),
+    )
+    assert (finance2.transfer_reserved, finance2.wage_reserved_weekly) == (Decimal("0"), Decimal("0"))
+
+
+@pytest.mark.django_db
+def test_accept_settles_losers_in_constant_statements(user_factory, seller_user):
+    player = Player.objects.create(
+        name="Crowded Auction", age=23, current_club=seller_user.club, created_by=seller_user
+    )
+    auction = Auction.objects.create(
+        player=player, seller=seller_user, deadline=timezone.now() + timedelta(days=1)
+    )
+    bidders = [user_factory(f"bulk{index}", "buyer", f"Bulk {index} FC") for index in range(8)]
+    ClubFinance.objects.filter(club__user__in=bidders).update(
+        transfer_budget_total=Decimal("1000.00"), wage_budget_total_weekly=Decimal("100.00")
+    )
+    bids = [
+        place_bid(auction, bidder, Decimal(100 + index), Decimal("5.00"))
+        for index, bidder in enumerate(bidders)
+    ]
+
+    with CaptureQueriesContext(connection) as queries:
+        accept_bid(auction, bids[-1], seller_user)
+    finance_writes = [
+        query for query in queries if query["sql"].lstrip().startswith("UPDATE") and "clubfinance" in query["sql"]
+    ]
+    assert len(finance_writes) == 2  # commit the winner, one set-based release
+    assert Bid.objects.filter(auction=auction, status=Bid.Status.REJECTED).count() == 7
+    for bidder in bidders[:-1]:
+        finance = ClubFinance.objects.get(club=bidder.club)
+        assert finance.transfer_reserved == Decimal("0")
+        assert finance.wage_reserved_weekly == Decimal("0")
@@ -2,9 +2,12 @@ from datetime import timedelta
 
 import pytest
 from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from apps.players.models import Player
+from apps.scouting.models import SavedSearch, SavedSearchMatch
 from apps.stats.form import compute_form_from_snapshots
 from apps.stats.models import PlayerForm, PlayerStatsSnapshot
 
@@ -145,3 +148,39 @@ def test_sorting_by_form(client, seller_user):
     response = client.get("/players/?sort=form_desc")
     content = response.content.decode("utf-8")
     assert content.index("Alpha") < content.index("Beta")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_form_recompute_matches_saved_searches_once_per_run(seller_user, buyer_user):
+    SavedSearch.objects.create(club=buyer_user.club, name="In form", params={"min_form": 1})
+    for index in range(4):
+        player = Player.objects.create(
+            name=f"Batch Form {index}",
+            age=24,
+            current_club=seller_user.club,
+            created_by=seller_user,
+            vendor_id=f"90{index}",
+        )
+        PlayerStatsSnapshot.objects.create(
+            player=player,
+            vendor="api_sports_v3",
+            as_of=timezone.now(),
+            season=2025,
+            league_id=39,
+            minutes=90,
+            goals=1,
+            assists=0,
+            rating=7.0,
+        )
+
+    # Each update_or_create commits on its own; the saved searches are still
+    # loaded once for the run, not once per player.
+    with CaptureQueriesContext(connection) as queries:
+        call_command("compute_player_form", "--season", "2025", "--league-id", "39")
+    search_loads = [
+        query["sql"]
+        for query in queries
+        if query["sql"].startswith('SELECT "scouting_savedsearch"."id"')
+    ]
+    assert len(search_loads) == 1
+    assert SavedSearchMatch.objects.count() == 4
@@ -0,0 +1,84 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.accounts.models import Club
+from apps.marketplace.listing_counters import verify_listing_counters
+from apps.marketplace.models import Listing
+from apps.marketplace.query import listing_search_queryset
+from apps.marketplace.services import (
+    create_draft_offer,
+    create_listing,
+    reject_offer,
+    send_offer,
+    withdraw_offer,
+)
+from apps.players.models import Player
+
+
+@pytest.fixture
+def listing_setup(db):
+    seller_user = get_user_model().objects.create_user(username="counterSeller", password="pass")
+    seller = Club.objects.create(user=seller_user, name="Counter Seller")
+    buyers = []
+    for index in range(2):
+        user = get_user_model().objects.create_user(username=f"counterBuyer{index}", password="pass")
+        buyers.append(Club.objects.create(user=user, name=f"Counter Buyer {index}"))
+    player = Player.objects.create(name="Contested", created_by=seller_user, current_club=seller)
+    listing = create_listing(
+        player=player,
+        actor_club=seller,
+        listing_type=Listing.ListingType.TRANSFER,
+        visibility=Listing.Visibility.PUBLIC,
+    )
+    return seller, buyers, listing
+
+
+def _offer(buyer, listing):
+    return create_draft_offer(
+        player=listing.player, from_club=buyer, to_club=listing.listed_by_club, listing=listing
+    )
+
+
+@pytest.mark.django_db
+def test_offer_lifecycle_maintains_listing_counters(listing_setup):
+    seller, buyers, listing = listing_setup
+    first = _offer(buyers[0], listing)
+    second = _offer(buyers[1], listing)
+    listing.refresh_from_db()
+    assert (listing.offers_count, listing.active_offers_count) == (0, 0)
+
+    send_offer(first, buyers[0].user, buyers[0])
+    send_offer(second, buyers[1].user, buyers[1])
+    listing.refresh_from_db()
+    assert (listing.offers_count, listing.active_offers_count) == (2, 2)
+    assert listing.last_offer_at == second.events.get(event_type="SENT").created_at
+
+    reject_offer(first, seller.user, seller)
+    withdraw_offer(second, buyers[1].user, buyers[1])
+    listing.refresh_from_db()
+    assert (listing.offers_count, listing.active_offers_count) == (2, 0)
+    assert verify_listing_counters() == []
+
+
+@pytest.mark.django_db
+def test_sync_command_repairs_counters_and_contested_sort(listing_setup):
+    seller, buyers, listing = listing_setup
+    send_offer(_offer(buyers[0], listing), buyers[0].user, buyers[0])
+    quiet = create_listing(
+        player=Player.objects.create(name="Quiet", created_by=seller.user, current_club=seller),
+        actor_club=seller,
+        listing_type=Listing.ListingType.TRANSFER,
+        visibility=Listing.Visibility.PUBLIC,
+    )
+    ordered = list(listing_search_queryset(None, {"sort": "most_contested"}))
+    assert ordered == [listing, quiet]
+
+    Listing.objects.filter(pk=listing.pk).update(offers_count=7, active_offers_count=0)
+    with pytest.raises(CommandError):
+        call_command("sync_listing_counters", "--verify")
+    call_command("sync_listing_counters")
+    listing.refresh_from_db()
+    assert (listing.offers_count, listing.active_offers_count) == (1, 1)
+    call_command("sync_listing_counters", "--verify")
@@ -0,0 +1,67 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.accounts.models import Club
+from apps.marketplace.models import Listing, ListingInvite
+from apps.marketplace.query import listing_search_queryset, player_search_queryset
+from apps.marketplace.visibility import can_view_listing, private_listing_ids
+from apps.players.models import Player
+
+
+def _club(name):
+    user = get_user_model().objects.create_user(username=name.lower().replace(" ", ""), password="pass")
+    return Club.objects.create(user=user, name=name)
+
+
+@pytest.fixture
+def invite_only_listing(db):
+    seller = _club("Access Seller")
+    player = Player.objects.create(
+        name="Hidden Gem",
+        created_by=seller.user,
+        current_club=seller,
+        visibility=Player.Visibility.CLUBS_ONLY,
+    )
+    listing = Listing.objects.create(
+        player=player,
+        listed_by_club=seller,
+        listing_type=Listing.ListingType.LOAN,
+        visibility=Listing.Visibility.INVITE_ONLY,
+        asking_price=500,
+    )
+    return listing
+
+
+@pytest.mark.django_db
+def test_access_set_follows_invites(invite_only_listing):
+    guest = _club("Access Guest")
+    seller = invite_only_listing.listed_by_club
+    assert private_listing_ids(seller) == {invite_only_listing.pk}
+    assert private_listing_ids(guest) == set()
+    assert not can_view_listing(guest, invite_only_listing)
+    assert list(listing_search_queryset(guest, {})) == []
+
+    invite = ListingInvite.objects.create(listing=invite_only_listing, club=guest)
+    assert can_view_listing(guest, invite_only_listing)
+    assert list(listing_search_queryset(guest, {})) == [invite_only_listing]
+    player = player_search_queryset(guest, {"availability": "loan"}).get()
+    assert player.listing_type == Listing.ListingType.LOAN
+
+    invite.delete()
+    assert private_listing_ids(guest) == set()
+
+    invite_only_listing.status = Listing.Status.CLOSED
+    invite_only_listing.save()
+    assert private_listing_ids(seller) == set()
+
+
+@pytest.mark.django_db
+def test_access_set_is_cached(invite_only_listing):
+    seller = invite_only_listing.listed_by_club
+    private_listing_ids(seller)
+    with CaptureQueriesContext(connection) as queries:
+        assert can_view_listing(seller, invite_only_listing)
+        assert private_listing_ids(seller) == {invite_only_listing.pk}
+    assert len(queries) == 0
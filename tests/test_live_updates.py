@@ -0,0 +1,110 @@
+import json
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import AsyncClient
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.accounts.models import ClubFinance
+from apps.auctions.live import auction_topic, broadcaster, user_topic
+from apps.auctions.models import Auction
+from apps.auctions.services import place_bid
+from apps.players.models import Player
+
+
+@pytest.fixture
+def live_auction(seller_user, buyer_user, buyer_user2):
+    ClubFinance.objects.filter(club__user__in=[buyer_user, buyer_user2]).update(
+        transfer_budget_total=Decimal("10000.00"), wage_budget_total_weekly=Decimal("1000.00")
+    )
+    player = Player.objects.create(
+        name="Live Wire", age=22, current_club=seller_user.club, created_by=seller_user
+    )
+    return Auction.objects.create(
+        player=player, seller=seller_user, deadline=timezone.now() + timedelta(minutes=1)
+    )
+
+
+@pytest.mark.django_db
+def test_bid_reaches_auction_and_user_watchers(
+    settings, django_capture_on_commit_callbacks, live_auction, buyer_user, buyer_user2
+):
+    settings.TRANSFERX_LIVE_BACKEND = "memory"
+    place_bid(live_auction, buyer_user, Decimal("100.00"))
+    settings.TRANSFERX_ENABLE_ANTI_SNIPING = True
+
+    def outbid():
+        with django_capture_on_commit_callbacks(execute=True):
+            place_bid(live_auction, buyer_user2, Decimal("150.00"))
+
+    async def watch():
+        async with (
+            broadcaster.subscribe([auction_topic(live_auction.pk)]) as auction_watcher,
+            broadcaster.subscribe([user_topic(buyer_user.pk)]) as outbid_watcher,
+            broadcaster.subscribe([auction_topic(0)]) as bystander,
+        ):
+            await sync_to_async(outbid)()
+            return (
+                await auction_watcher.get(timeout=1),
+                await outbid_watcher.get(timeout=1),
+                await bystander.get(timeout=0.1),
+            )
+
+    message, outbid_message, unrelated = async_to_sync(watch)()
+    live_auction.refresh_from_db()
+    assert message == outbid_message
+    assert message["event"] == "extended"
+    assert message["best_bid"] == "150.00" and message["active_bids"] == 2
+    assert message["deadline"].startswith(live_auction.deadline.isoformat()[:19])
+    assert unrelated is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_postgres_notify_is_delivered_on_commit(settings, live_auction, buyer_user):
+    settings.TRANSFERX_LIVE_BACKEND = "postgres"
+
+    async def watch():
+        async with broadcaster.subscribe([auction_topic(live_auction.pk)]) as watcher:
+            assert await sync_to_async(broadcaster.listening.wait)(5)
+            await sync_to_async(place_bid)(live_auction, buyer_user, Decimal("120.00"))
+            return await watcher.get(timeout=5)
+
+    try:
+        message = async_to_sync(watch)()
+    finally:
+        broadcaster.stop()
+    assert message["event"] == "bid"
+    assert message["topics"] == sorted(
+        [auction_topic(live_auction.pk), user_topic(buyer_user.pk), user_topic(live_auction.seller_id)]
+    )
+
+
+@pytest.mark.django_db
+def test_stream_endpoint(client, settings, live_auction, buyer_user):
+    settings.TRANSFERX_LIVE_BACKEND = "memory"
+    client.force_login(buyer_user)
+    # WSGI cannot hold the stream open; EventSource stops and the page polls.
+    assert client.get(reverse("auctions:stream", args=[live_auction.pk])).status_code == 204
+
+    async def read_stream():
+        async_client = AsyncClient()
+        await async_client.aforce_login(buyer_user)
+        missing = await async_client.get(reverse("auctions:stream", args=[0]))
+        response = await async_client.get(reverse("auctions:stream", args=[live_auction.pk]))
+        chunks = aiter(response.streaming_content)
+        first = await anext(chunks)
+        broadcaster.dispatch(
+            json.dumps({"event": "bid", "topics": [auction_topic(live_auction.pk)]})
+        )
+        second = await anext(chunks)
+        await chunks.aclose()
+        return missing.status_code, response, first, second
+
+    missing, response, first, second = async_to_sync(read_stream)()
+    assert missing == 404
+    assert response["Content-Type"] == "text/event-stream"
+    assert first.startswith(b"retry:")
+    assert second.startswith(b"data: ") and b'"event": "bid"' in second
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Sum
+
+from apps.accounts.models import ClubFinance
+from apps.auctions.bench.load import percentile, run_load
+from apps.auctions.bench.seed import load_targets, seed_contest
+from apps.auctions.models import Auction, Bid
+
+
+def _assert_books_balance():
+    # Whatever the interleaving: the cached best bid matches the ladder and
+    # every club's reservation equals its active bids.
+    for auction in Auction.objects.all():
+        active = auction.bids.filter(status=Bid.Status.ACTIVE)
+        top = active.order_by("-amount", "created_at").first()
+        assert auction.best_bid_id == (top.pk if top else None)
+        assert auction.active_bid_count == active.count()
+    for finance in ClubFinance.objects.select_related("club"):
+        reserved = Bid.objects.filter(
+            buyer__club=finance.club, status=Bid.Status.ACTIVE
+        ).aggregate(total=Sum("reserved_transfer_amount"))["total"]
+        assert finance.transfer_reserved == (reserved or 0)
+
+
+def test_percentile_nearest_rank():
+    samples = sorted(float(value) for value in range(1, 101))
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 95) == 95
+    assert percentile(samples, 99) == 99
+    assert percentile([], 50) is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_command_reports_contention(tmp_path):
+    call_command("loadtest_bids", "seed", "--bidders", "6", "--auctions", "2")
+    output = tmp_path / "load.json"
+    call_command(
+        "loadtest_bids", "run", "--workers", "4", "--duration", "1", "--output", str(output)
+    )
+
+    report = json.loads(output.read_text())
+    assert report["meta"]["mode"] == "threads"
+    assert report["attempts"] == report["ok"] + report["rejected"] + report["deadlocks"] + report[
+        "serialization"
+    ] + report["errors"]
+    assert report["ok"] > 0 and report["errors"] == 0
+    assert report["latency_ms"]["p50"] <= report["latency_ms"]["p99"]
+    assert report["lock_wait"]["samples"] > 0
+    _assert_books_balance()
+
+
+@pytest.mark.load
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("locking", ["row", "advisory"])
+@pytest.mark.parametrize("processes", [False, True])
+def test_place_bid_under_heavy_contention(processes, locking):
+    seed_contest(bidders=40, auctions=1, deadline_minutes=1)
+    auction_ids, bidder_ids = load_targets()
+    report = run_load(
+        auction_ids=auction_ids,
+        bidder_ids=bidder_ids,
+        workers=16,
+        duration=10,
+        processes=processes,
+        locking=locking,
+    )
+    assert report["meta"]["locking"] == locking
+    assert report["deadlocks"] == 0 and report["serialization"] == 0 and report["errors"] == 0
+    assert report["server"]["deadlocks"] == 0
+    _assert_books_balance()
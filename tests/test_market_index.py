@@ -0,0 +1,108 @@
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.accounts.models import Club
+from apps.marketplace.market_index import rebuild_player_market_index
+from apps.marketplace.models import Listing, ListingInvite, PlayerMarketIndex
+from apps.marketplace.query import player_search_queryset
+from apps.players.models import Player
+from apps.stats.models import PlayerForm, PlayerStats
+
+
+@pytest.fixture
+def market_club(db):
+    user = get_user_model().objects.create_user(username="indexer", password="pass")
+    return Club.objects.create(user=user, name="Index Club")
+
+
+def _player(club, name, **kwargs):
+    return Player.objects.create(
+        name=name,
+        created_by=club.user,
+        current_club=club,
+        visibility=Player.Visibility.PUBLIC,
+        **kwargs,
+    )
+
+
+@pytest.mark.django_db
+def test_index_tracks_stats_listings_and_form(market_club):
+    player = _player(market_club, "Indexed")
+    index = PlayerMarketIndex.objects.get(player=player)
+    assert index.latest_rating is None
+    assert index.listing_type == ""
+
+    PlayerStats.objects.create(
+        player=player, league_id=39, season=2024, avg_rating=6.5, goals=1, assists=1
+    )
+    PlayerStats.objects.create(
+        player=player, league_id=39, season=2025, avg_rating=7.4, goals=3, assists=2, minutes=900
+    )
+    listing = Listing.objects.create(
+        player=player,
+        listed_by_club=market_club,
+        listing_type=Listing.ListingType.LOAN,
+        asking_price=Decimal("500.00"),
+    )
+    PlayerForm.objects.create(player=player, as_of="2025-01-01T00:00:00Z", form_score=71.0)
+
+    index.refresh_from_db()
+    assert index.latest_rating == 7.4
+    assert index.goals_assists == 5
+    assert index.latest_minutes == 900
+    assert index.listing_type == Listing.ListingType.LOAN
+    assert index.market_value == Decimal("500.00")
+    assert index.form_score == 71.0
+
+    listing.status = Listing.Status.CLOSED
+    listing.save()
+    index.refresh_from_db()
+    assert index.listing_type == ""
+    assert index.market_value is None
+
+
+@pytest.mark.django_db
+def test_search_sorts_from_index_without_subqueries(market_club):
+    low = _player(market_club, "Low Rating")
+    high = _player(market_club, "High Rating")
+    PlayerStats.objects.create(player=low, league_id=39, season=2025, avg_rating=6.1)
+    PlayerStats.objects.create(player=high, league_id=39, season=2025, avg_rating=8.2)
+
+    with CaptureQueriesContext(connection) as ctx:
+        names = [p.name for p in player_search_queryset(None, {"sort": "rating_desc"})]
+    assert names == ["High Rating", "Low Rating"]
+    assert "stats_playerstats" not in ctx.captured_queries[0]["sql"]
+
+
+@pytest.mark.django_db
+def test_invite_only_listing_visible_to_invited_club(market_club):
+    other_user = get_user_model().objects.create_user(username="invited", password="pass")
+    other = Club.objects.create(user=other_user, name="Invited Club")
+    player = _player(market_club, "Private Listing")
+    listing = Listing.objects.create(
+        player=player,
+        listed_by_club=market_club,
+        visibility=Listing.Visibility.INVITE_ONLY,
+        asking_price=Decimal("900.00"),
+    )
+
+    anonymous_row = player_search_queryset(None, {}).get(pk=player.pk)
+    assert anonymous_row.market_value is None
+
+    assert player_search_queryset(other, {}).get(pk=player.pk).market_value is None
+    ListingInvite.objects.create(listing=listing, club=other)
+    assert player_search_queryset(other, {}).get(pk=player.pk).market_value == Decimal("900.00")
+
+
+@pytest.mark.django_db
+def test_rebuild_repairs_missing_rows(market_club):
+    player = _player(market_club, "Rebuilt")
+    PlayerStats.objects.create(player=player, league_id=39, season=2025, minutes=450)
+    PlayerMarketIndex.objects.all().delete()
+
+    assert rebuild_player_market_index(batch_size=1) == 1
+    assert PlayerMarketIndex.objects.get(player=player).latest_minutes == 450
@@ -78,7 +78,7 @@ def test_csv_export_seller_only(client, auction_with_bids, seller_user, buyer_us
     client.force_login(seller_user)
     response = client.get(f"/auctions/{auction.id}/bids.csv")
     assert response.status_code == 200
-    assert "buyer_club_name" in response.content.decode("utf-8")
+    assert "buyer_club_name" in b"".join(response.streaming_content).decode("utf-8")
 
 
 @pytest.mark.django_db
@@ -0,0 +1,106 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.accounts.models import ClubFinance
+from apps.auctions.models import Auction
+from apps.auctions.services import accept_bid, place_bid
+from apps.notifications.dispatch import queue_notification, staff_recipient_ids
+from apps.notifications.models import Notification
+from apps.players.models import Player
+
+
+def _auction(seller_user, *bidders):
+    ClubFinance.objects.filter(club__user__in=bidders).update(
+        transfer_budget_total=Decimal("1000.00"), wage_budget_total_weekly=Decimal("100.00")
+    )
+    player = Player.objects.create(
+        name="Dispatch Player", age=22, current_club=seller_user.club, created_by=seller_user
+    )
+    return Auction.objects.create(
+        player=player, seller=seller_user, deadline=timezone.now() + timedelta(days=1)
+    )
+
+
+def _notification_inserts(queries):
+    return [
+        query
+        for query in queries
+        if query["sql"].lstrip().startswith('INSERT INTO "notifications_notification"')
+    ]
+
+
+@pytest.mark.django_db
+def test_accept_writes_all_notifications_after_commit_in_one_insert(
+    seller_user, buyer_user, buyer_user2, django_capture_on_commit_callbacks
+):
+    staff = [
+        get_user_model().objects.create_user(f"staff{i}", password="pw", is_staff=True)
+        for i in range(3)
+    ]
+    auction = _auction(seller_user, buyer_user, buyer_user2)
+    place_bid(auction, buyer_user2, Decimal("100"))
+    bid = place_bid(auction, buyer_user, Decimal("150"))
+    Notification.objects.all().delete()
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        with CaptureQueriesContext(connection) as queries:
+            accept_bid(auction, bid, seller_user)
+    # Nothing is written while the auction row is locked.
+    assert not _notification_inserts(queries)
+    assert not Notification.objects.exists()
+
+    with CaptureQueriesContext(connection) as queries:
+        for callback in callbacks:
+            callback()
+    assert len(_notification_inserts(queries)) == 1
+    recipients = Notification.objects.filter(type=Notification.Type.AUCTION_BID_ACCEPTED)
+    assert sorted(recipients.values_list("recipient_id", flat=True)) == sorted(
+        [buyer_user.id, seller_user.id, *(user.id for user in staff)]
+    )
+
+
+@pytest.mark.django_db
+def test_rolled_back_bid_sends_nothing(
+    seller_user, buyer_user, buyer_user2, django_capture_on_commit_callbacks
+):
+    auction = _auction(seller_user, buyer_user, buyer_user2)
+    place_bid(auction, buyer_user2, Decimal("100"))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        try:
+            with transaction.atomic():
+                place_bid(auction, buyer_user, Decimal("150"))
+                raise RuntimeError
+        except RuntimeError:
+            pass
+    assert not Notification.objects.filter(type=Notification.Type.OUTBID).exists()
+
+
+@pytest.mark.django_db
+def test_staff_recipients_are_cached_until_users_change(
+    seller_user, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    staff = get_user_model().objects.create_user("staff1", password="pw", is_staff=True)
+    assert staff_recipient_ids() == (staff.id,)
+    with django_assert_num_queries(0):
+        staff_recipient_ids()
+
+    seller_user.is_staff = True
+    seller_user.save()
+    assert staff_recipient_ids() == tuple(sorted([staff.id, seller_user.id]))
+
+    # A staff participant gets one copy, not a second through the fan-out.
+    with django_capture_on_commit_callbacks(execute=True):
+        queue_notification(
+            recipient=seller_user,
+            type=Notification.Type.AUCTION_BID_ACCEPTED,
+            message="Accepted",
+        )
+    assert Notification.objects.filter(recipient=seller_user).count() == 1
+    assert Notification.objects.filter(recipient=staff).count() == 1
@@ -0,0 +1,48 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.marketplace.services import add_message, create_draft_offer, send_offer
+from apps.players.models import Player
+
+
+def _offers(seller_user, buyer_user, count):
+    seller, buyer = seller_user.club, buyer_user.club
+    for index in range(count):
+        player = Player.objects.create(
+            name=f"Inbox Player {index}",
+            created_by=seller_user,
+            current_club=seller,
+            status="CONTRACTED",
+        )
+        offer = create_draft_offer(player=player, from_club=buyer, to_club=seller, fee_amount=100)
+        send_offer(offer, buyer_user, buyer)
+        add_message(offer, buyer_user, buyer, "x" * 500)
+        add_message(offer, seller_user, seller, f"Latest word on {index}")
+
+
+@pytest.mark.django_db
+def test_inbox_query_count_does_not_grow_with_offers(
+    client, seller_user, buyer_user, django_capture_on_commit_callbacks
+):
+    client.force_login(seller_user)
+    url = reverse("marketplace:offer_received")
+    # Committing refreshes the counters and drops their cache entry, so both
+    # renders read the counters row.
+    with django_capture_on_commit_callbacks(execute=True):
+        _offers(seller_user, buyer_user, 2)
+    with CaptureQueriesContext(connection) as few:
+        response = client.get(url)
+    assert b"Latest word on 1" in response.content
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _offers(seller_user, buyer_user, 6)
+    with CaptureQueriesContext(connection) as many:
+        response = client.get(url)
+    assert response.content.count(b"Latest word on") == 8
+    assert len(many) == len(few)
+    latest = [query["sql"] for query in many if "DISTINCT ON" in query["sql"]]
+    # Only the preview is read, never the whole body.
+    assert len(latest) == 1 and latest[0].count('"marketplace_offermessage"."body"') == 1
+    assert 'LEFT("marketplace_offermessage"."body", 121)' in latest[0]
@@ -0,0 +1,101 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.marketplace.models import Listing, Offer, OfferEvent
+from apps.marketplace.services import (
+    close_offer_if_expired,
+    create_draft_offer,
+    expire_overdue_offers,
+    send_offer,
+)
+from apps.notifications.models import Notification
+from apps.players.models import Player
+
+
+@pytest.mark.django_db
+def test_sweeper_expires_overdue_offers_in_bounded_batches(
+    seller_user, buyer_user, django_capture_on_commit_callbacks
+):
+    seller, buyer = seller_user.club, buyer_user.club
+    player = Player.objects.create(
+        name="Sweep Player", created_by=seller_user, current_club=seller, status="CONTRACTED"
+    )
+    listing = Listing.objects.create(
+        player=player, listed_by_club=seller, listing_type=Listing.ListingType.TRANSFER
+    )
+    overdue = []
+    for index in range(5):
+        offer = create_draft_offer(
+            player=player,
+            listing=listing,
+            from_club=buyer,
+            to_club=seller,
+            expires_at=timezone.now() + timedelta(minutes=index + 1),
+        )
+        send_offer(offer, buyer_user, buyer)
+        overdue.append(offer)
+    Offer.objects.filter(pk__in=[offer.pk for offer in overdue[:3]]).update(
+        expires_at=timezone.now() - timedelta(hours=1)
+    )
+    Notification.objects.all().delete()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with CaptureQueriesContext(connection) as queries:
+            assert expire_overdue_offers(batch_size=2) == 2
+    offer_updates = [
+        query["sql"]
+        for query in queries
+        if query["sql"].lstrip().startswith('UPDATE "marketplace_offer"')
+    ]
+    assert len(offer_updates) == 1
+    assert OfferEvent.objects.filter(event_type="EXPIRED").count() == 2
+    assert Notification.objects.filter(type=Notification.Type.OFFER_EXPIRED).count() == 4
+
+    call_command("run_offer_sweeper", "--once")
+    assert Offer.objects.filter(status=Offer.Status.EXPIRED).count() == 3
+    assert Offer.objects.filter(status=Offer.Status.SENT).count() == 2
+    listing.refresh_from_db()
+    assert listing.active_offers_count == 2 and listing.offers_count == 5
+
+
+@pytest.mark.django_db
+def test_participant_expiry_has_the_sweepers_side_effects(
+    seller_user, buyer_user, django_capture_on_commit_callbacks
+):
+    seller, buyer = seller_user.club, buyer_user.club
+    player = Player.objects.create(
+        name="Acted Player", created_by=seller_user, current_club=seller, status="CONTRACTED"
+    )
+    listing = Listing.objects.create(
+        player=player, listed_by_club=seller, listing_type=Listing.ListingType.TRANSFER
+    )
+    offer = create_draft_offer(
+        player=player,
+        listing=listing,
+        from_club=buyer,
+        to_club=seller,
+        expires_at=timezone.now() + timedelta(minutes=1),
+    )
+    send_offer(offer, buyer_user, buyer)
+    Offer.objects.filter(pk=offer.pk).update(expires_at=timezone.now() - timedelta(minutes=1))
+    offer.refresh_from_db()
+    Notification.objects.all().delete()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assert close_offer_if_expired(offer)
+    offer.refresh_from_db()
+    assert offer.status == Offer.Status.EXPIRED and offer.last_event_type == "EXPIRED"
+    assert offer.events.filter(event_type="EXPIRED").count() == 1
+    assert set(
+        Notification.objects.filter(type=Notification.Type.OFFER_EXPIRED).values_list(
+            "recipient_id", flat=True
+        )
+    ) == {seller_user.pk, buyer_user.pk}
+    listing.refresh_from_db()
+    assert listing.active_offers_count == 0
+    assert expire_overdue_offers() == 0
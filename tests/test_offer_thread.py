@@ -0,0 +1,56 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.marketplace.models import OfferEvent
+from apps.marketplace.services import add_message, create_draft_offer, send_offer
+from apps.players.models import Player
+
+
+@pytest.fixture
+def long_offer(seller_user, buyer_user):
+    seller, buyer = seller_user.club, buyer_user.club
+    player = Player.objects.create(
+        name="Thread Player", created_by=seller_user, current_club=seller, status="CONTRACTED"
+    )
+    offer = create_draft_offer(player=player, from_club=buyer, to_club=seller, fee_amount=100)
+    send_offer(offer, buyer_user, buyer)
+    for index in range(25):
+        add_message(offer, buyer_user, buyer, f"Note number {index:02d}")
+    return offer
+
+
+@pytest.mark.django_db
+def test_thread_shows_latest_page_and_pages_back(client, seller_user, long_offer):
+    client.force_login(seller_user)
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse("marketplace:offer_detail", args=[long_offer.id]))
+    content = response.content.decode()
+    assert "Note number 24" in content and "Note number 05" in content
+    assert "Note number 04" not in content
+    # One query for the page of events, messages joined in.
+    thread_queries = [query["sql"] for query in queries if "marketplace_offerevent" in query["sql"]]
+    assert len(thread_queries) == 1 and "marketplace_offermessage" in thread_queries[0]
+
+    oldest_shown = OfferEvent.objects.get(message__body="Note number 05")
+    assert f"?before={oldest_shown.pk}" in content
+    events_url = reverse("marketplace:offer_events", args=[long_offer.id])
+    older = client.get(events_url, {"before": oldest_shown.pk}).content.decode()
+    assert "Note number 04" in older and "Note number 00" in older and "Sent" in older
+    assert "Load older events" not in older and "every 15s" not in older
+    assert client.get(events_url, {"before": "x"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_thread_poll_returns_only_newer_events(client, seller_user, long_offer):
+    client.force_login(seller_user)
+    newest = long_offer.events.latest("pk")
+    events_url = reverse("marketplace:offer_events", args=[long_offer.id])
+    quiet = client.get(events_url, {"after": newest.pk}).content.decode()
+    assert "Note number" not in quiet and f"?after={newest.pk}" in quiet
+
+    add_message(long_offer, seller_user, seller_user.club, "Fresh reply")
+    fresh = client.get(events_url, {"after": newest.pk}).content.decode()
+    assert "Fresh reply" in fresh and "Note number" not in fresh
+    assert f"?after={long_offer.events.latest('pk').pk}" in fresh
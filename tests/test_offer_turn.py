@@ -0,0 +1,52 @@
+import pytest
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from apps.marketplace.context_processors import offer_unread_counts
+from apps.marketplace.models import Offer
+from apps.marketplace.services import add_message, counter_offer, create_draft_offer, send_offer
+from apps.players.models import Player
+
+
+def _unread(user):
+    request = RequestFactory().get("/")
+    request.user = user
+    with CaptureQueriesContext(connection) as queries:
+        count = offer_unread_counts(request)["offer_unread_count"]
+    assert not any("marketplace_offerevent" in query["sql"] for query in queries)
+    return count
+
+
+@pytest.mark.django_db
+def test_offer_tracks_its_latest_event(seller_user, buyer_user, django_capture_on_commit_callbacks):
+    seller, buyer = seller_user.club, buyer_user.club
+    player = Player.objects.create(
+        name="Turn Player", created_by=seller_user, current_club=seller, status="CONTRACTED"
+    )
+    offer = create_draft_offer(player=player, from_club=buyer, to_club=seller, fee_amount=100)
+    assert offer.last_event_type == "CREATED" and offer.last_actor_club == buyer
+
+    with django_capture_on_commit_callbacks(execute=True):
+        send_offer(offer, buyer_user, buyer)
+    offer.refresh_from_db()
+    sent = offer.events.get(event_type="SENT")
+    assert (offer.last_actor_club_id, offer.last_event_type, offer.last_event_at) == (
+        buyer.id,
+        "SENT",
+        sent.created_at,
+    )
+    assert _unread(seller_user) == 1 and _unread(buyer_user) == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        counter_offer(offer, seller_user, seller, fee_amount=150)
+    offer.refresh_from_db()
+    assert offer.last_actor_club == seller and offer.last_event_type == "COUNTERED"
+    assert _unread(seller_user) == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        add_message(offer, buyer_user, buyer, "Can you meet us halfway?")
+    offer.refresh_from_db()
+    assert offer.last_actor_club == buyer and offer.last_event_type == "MESSAGE"
+    assert _unread(seller_user) == 1
+    assert Offer.objects.filter(to_club=seller).exclude(last_actor_club=seller).count() == 1
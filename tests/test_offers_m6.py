@@ -11,6 +11,7 @@ from apps.marketplace.services import (
     close_offer_if_expired,
     counter_offer,
     create_draft_offer,
+    expire_overdue_offers,
     send_offer,
     withdraw_offer,
 )
@@ -122,7 +123,7 @@ def test_withdraw_offer_buyer_only():
 
 
 @pytest.mark.django_db
-def test_expire_opportunistic(client):
+def test_overdue_offer_displays_expired_until_swept(client):
     user_seller = get_user_model().objects.create_user(username="sellerM6e", password="pass")
     user_buyer = get_user_model().objects.create_user(username="buyerM6e", password="pass")
     club_seller = Club.objects.create(user=user_seller, name="Seller Club E")
@@ -142,9 +143,15 @@ def test_expire_opportunistic(client):
     send_offer(offer, user_buyer, club_buyer)
 
     client.force_login(user_seller)
-    client.get(reverse("marketplace:offer_received"))
+    response = client.get(reverse("marketplace:offer_received"))
+    assert b"Status Expired" in response.content
+    offer.refresh_from_db()
+    assert offer.status == Offer.Status.SENT
+
+    assert expire_overdue_offers() == 1
     offer.refresh_from_db()
     assert offer.status == Offer.Status.EXPIRED
+    assert offer.last_event_type == "EXPIRED" and offer.last_actor_club is None
 
 
 @pytest.mark.django_db
@@ -0,0 +1,104 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.accounts.models import Club
+from apps.marketplace.pagination import CursorPaginator
+from apps.marketplace.query import player_search_queryset, player_sort_keys
+from apps.players.models import Player
+
+
+@pytest.fixture
+def paged_players(db):
+    user = get_user_model().objects.create_user(username="pager", password="pass")
+    club = Club.objects.create(user=user, name="Pager FC")
+    # Ties and NULLs on the sort key exercise the pk tiebreaker and NULLS LAST.
+    for index, age in enumerate([30, 30, 30, 25, None, None, 19]):
+        Player.objects.create(
+            name=f"Player {index % 3}",
+            age=age,
+            created_by=user,
+            current_club=club,
+            visibility=Player.Visibility.PUBLIC,
+        )
+    return user
+
+
+def _expected(params):
+    queryset = player_search_queryset(None, params)
+    return list(queryset.order_by(*queryset.query.order_by, "pk").values_list("pk", flat=True))
+
+
+def _paginator(params):
+    return CursorPaginator(player_search_queryset(None, params), 2, player_sort_keys(params))
+
+
+@pytest.mark.django_db
+def test_cursor_pages_walk_forward_and_back(paged_players):
+    params = {"sort": "age_desc"}
+    expected = _expected(params)
+
+    pages = [_paginator(params).get_page(None)]
+    while pages[-1].has_next():
+        pages.append(_paginator(params).get_page(pages[-1].next_page_number()))
+    assert [player.pk for page in pages for player in page] == expected
+    assert [page.number for page in pages] == [1, 2, 3, 4]
+    assert not pages[-1].has_next()
+
+    page = pages[-1]
+    for previous in reversed(pages[:-1]):
+        page = _paginator(params).get_page(page.previous_page_number())
+        assert [player.pk for player in page] == [player.pk for player in previous]
+        assert page.number == previous.number
+    assert not page.has_previous()
+
+
+@pytest.mark.django_db
+def test_numeric_and_invalid_page_tokens(paged_players):
+    params = {"sort": "name"}
+    expected = _expected(params)
+
+    page = _paginator(params).get_page("2")
+    assert [player.pk for player in page] == expected[2:4]
+    assert page.has_previous() and page.has_next()
+
+    tampered = _paginator(params).get_page(page.next_page_number() + "x")
+    assert tampered.number == 1
+    assert [player.pk for player in tampered] == expected[:2]
+    assert _paginator(params).num_pages == 4
+
+    # Stale numeric links past the end serve the last page, like
+    # Paginator.get_page(), with one OFFSET query.
+    with CaptureQueriesContext(connection) as queries:
+        last = _paginator(params).get_page("99")
+    assert last.number == 4 and [player.pk for player in last] == expected[6:]
+    assert sum("OFFSET" in query["sql"] for query in queries) == 1
+    assert _paginator(params).get_page("9" * 40).number == 4
+
+    # An estimate that overcounts still lands on the real last page.
+    overcounted = CursorPaginator(
+        player_search_queryset(None, params), 2, player_sort_keys(params), count=50
+    )
+    assert overcounted.get_page("12").number == 4
+
+
+@pytest.mark.django_db
+def test_player_market_next_link_uses_cursor(client, paged_players):
+    for index in range(20):
+        Player.objects.create(
+            name=f"Extra {index}", created_by=paged_players, visibility=Player.Visibility.PUBLIC
+        )
+    client.force_login(paged_players)
+    response = client.get(reverse("player_market_list"), {"sort": "age_desc"})
+    page = response.context["page_obj"]
+    assert page.has_next()
+    assert page.next_page_number() in response.content.decode()
+
+    response = client.get(
+        reverse("player_market_list"),
+        {"sort": "age_desc", "page": page.next_page_number()},
+    )
+    assert response.status_code == 200
+    assert response.context["page_obj"].number == 2
@@ -0,0 +1,135 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.accounts.models import ClubFinance
+from apps.auctions.models import Auction, AuctionEvent, Bid
+from apps.auctions.services import place_bid, place_proxy_bid
+from apps.notifications.models import Notification
+from apps.players.models import Player
+
+
+def _auction(seller_user, **kwargs):
+    player = Player.objects.create(
+        name="Proxy Player", age=23, current_club=seller_user.club, created_by=seller_user
+    )
+    return Auction.objects.create(
+        player=player,
+        seller=seller_user,
+        deadline=timezone.now() + timedelta(days=1),
+        min_increment=Decimal("10.00"),
+        **kwargs,
+    )
+
+
+def _fund(*users, transfer="100000.00"):
+    ClubFinance.objects.filter(club__user__in=users).update(
+        transfer_budget_total=Decimal(transfer), wage_budget_total_weekly=Decimal("1000.00")
+    )
+
+
+def _reserved(user):
+    return ClubFinance.objects.get(club=user.club).transfer_reserved
+
+
+@pytest.mark.django_db
+def test_competing_proxies_resolve_in_one_call(
+    seller_user, buyer_user, buyer_user2, django_capture_on_commit_callbacks
+):
+    _fund(buyer_user, buyer_user2)
+    auction = _auction(seller_user)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        first = place_proxy_bid(auction, buyer_user, Decimal("500"))
+    assert first.amount == Decimal("10")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        second = place_proxy_bid(auction, buyer_user2, Decimal("300"))
+    first.refresh_from_db()
+    auction.refresh_from_db()
+    # The first proxy leads at one increment over the second's maximum; the
+    # loser is left where it entered.
+    assert first.amount == Decimal("310") and first.max_amount == Decimal("500")
+    assert second.amount == Decimal("20")
+    assert auction.best_bid_id == first.pk and auction.best_bid_amount == Decimal("310")
+    assert _reserved(buyer_user) == Decimal("310")
+    assert _reserved(buyer_user2) == Decimal("20")
+
+    # One event per call, and the maximum itself is never written out.
+    events = list(AuctionEvent.objects.filter(auction=auction).order_by("pk"))
+    assert [event.payload for event in events] == [{"proxy": True}, {"proxy": True}]
+    assert [event.amount for event in events] == [Decimal("10"), Decimal("20")]
+    assert (
+        Notification.objects.filter(recipient=buyer_user2, type=Notification.Type.OUTBID).count()
+        == 1
+    )
+    assert not Notification.objects.filter(recipient=buyer_user, type=Notification.Type.OUTBID)
+
+
+@pytest.mark.django_db
+def test_manual_bid_is_answered_by_leading_proxy(
+    seller_user, buyer_user, buyer_user2, django_capture_on_commit_callbacks
+):
+    _fund(buyer_user, buyer_user2)
+    auction = _auction(seller_user)
+    proxy = place_proxy_bid(auction, buyer_user, Decimal("500"))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        manual = place_bid(auction, buyer_user2, Decimal("200"))
+    proxy.refresh_from_db()
+    auction.refresh_from_db()
+    assert proxy.amount == Decimal("210") and auction.best_bid_id == proxy.pk
+    assert _reserved(buyer_user) == Decimal("210")
+    assert AuctionEvent.objects.filter(auction=auction, payload__proxy=True).count() == 2
+    assert Notification.objects.filter(
+        recipient=buyer_user2, type=Notification.Type.OUTBID
+    ).exists()
+    assert not Notification.objects.filter(recipient=buyer_user, type=Notification.Type.OUTBID)
+
+    # Matching the maximum exactly: the earlier proxy keeps the lead.
+    place_bid(auction, buyer_user2, Decimal("500"))
+    proxy.refresh_from_db()
+    auction.refresh_from_db()
+    assert proxy.amount == Decimal("500") and auction.best_bid_id == proxy.pk
+
+    place_bid(auction, buyer_user2, Decimal("510"))
+    auction.refresh_from_db()
+    assert auction.best_bid_id == manual.pk and auction.best_bid_amount == Decimal("510")
+
+
+@pytest.mark.django_db
+def test_proxy_is_capped_by_remaining_budget(seller_user, buyer_user, buyer_user2):
+    _fund(buyer_user, transfer="250.00")
+    _fund(buyer_user2)
+    auction = _auction(seller_user)
+
+    capped = place_proxy_bid(auction, buyer_user, Decimal("500"))
+    rival = place_proxy_bid(auction, buyer_user2, Decimal("400"))
+    capped.refresh_from_db()
+    rival.refresh_from_db()
+    assert capped.amount == Decimal("10")
+    assert rival.amount == Decimal("260")
+    assert _reserved(buyer_user) == Decimal("10")
+    assert _reserved(buyer_user2) == Decimal("260")
+
+
+@pytest.mark.django_db
+def test_proxy_bid_via_form(client, seller_user, buyer_user):
+    _fund(buyer_user)
+    auction = _auction(seller_user, reserve_price=Decimal("150.00"))
+
+    client.force_login(buyer_user)
+    response = client.post(
+        reverse("auctions:place_bid", args=[auction.id]),
+        {"amount": "400.00", "wage_offer_weekly": "5.00", "proxy": "on"},
+    )
+    assert response.status_code == 302
+    bid = Bid.objects.get(auction=auction)
+    # Alone on the auction, a proxy opens at the reserve.
+    assert bid.amount == Decimal("150.00") and bid.max_amount == Decimal("400.00")
+
+    response = client.get(reverse("auctions:detail", args=[auction.id]))
+    assert b"Your maximum is GBP 400.00" in response.content
@@ -0,0 +1,63 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.accounts.models import Club
+from apps.marketplace.models import Listing, ListingInvite
+from apps.marketplace.result_cache import result_cache_stats, visibility_scope
+from apps.players.models import Player
+
+
+@pytest.fixture
+def market_user(db):
+    user = get_user_model().objects.create_user(username="cached", password="pass")
+    Club.objects.create(user=user, name="Cache FC")
+    return user
+
+
+def _player(user, name):
+    return Player.objects.create(
+        name=name, created_by=user, current_club=user.club, visibility=Player.Visibility.PUBLIC
+    )
+
+
+def _names(response):
+    return [player.name for player in response.context["page_obj"].object_list]
+
+
+@pytest.mark.django_db
+def test_repeat_search_hits_cache_and_writes_invalidate(client, market_user):
+    _player(market_user, "Alpha")
+    client.force_login(market_user)
+    url = reverse("player_market_list")
+
+    with CaptureQueriesContext(connection) as miss:
+        assert _names(client.get(url, {"sort": "name"})) == ["Alpha"]
+    with CaptureQueriesContext(connection) as hit:
+        assert _names(client.get(url, {"sort": "name"})) == ["Alpha"]
+    assert len(hit) < len(miss)
+    assert result_cache_stats()["players"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    _player(market_user, "Beta")
+    assert _names(client.get(url, {"sort": "name"})) == ["Alpha", "Beta"]
+    assert result_cache_stats()["players"]["misses"] == 2
+
+
+@pytest.mark.django_db
+def test_visibility_scope_splits_clubs_with_private_listings(market_user):
+    other_user = get_user_model().objects.create_user(username="invited", password="pass")
+    invited = Club.objects.create(user=other_user, name="Invited FC")
+    assert visibility_scope(None) == "anonymous"
+    assert visibility_scope(invited) == visibility_scope(market_user.club) == "club"
+
+    listing = Listing.objects.create(
+        player=_player(market_user, "Private"),
+        listed_by_club=market_user.club,
+        listing_type=Listing.ListingType.TRANSFER,
+        visibility=Listing.Visibility.INVITE_ONLY,
+    )
+    ListingInvite.objects.create(listing=listing, club=invited)
+    assert visibility_scope(invited) == f"club:{invited.pk}"
+    assert visibility_scope(market_user.club) == f"club:{market_user.club.pk}"
@@ -0,0 +1,146 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.marketplace.models import Listing, ListingInvite
+from apps.marketplace.query import player_search_queryset
+from apps.notifications.models import Notification
+from apps.players.models import Player
+from apps.scouting.matching import match_players, search_query_dict
+from apps.scouting.models import SavedSearch, SavedSearchMatch
+from apps.scouting.services import create_saved_search
+from apps.stats.models import PlayerForm
+
+
+def _player(owner, name, **kwargs):
+    defaults = {"age": 23, "position": Player.Position.FWD, "created_by": owner}
+    return Player.objects.create(name=name, **{**defaults, **kwargs})
+
+
+@pytest.mark.django_db
+def test_new_listing_alerts_only_new_matches(seller_user, buyer_user, django_capture_on_commit_callbacks):
+    seller = seller_user.club
+    already = _player(seller_user, "Already Listed", current_club=seller)
+    Listing.objects.create(
+        player=already, listed_by_club=seller, listing_type=Listing.ListingType.LOAN
+    )
+    search = create_saved_search(
+        buyer_user.club, "Young loan strikers", {"position": "FWD", "max_age": "25", "availability": "loan"}
+    )
+    assert list(search.matches.values_list("player_id", flat=True)) == [already.pk]
+
+    fresh = _player(seller_user, "Fresh Loanee", current_club=seller)
+    with django_capture_on_commit_callbacks(execute=True):
+        Listing.objects.create(
+            player=fresh, listed_by_club=seller, listing_type=Listing.ListingType.LOAN
+        )
+    notes = Notification.objects.filter(recipient=buyer_user)
+    assert [note.related_player_id for note in notes] == [fresh.pk]
+    assert notes[0].type == Notification.Type.PLAYER_AVAILABLE
+
+    # Re-saving a matching player does not alert twice.
+    with django_capture_on_commit_callbacks(execute=True):
+        PlayerForm.objects.create(player=fresh, as_of=timezone.now(), form_score=80)
+    assert Notification.objects.filter(recipient=buyer_user).count() == 1
+
+    # Dropping out of the search clears the match so a later return alerts.
+    with django_capture_on_commit_callbacks(execute=True):
+        Listing.objects.filter(player=fresh).update(status=Listing.Status.CLOSED)
+        fresh.save()
+    assert not SavedSearchMatch.objects.filter(search=search, player=fresh).exists()
+
+
+@pytest.mark.django_db
+def test_matcher_agrees_with_market_query(seller_user, buyer_user, buyer_user2):
+    seller = seller_user.club
+    players = [
+        _player(seller_user, "Ana Silva", position=Player.Position.MID, nationality="Brazil", current_club=seller),
+        _player(seller_user, "Bo Müller", age=31, nationality="Germany", current_club=seller),
+        _player(seller_user, "Cy Free", age=19, status=Player.Status.FREE_AGENT, current_club=None),
+        _player(seller_user, "Di Open", open_to_offers=True, current_club=seller),
+        _player(seller_user, "Ed Hidden", visibility=Player.Visibility.PRIVATE, current_club=seller),
+        _player(seller_user, "Fa Invite", position=Player.Position.DEF, current_club=seller),
+    ]
+    PlayerForm.objects.create(player=players[0], as_of=timezone.now(), form_score=72)
+    PlayerForm.objects.create(player=players[1], as_of=timezone.now(), form_score=40)
+    Listing.objects.create(player=players[0], listed_by_club=seller, listing_type=Listing.ListingType.TRANSFER)
+    Listing.objects.create(player=players[1], listed_by_club=seller, listing_type=Listing.ListingType.LOAN)
+    private = Listing.objects.create(
+        player=players[5],
+        listed_by_club=seller,
+        listing_type=Listing.ListingType.TRANSFER,
+        visibility=Listing.Visibility.INVITE_ONLY,
+    )
+    ListingInvite.objects.create(listing=private, club=buyer_user.club)
+
+    criteria = [
+        {"q": "muller"},
+        {"q": "seller"},
+        {"nationality": "bra"},
+        {"position": "MID", "min_form": 70},
+        {"min_age": 18, "max_age": 25},
+        {"free_agent_only": True},
+        {"listed_only": True},
+        {"availability": ["transfer"]},
+        {"availability": ["free_agent", "open_to_offers"]},
+        {"availability": ["loan"], "max_form": 50},
+    ]
+    searches = [
+        SavedSearch.objects.create(club=club, name=str(index), params=params)
+        for club in (buyer_user.club, buyer_user2.club)
+        for index, params in enumerate(criteria)
+    ]
+    match_players([player.pk for player in players])
+
+    for search in searches:
+        expected = set(
+            player_search_queryset(search.club, search_query_dict(search.params)).values_list(
+                "pk", flat=True
+            )
+        )
+        assert set(search.matches.values_list("player_id", flat=True)) == expected, search.params
+
+
+@pytest.mark.django_db
+def test_matcher_applies_form_and_age_bounds_separately(seller_user, buyer_user):
+    seller = seller_user.club
+    in_form = _player(seller_user, "In Form", current_club=seller)
+    off_form = _player(seller_user, "Off Form", current_club=seller)
+    PlayerForm.objects.create(player=in_form, as_of=timezone.now(), form_score=90)
+    PlayerForm.objects.create(player=off_form, as_of=timezone.now(), form_score=22)
+    search = SavedSearch.objects.create(
+        club=buyer_user.club, name="combined", params={"min_form": 60, "min_age": 21, "max_age": 25}
+    )
+    match_players([in_form.pk, off_form.pk])
+    assert list(search.matches.values_list("player_id", flat=True)) == [in_form.pk]
+
+
+@pytest.mark.django_db
+def test_match_batch_query_count_is_flat(seller_user, buyer_user):
+    seller = seller_user.club
+    for index in range(5):
+        SavedSearch.objects.create(
+            club=buyer_user.club, name=f"s{index}", params={"position": "FWD", "min_age": 18 + index}
+        )
+    players = [_player(seller_user, f"Batch {index}", current_club=seller) for index in range(30)]
+    with CaptureQueriesContext(connection) as queries:
+        match_players([player.pk for player in players])
+    assert SavedSearchMatch.objects.count() == 150
+    assert len(queries) <= 8
+
+
+@pytest.mark.django_db
+def test_save_search_from_market(client, buyer_user):
+    client.force_login(buyer_user)
+    response = client.post(
+        "/scouting/searches/new/",
+        {"name": "Left backs", "query": "position=DEF&availability=loan&availability=transfer&sort=age_asc"},
+    )
+    assert response.status_code == 302
+    search = SavedSearch.objects.get(club=buyer_user.club)
+    assert search.params == {"position": "DEF", "availability": ["loan", "transfer"]}
+    assert client.get("/scouting/searches/").status_code == 200
+
+    client.post("/scouting/searches/new/", {"name": "Everything", "query": "sort=name"})
+    assert SavedSearch.objects.filter(club=buyer_user.club).count() == 1
@@ -0,0 +1,64 @@
+import pytest
+from django.contrib.auth import get_user_model
+
+from apps.accounts.models import Club
+from apps.marketplace.query import club_search_queryset, player_search_queryset
+from apps.marketplace.search import normalize_search_text
+from apps.players.models import Player
+
+
+@pytest.fixture
+def search_club(db):
+    user = get_user_model().objects.create_user(username="searcher", password="pass")
+    return Club.objects.create(user=user, name="Atlético Séville")
+
+
+def _player(club, name):
+    return Player.objects.create(
+        name=name, created_by=club.user, current_club=club, visibility=Player.Visibility.PUBLIC
+    )
+
+
+def test_normalize_search_text():
+    assert normalize_search_text("  Thomas  MÜLLER ") == "thomas muller"
+    assert normalize_search_text(None) == ""
+
+
+@pytest.mark.django_db
+def test_player_search_is_accent_insensitive(search_club):
+    _player(search_club, "Thomas Müller")
+    _player(search_club, "Someone Else")
+
+    names = [p.name for p in player_search_queryset(None, {"q": "muller"})]
+    assert names == ["Thomas Müller"]
+    names = [p.name for p in player_search_queryset(None, {"q": "MÜLL"})]
+    assert names == ["Thomas Müller"]
+
+
+@pytest.mark.django_db
+def test_player_search_matches_club_name(search_club):
+    _player(search_club, "Squad Member")
+
+    names = [p.name for p in player_search_queryset(None, {"q": "atletico"})]
+    assert names == ["Squad Member"]
+
+
+@pytest.mark.django_db
+def test_player_search_ranks_prefix_matches_first(search_club):
+    _player(search_club, "Ruben Dias")
+    _player(search_club, "Dias Junior")
+    _player(search_club, "Mendiasso")
+
+    names = [p.name for p in player_search_queryset(None, {"q": "dias"})]
+    assert names == ["Dias Junior", "Ruben Dias", "Mendiasso"]
+
+
+@pytest.mark.django_db
+def test_search_name_follows_partial_saves(search_club):
+    player = _player(search_club, "Old Name")
+    player.name = "Øystein Renamed"
+    player.save(update_fields=["name"])
+
+    player.refresh_from_db()
+    assert player.search_name == "øystein renamed"
+    assert [c.name for c in club_search_queryset({"q": "seville"})] == ["Atlético Séville"]
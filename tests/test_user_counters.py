@@ -0,0 +1,141 @@
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from apps.accounts.counters import get_counters, reconcile_counters
+from apps.accounts.models import UserCounters
+from apps.deals.models import Deal
+from apps.deals.views import deal_count_context
+from apps.marketplace.context_processors import offer_unread_counts
+from apps.marketplace.services import accept_offer, counter_offer, create_draft_offer, send_offer
+from apps.notifications.models import Notification
+from apps.notifications.utils import create_notification
+from apps.notifications.views import notifications_unread_context
+from apps.players.models import Player
+
+
+def _player(seller_user):
+    return Player.objects.create(
+        name="Counter Player",
+        created_by=seller_user,
+        current_club=seller_user.club,
+        status="CONTRACTED",
+    )
+
+
+def _badges(user):
+    request = RequestFactory().get("/")
+    request.user = user
+    return (
+        notifications_unread_context(request)["notifications_unread_count"],
+        offer_unread_counts(request)["offer_unread_count"],
+        deal_count_context(request)["deal_count"],
+    )
+
+
+@pytest.mark.django_db
+def test_counters_follow_notifications_offers_and_deals(
+    client, seller_user, buyer_user, django_capture_on_commit_callbacks
+):
+    seller, buyer = seller_user.club, buyer_user.club
+    assert _badges(seller_user) == (0, 0, 0)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        create_notification(
+            recipient=seller_user, type=Notification.Type.OFFER_RECEIVED, message="one"
+        )
+        create_notification(
+            recipient=seller_user, type=Notification.Type.OFFER_RECEIVED, message="two"
+        )
+    assert _badges(seller_user)[0] == 2
+    client.force_login(seller_user)
+    with django_capture_on_commit_callbacks(execute=True):
+        client.get(
+            f"/notifications/{Notification.objects.filter(recipient=seller_user).first().pk}/go/"
+        )
+    assert _badges(seller_user)[0] == 1
+    with django_capture_on_commit_callbacks(execute=True):
+        client.post("/notifications/mark-all-read/")
+    assert _badges(seller_user)[0] == 0
+
+    player = _player(seller_user)
+    with django_capture_on_commit_callbacks(execute=True):
+        offer = create_draft_offer(player=player, from_club=buyer, to_club=seller, fee_amount=100)
+        send_offer(offer, buyer_user, buyer)
+    assert _badges(seller_user)[1] == 1
+    with django_capture_on_commit_callbacks(execute=True):
+        counter_offer(offer, seller_user, seller, fee_amount=150)
+    assert _badges(seller_user)[1] == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        deal = Deal.objects.create(offer=offer, buyer_club=buyer, seller_club=seller, player=player)
+    assert _badges(seller_user)[2] == 1 and _badges(buyer_user)[2] == 1
+    with django_capture_on_commit_callbacks(execute=True):
+        deal.status = Deal.Status.COMPLETED
+        deal.save()
+    assert _badges(buyer_user)[2] == 0
+
+
+@pytest.mark.django_db
+def test_services_leave_counter_rows_until_commit(
+    seller_user, buyer_user, django_capture_on_commit_callbacks
+):
+    seller, buyer = seller_user.club, buyer_user.club
+    offer = create_draft_offer(
+        player=_player(seller_user), from_club=buyer, to_club=seller, fee_amount=100
+    )
+    send_offer(offer, buyer_user, buyer)
+    # accept_offer writes an event, a deal and notifications for both clubs;
+    # none of it may lock a counter row inside the service's transaction.
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        with CaptureQueriesContext(connection) as queries:
+            accept_offer(offer, seller_user, seller)
+    assert not any("accounts_usercounters" in query["sql"] for query in queries)
+    for callback in callbacks:
+        callback()
+    assert _badges(seller_user)[2] == 1 and _badges(buyer_user)[2] == 1
+
+
+@pytest.mark.django_db
+def test_badges_cost_one_read_per_render(seller_user):
+    get_counters(seller_user.pk)
+    cache.clear()
+    with CaptureQueriesContext(connection) as queries:
+        _badges(seller_user)
+    assert len(queries) == 1
+    with CaptureQueriesContext(connection) as queries:
+        _badges(seller_user)
+    assert len(queries) == 0
+
+
+@pytest.mark.django_db
+def test_reconcile_fixes_drift(seller_user, buyer_user):
+    create_notification(
+        recipient=seller_user, type=Notification.Type.OFFER_RECEIVED, message="drift"
+    )
+    get_counters(buyer_user.pk)
+    UserCounters.objects.filter(user=seller_user).update(notifications_unread=7, deals_active=3)
+    call_command("reconcile_user_counters", "--batch-size", "1")
+    assert UserCounters.objects.values_list("notifications_unread", "deals_active").get(
+        user=seller_user
+    ) == (1, 0)
+    assert get_counters(seller_user.pk)["notifications_unread"] == 1
+
+
+@pytest.mark.django_db
+def test_refresh_after_a_racing_reconcile_does_not_double_count(
+    seller_user, django_capture_on_commit_callbacks
+):
+    # The notification commits, a reconcile counts it, and only then does the
+    # writer's commit callback run: it must not add the row a second time.
+    with django_capture_on_commit_callbacks() as callbacks:
+        create_notification(
+            recipient=seller_user, type=Notification.Type.OFFER_RECEIVED, message="race"
+        )
+    reconcile_counters()
+    for callback in callbacks:
+        callback()
+    assert get_counters(seller_user.pk)["notifications_unread"] == 1